@@ -1,82 +1,561 @@
-from flask import Flask, render_template, request, send_file, abort
-from io import BytesIO
-from generator import svg_bytes_from_params, external_dims
-import cairosvg
-import webbrowser
+import startup
+
+with startup.timed("flask"):
+    from flask import Flask, render_template, request, abort, Response, stream_with_context, g
+from pdf_cache import PdfCache, cache_key
+from job_store import JobStore
+from render_store import RenderStore
+import jobs
+import metrics
+import validation
+import json
+import logging
 import threading
 import time
 import os
+import sys
+import tempfile
+
+# renderery (numpy, svgwrite, reportlab, multiprocessing) ładujemy dopiero
+# przy pierwszym użyciu albo w rozgrzewce w tle (create_app), nie przy imporcie
+batch = startup.lazy("batch")
+cards = startup.lazy("cards")
+catalog = startup.lazy("catalog")
+generator = startup.lazy("generator")
+plotter = startup.lazy("plotter")
+scheduler = startup.lazy("scheduler")
+RENDER_MODULES = ("generator", "plotter", "cards", "batch", "catalog", "scheduler")
 
 app = Flask(__name__, static_folder="templates")
 
+# format wyjścia pudełka -> (renderer, mimetype, rozszerzenie)
+BOX_FORMATS = {
+    "pdf": (startup.deferred(generator, "pdf_bytes_from_params"), "application/pdf", "pdf"),
+    "svg": (startup.deferred(generator, "svg_bytes_from_params"), "image/svg+xml", "svg"),
+    # stół tnący: warstwy/pióra CUT i FOLD, kolejność z minimalnym przejazdem w górze
+    "dxf": (startup.deferred(plotter, "dxf_bytes_from_params"), "application/dxf", "dxf"),
+    "hpgl": (startup.deferred(plotter, "hpgl_bytes_from_params"), "application/vnd.hp-hpgl", "plt"),
+}
+
+# cache gotowych plików (pudełka i karty); RENDER_STORE = baza SQLite
+# współdzielona przez workery i deploye, PDF_CACHE_DIR = katalog plików
+pdf_cache = PdfCache(
+    max_bytes=int(os.environ.get("PDF_CACHE_BYTES", 64 * 1024 * 1024)),
+    disk_dir=os.environ.get("PDF_CACHE_DIR") or None,
+    disk_max_bytes=int(os.environ.get("PDF_CACHE_DIR_BYTES", 1024 * 1024 * 1024)),
+    store=RenderStore(
+        os.environ["RENDER_STORE"],
+        max_bytes=int(os.environ.get("RENDER_STORE_BYTES", 512 * 1024 * 1024)),
+    ) if os.environ.get("RENDER_STORE") else None,
+)
+
+# paczka z katalogiem standardowych rozmiarów (catalog.py), czytana przez mmap;
+# tworzona przy pierwszym użyciu i tylko przy CATALOG_PACK (import catalog
+# ciągnie generator, batch i cards)
+CATALOG_PACK = os.environ.get("CATALOG_PACK") or None
+catalog_store = None
+_catalog_lock = threading.Lock()
+
+def _catalog_store():
+    global catalog_store
+    if catalog_store is None:
+        with _catalog_lock:
+            if catalog_store is None:
+                catalog_store = catalog.CatalogStore(CATALOG_PACK)
+    return catalog_store
+
+def _catalog_view(key):
+    """Plik z paczki katalogu albo None – bez paczki catalog nie jest importowany."""
+    return _catalog_store().view(key) if CATALOG_PACK else None
+
+def _catalog_stats():
+    """Statystyki paczki do /metrics – bez importu catalog, jeśli nikt jej jeszcze nie użył."""
+    if catalog_store is None:
+        return {"hits": 0, "misses": 0, "entries": 0}
+    return catalog_store.stats()
+
+def _box_request(values):
+    """
+    Parametry pudełka z formularza/JSON -> ((L, B, H, R, ep1), format);
+    H = H2, ep1 = th1. Zakresy i strona: validation.box_params.
+    """
+    fmt = str(values.get("format", "pdf")).lower()
+    if fmt not in BOX_FORMATS:
+        raise validation.ValidationError([
+            {"field": "format", "code": "invalid", "message": f"Niepoprawny format: {fmt}"}])
+    return validation.box_params(values), fmt
+
+def render_box(params, progress=None):
+    """Pudełko (z cache) -> jobs.JobResult; wspólne dla / i zadań asynchronicznych."""
+    (L, B, H, R, ep1), fmt = params
+    renderer, mimetype, ext = BOX_FORMATS[fmt]
+
+    def render():
+        ext_dims = generator.external_dims(L, B, H, ep1)
+        logo = app.static_folder + "/MB-print-logo11.png"
+        return renderer(
+            L,
+            B,
+            H,
+            R,
+            ep1,
+            logo_path=logo,
+            ext_dims=ext_dims,
+        )
+
+    key = cache_key(f"box.{fmt}", (L, B, H, R, ep1), generator.GENERATOR_VERSION)
+    out_bytes = _catalog_view(key) or pdf_cache.get_or_render(key, render)
+    metrics.BOX_REQUESTS.inc(format=fmt, ep1=metrics.ep1_label(ep1))
+    metrics.OUTPUT_BYTES.observe(len(out_bytes), kind=f"box.{fmt}")
+    return jobs.JobResult(out_bytes, mimetype, generator.box_file_name(L, B, H, ep1, ext))
+
+def _card_request(values):
+    """Parametry karty -> (width, height, language, sheet)."""
+    sheet = str(values.get("sheet") or "").strip().upper()
+    if sheet and sheet not in cards.SHEETS:
+        raise validation.ValidationError([
+            {"field": "sheet", "code": "invalid", "message": f"Nieznany arkusz: {sheet}"}])
+    width, height = validation.card_params(values)
+    if sheet:
+        try:
+            cards.sheet_layout(width, height, sheet)
+        except ValueError as e:
+            raise validation.ValidationError([
+                {"field": "sheet", "code": "too_small", "message": str(e)}]) from None
+    language = str(values.get("language", "pl"))
+    return width, height, language, sheet
+
+def _card_lang(language):
+    """Język, którego faktycznie użyje cards (nieznany -> EN)."""
+    lang = language.upper()
+    return lang if lang in cards.TRANSLATIONS else "EN"
+
+def _card_key(width, height, lang, sheet=""):
+    """= catalog.card_key, bez importu catalog (ETag, cache i klucz paczki)."""
+    return cache_key("card", (width, height, lang, sheet), cards.TEMPLATE_VERSION)
+
+def render_card(params, progress=None):
+    """Karta albo arkusz N-up kart -> jobs.JobResult."""
+    width, height, language, sheet = params
+    lang = _card_lang(language)
+    key = _card_key(width, height, lang, sheet)
+    if sheet:
+        # arkusz N-up do druku (np. SRA3) zamiast pojedynczej karty
+        pdf_bytes = pdf_cache.get_or_render(key, lambda: cards.create_sheet(width, height, lang, sheet))
+        file_name = f"Sheet_{sheet}_{width:g}x{height:g}mm_{language}.pdf"
+    else:
+        pdf_bytes = (_catalog_view(key)
+                     or pdf_cache.get_or_render(key, lambda: cards.create_template(width, height, lang)))
+        file_name = f"Card_{width:g}x{height:g}mm_{language}.pdf"
+    metrics.CARD_REQUESTS.inc(lang=_card_lang(language), sheet=sheet or "none")
+    metrics.OUTPUT_BYTES.observe(len(pdf_bytes), kind="card.sheet" if sheet else "card")
+    return jobs.JobResult(pdf_bytes, "application/pdf", file_name)
+
+# kawałek odpowiedzi dla treści czytanych z mmap paczki katalogu
+STREAM_CHUNK = 256 * 1024
+
+def _iter_chunks(data, size=STREAM_CHUNK):
+    """bytes idą do serwera WSGI w całości (bez kopii), memoryview – kawałkami po size."""
+    if isinstance(data, bytes):
+        yield data
+        return
+    for start in range(0, len(data), size):
+        yield bytes(data[start:start + size])
+
+def _cache_headers(response, etag, max_age):
+    if etag:
+        response.set_etag(etag)
+    if max_age:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
+    return response
+
+def _send_result(result, etag=None, max_age=None):
+    """
+    Plik jako odpowiedź strumieniowa: bez BytesIO i bez łączenia w jeden bufor,
+    więc proces trzyma najwyżej wynik renderu (albo STREAM_CHUNK z paczki).
+    """
+    response = Response(_iter_chunks(result.data), mimetype=result.mimetype,
+                        direct_passthrough=True)
+    response.content_length = len(result.data)
+    response.headers.set("Content-Disposition", "attachment", filename=result.filename)
+    return _cache_headers(response, etag, max_age)
+
+def _json(data, status=200, headers=None):
+    return Response(json.dumps(data, ensure_ascii=False), status=status,
+                    mimetype="application/json", headers=headers)
+
+def _invalid(error):
+    """ValidationError -> 400 z listą błędów pól (bez renderowania)."""
+    return _json(error.to_dict(), status=400)
+
+def _box_cost(params):
+    return validation.estimate_cost(f"box.{params[1]}")
+
+def _card_cost(params):
+    return validation.estimate_cost("card.sheet" if params[3] else "card")
+
+def _sync_or_job(kind, params, cost, respond):
+    """
+    Szacowany czas renderu ponad SYNC_RENDER_MS -> zadanie asynchroniczne
+    (202 + /jobs/<id>), żeby nie trzymać wątku żądania; inaczej respond().
+    """
+    if cost > validation.SYNC_RENDER_MS:
+        return _submit_job(kind, params, estimated_ms=cost)
+    return respond()
+
 @app.route("/", methods=["GET", "POST"])
 def index():
     if request.method == "POST":
         try:
-            # pobieramy parametry z formularza
-            L   = float(request.form["L"])
-            B   = float(request.form["B"])
-            H   = float(request.form["H"])      # H = H2
-            R   = float(request.form["R"])
-            ep1 = float(request.form["ep1"])    # = th1
-
-            ext_dims = external_dims(L, B, H, ep1)
-            logo = app.static_folder + "/MB-print-logo11.png"
-            svg_bytes = svg_bytes_from_params(
-                L,
-                B,
-                H,
-                R,
-                ep1,
-                logo_path=logo,
-                ext_dims=ext_dims,
-            )
-            pdf_bytes = cairosvg.svg2pdf(bytestring=svg_bytes)
-
-            file_name = f"Box_{L:g}x{B:g}x{H:g}_{ep1:g}mm.pdf"
-
-            return send_file(BytesIO(pdf_bytes),
-                              download_name=file_name,
-                              mimetype="application/pdf",
-                              as_attachment=True)
-        except (KeyError, ValueError):
-            abort(400, "Niepoprawne dane wejściowe")
-
+            params = _box_request(request.form)
+        except validation.ValidationError as e:
+            return _invalid(e)
+        return _sync_or_job("box", params, _box_cost(params),
+                            lambda: _send_result(render_box(params)))
 
     return render_template("index.html")
 
+def _cached_box_pdfs(params_list):
+    """(PDF, błąd) w kolejności wejścia: trafienia z cache, reszta w puli (RENDER_WORKERS) lub szeregowo."""
+    keys = [cache_key("box.pdf", params, generator.GENERATOR_VERSION) for params in params_list]
+    cached = [pdf_cache.get(key) for key in keys]
+    missing = [params for params, data in zip(params_list, cached) if data is None]
+    sched = scheduler.get_scheduler()
+    rendered = sched.render_boxes(missing) if sched else batch.render_serial(missing)
+    for key, data in zip(keys, cached):
+        if data is not None:
+            yield data, None
+            continue
+        data, error = next(rendered)
+        if error is None:
+            pdf_cache.put(key, data)
+        yield data, error
+
+def _batch_request(values, upload=None, body=None):
+    """Wiersze partii z pliku, pola rows (tekst lub lista) albo surowego ciała -> (rows, format)."""
+    out_fmt = str(values.get("format", "pdf")).lower()
+    if out_fmt not in ("pdf", "zip"):
+        raise ValueError("Niepoprawny format (pdf lub zip)")
+    src = values.get("rows")
+    if src is not None and not isinstance(src, (str, list, dict)):
+        raise ValueError("rows musi być tekstem CSV/JSON albo listą wierszy")
+    if isinstance(src, (list, dict)):
+        src, src_fmt = json.dumps(src), "json"
+    elif upload is not None:
+        src = upload.read().decode("utf-8-sig")
+        src_fmt = "json" if (upload.filename or "").lower().endswith(".json") else None
+    elif src is None:
+        src, src_fmt = (body or b"").decode("utf-8-sig"), None
+    else:
+        src_fmt = None
+    return batch.parse_rows(src, src_fmt), out_fmt
+
+def _counted(chunks, kind):
+    """Przepuszcza strumień i na końcu zapisuje jego rozmiar w metrykach."""
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+        yield chunk
+    metrics.OUTPUT_BYTES.observe(total, kind=kind)
+
+def _batch_chunks(rows, out_fmt, progress=None):
+    if out_fmt == "zip":
+        chunks = batch.iter_zip(rows, _cached_box_pdfs, progress=progress)
+        return _counted(chunks, "batch.zip"), "application/zip"
+    chunks = batch.iter_pdf(rows, logo_path=app.static_folder + "/MB-print-logo11.png", progress=progress)
+    return _counted(chunks, "batch.pdf"), "application/pdf"
+
+def render_batch(params, progress=None):
+    """Partia jako jeden plik (dla zadań asynchronicznych)."""
+    rows, out_fmt = params
+    chunks, mimetype = _batch_chunks(rows, out_fmt, progress)
+    return jobs.JobResult(b"".join(chunks), mimetype, f"Boxes_{len(rows)}.{out_fmt}")
+
+@app.route("/batch", methods=["POST"])
+def batch_boxes():
+    """CSV/JSON z wierszami (L, B, H, R, ep1) -> wielostronicowy PDF lub ZIP (strumieniowo)."""
+    try:
+        body = None if request.files.get("file") else request.get_data()
+        values = request.values
+        if request.is_json:
+            values = {"format": request.values.get("format", "pdf"), "rows": json.loads(body)}
+        rows, out_fmt = _batch_request(values, request.files.get("file"), body)
+    except (UnicodeDecodeError, ValueError) as e:
+        abort(400, f"Niepoprawne dane wejściowe: {e}")
+    if not any(r.error is None for r in rows):
+        return _json(batch.report(rows, {}), status=400)
+
+    valid = sum(1 for r in rows if r.error is None)
+    cost = validation.estimate_cost("box.pdf", valid)
+    if cost > validation.SYNC_RENDER_MS:
+        return _submit_job("batch", (rows, out_fmt), estimated_ms=cost)
+
+    chunks, mimetype = _batch_chunks(rows, out_fmt)
+    rejected = len(rows) - valid
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename=Boxes_{len(rows)}.{out_fmt}",
+            "X-Batch-Rows": str(len(rows)),
+            "X-Batch-Rejected": str(rejected),
+        },
+    )
+
 @app.route("/generate-card", methods=["POST"])
 def generate_card():
     try:
-        width = float(request.form["width"])
-        height = float(request.form["height"])
-        language = request.form.get("language", "pl")
-        
-        from cards import create_template
-        pdf_filename = create_template(width, height, language)
-        
-        with open(pdf_filename, 'rb') as f:
-            pdf_bytes = f.read()
-        
-        file_name = f"Card_{width:g}x{height:g}mm_{language}.pdf"
-        
-        return send_file(
-            BytesIO(pdf_bytes),
-            download_name=file_name,
-            mimetype="application/pdf",
-            as_attachment=True
-        )
-    except (KeyError, ValueError) as e:
-        abort(400, f"Niepoprawne dane wejściowe: {str(e)}")
+        params = _card_request(request.form)
+    except validation.ValidationError as e:
+        return _invalid(e)
+    return _sync_or_job("card", params, _card_cost(params),
+                        lambda: _send_result(render_card(params)))
+
+# --- GET Z CACHE HTTP ---
+# adres = parametry, ETag = klucz cache (parametry znormalizowane + wersja
+# generatora), więc przeglądarka/CDN może trzymać plik i tylko go rewalidować
+HTTP_CACHE_MAX_AGE = int(os.environ.get("HTTP_CACHE_MAX_AGE", 7 * 24 * 3600))
+
+def _conditional(etag, render, kind=None, params=None, cost=0):
+    """
+    304 bez renderowania, gdy klient ma już tę wersję; inaczej plik z ETag
+    (albo zadanie asynchroniczne, gdy render jest za drogi – _sync_or_job).
+    """
+    if request.if_none_match.contains(etag):
+        return _cache_headers(Response(status=304), etag, HTTP_CACHE_MAX_AGE)
+    return _sync_or_job(kind, params, cost,
+                        lambda: _send_result(render(), etag=etag, max_age=HTTP_CACHE_MAX_AGE))
+
+@app.route("/box.<any(pdf, svg, dxf, hpgl):fmt>")
+def box_file(fmt):
+    """GET /box.pdf?L=..&B=..&H=..&ep1=..[&R=15] – jak POST /, ale cache'owalne."""
+    values = request.args.to_dict()
+    values.setdefault("R", validation.DEFAULT_R)
+    values["format"] = fmt
+    try:
+        params = _box_request(values)
+    except validation.ValidationError as e:
+        return _invalid(e)
+    etag = cache_key(f"box.{fmt}", params[0], generator.GENERATOR_VERSION)
+    return _conditional(etag, lambda: render_box(params), "box", params, _box_cost(params))
+
+@app.route("/card.pdf")
+def card_file():
+    """GET /card.pdf?width=..&height=..&language=..[&sheet=SRA3] – jak POST /generate-card."""
+    try:
+        width, height, language, sheet = params = _card_request(request.args)
+    except validation.ValidationError as e:
+        return _invalid(e)
+    etag = _card_key(width, height, _card_lang(language), sheet)
+    return _conditional(etag, lambda: render_card(params), "card", params, _card_cost(params))
+
+@app.route("/preview")
+def box_preview():
+    """
+    GET /preview?L=..&B=..&H=..&ep1=..[&R=15][&format=json|svg] – sama geometria
+    siatki (odcinki CUT/FOLD, obrys, wymiary zewnętrzne) do podglądu na żywo;
+    PDF renderujemy dopiero przy pobieraniu.
+    """
+    values = request.args.to_dict()
+    fmt = values.pop("format", "json").lower()
+    values.setdefault("R", validation.DEFAULT_R)
+    if fmt not in ("json", "svg"):
+        return _invalid(validation.ValidationError([
+            {"field": "format", "code": "invalid", "message": f"Niepoprawny format: {fmt}"}]))
+    try:
+        (L, B, H, R, ep1), _ = _box_request(values)
+    except validation.ValidationError as e:
+        return _invalid(e)
+
+    etag = cache_key(f"preview.{fmt}", (L, B, H, R, ep1), generator.GENERATOR_VERSION)
+    if request.if_none_match.contains(etag):
+        return _cache_headers(Response(status=304), etag, HTTP_CACHE_MAX_AGE)
+    with metrics.stage("box.preview"):
+        geom = generator.preview_geometry(L, B, H, R, ep1)
+        if fmt == "svg":
+            response = Response(generator.preview_svg(geom), mimetype="image/svg+xml")
+        else:
+            response = Response(json.dumps(geom, separators=(",", ":")), mimetype="application/json")
+    return _cache_headers(response, etag, HTTP_CACHE_MAX_AGE)
+
+# --- ZADANIA ASYNCHRONICZNE ---
+# render poza wątkiem żądania; JOB_WORKERS wątków, najwyżej JOB_QUEUE zadań w toku,
+# wyniki zakończonych najwyżej JOB_TTL s i JOB_RESULT_BYTES bajtów łącznie;
+# stan i wyniki także w JOB_STORE (SQLite), żeby każdy worker gunicorna
+# odpowiadał na /jobs/<id> zadań przyjętych przez pozostałe
+JOB_TTL = int(os.environ.get("JOB_TTL", 600))
+JOB_RESULT_BYTES = int(os.environ.get("JOB_RESULT_BYTES", 256 * 1024 * 1024))
+job_queue = jobs.JobQueue(
+    {"box": render_box, "card": render_card, "batch": render_batch},
+    max_workers=int(os.environ.get("JOB_WORKERS", 2)),
+    max_pending=int(os.environ.get("JOB_QUEUE", 16)),
+    ttl=JOB_TTL,
+    max_result_bytes=JOB_RESULT_BYTES,
+    store=JobStore(
+        os.environ.get("JOB_STORE") or os.path.join(tempfile.gettempdir(), "mb-print-jobs.sqlite"),
+        ttl=JOB_TTL,
+        max_bytes=JOB_RESULT_BYTES,
+    ),
+)
+
+JOB_REQUESTS = {"box": _box_request, "card": _card_request}
+
+def _job_links(job):
+    return {
+        "status": f"/jobs/{job.id}",
+        "events": f"/jobs/{job.id}/events",
+        "result": f"/jobs/{job.id}/result",
+    }
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    """
+    Przyjmuje zadanie (kind = box | card | batch, parametry jak w trasach
+    synchronicznych, w formularzu lub JSON) i od razu zwraca 202 z id.
+    """
+    payload = request.get_json(silent=True) if request.is_json else None
+    values = payload if isinstance(payload, dict) else request.values
+    kind = str(values.get("kind", "box")).lower()
+    try:
+        if kind == "batch":
+            upload = request.files.get("file")
+            params = _batch_request(values, upload, None if upload or payload else request.get_data())
+            if not any(r.error is None for r in params[0]):
+                return _json(batch.report(params[0], {}), status=400)
+        elif kind in JOB_REQUESTS:
+            params = JOB_REQUESTS[kind](values)
+        else:
+            raise ValueError(f"Nieznany rodzaj zadania: {kind}")
+    except validation.ValidationError as e:
+        return _invalid(e)
+    except (KeyError, TypeError, UnicodeDecodeError, ValueError) as e:
+        return _json({"error": f"Niepoprawne dane wejściowe: {e}"}, status=400)
+    return _submit_job(kind, params)
+
+def _submit_job(kind, params, **extra):
+    """Zadanie do kolejki -> 202 z id i linkami (429, gdy kolejka pełna)."""
+    try:
+        job = job_queue.submit(kind, params)
+    except jobs.QueueFull as e:
+        return _json({"error": str(e), "retry_after": e.retry_after}, status=429,
+                     headers={"Retry-After": str(e.retry_after)})
+    state = dict(job.to_dict(), links=_job_links(job), **extra)
+    return _json(state, status=202, headers={"Location": f"/jobs/{job.id}"})
+
+def _get_job(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        abort(404, "Nieznane lub wygasłe zadanie")
+    return job
+
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    job = _get_job(job_id)
+    return _json(dict(job.to_dict(), links=_job_links(job)))
+
+@app.route("/jobs/<job_id>/events")
+def job_events(job_id):
+    """Postęp zadania jako Server-Sent Events (do zakończenia zadania)."""
+    job = _get_job(job_id)
+    return Response(
+        stream_with_context(job_queue.events(job)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.route("/jobs/<job_id>/result")
+def job_result(job_id):
+    job = _get_job(job_id)
+    if job.status == jobs.DONE:
+        result = job_queue.result(job)
+        if result is None:
+            abort(404, "Nieznane lub wygasłe zadanie")
+        return _send_result(result)
+    if job.status == jobs.FAILED:
+        return _json(job.to_dict(), status=500)
+    # jeszcze w toku – klient odpytuje dalej
+    return _json(job.to_dict(), status=202, headers={"Retry-After": "1"})
+
+# --- METRYKI ---
+metrics.REGISTRY.gauge("pdf_cache_lookups_total", "Odczyty cache PDF wg wyniku",
+                       lambda: {k: v for k, v in pdf_cache.stats().items() if k in ("hits", "store_hits", "disk_hits", "misses")},
+                       labelname="result", kind="counter")
+metrics.REGISTRY.gauge("pdf_cache_bytes", "Bajty w pamięci cache PDF", lambda: pdf_cache.stats()["bytes"])
+if pdf_cache.store is not None:
+    metrics.REGISTRY.gauge("render_store_bytes", "Bajty w bazie renderów (wszystkie workery)",
+                           lambda: pdf_cache.store.stats()["bytes"])
+    metrics.REGISTRY.gauge("render_store_evictions_total", "Wpisy usunięte z bazy renderów przez LRU w tym procesie",
+                           lambda: pdf_cache.store.stats()["evictions"], kind="counter")
+metrics.REGISTRY.gauge("catalog_lookups_total", "Odczyty paczki katalogu wg wyniku",
+                       lambda: {k: v for k, v in _catalog_stats().items() if k in ("hits", "misses")},
+                       labelname="result", kind="counter")
+metrics.REGISTRY.gauge("catalog_entries", "Wpisy w paczce katalogu", lambda: _catalog_stats()["entries"])
+metrics.REGISTRY.gauge("render_jobs_pending", "Zadania asynchroniczne w kolejce i w toku",
+                       lambda: job_queue.stats()["pending"])
+
+# pliki i trasy, do których dokładamy Server-Timing
+TIMED_MIMETYPES = {"application/pdf", "image/svg+xml", "application/zip",
+                   "application/dxf", "application/vnd.hp-hpgl"}
+TIMED_ENDPOINTS = {"box_preview"}
+
+@app.before_request
+def _start_timing():
+    g.request_started = time.perf_counter()
+    metrics.start_request()
+
+@app.after_request
+def _record_request(response):
+    elapsed = time.perf_counter() - g.pop("request_started", time.perf_counter())
+    timings = metrics.stop_request()
+    endpoint = request.endpoint or "unknown"
+    metrics.REQUESTS.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+    metrics.REQUEST_SECONDS.observe(elapsed, endpoint=endpoint)
+    if response.mimetype in TIMED_MIMETYPES or endpoint in TIMED_ENDPOINTS:
+        response.headers["Server-Timing"] = metrics.server_timing(timings, elapsed)
+    return response
+
+@app.route("/metrics")
+def metrics_endpoint():
+    return Response(metrics.REGISTRY.render(), mimetype="text/plain; version=0.0.4")
+
+# --- START ---
+_started = False
+
+def create_app(prewarm=None):
+    """
+    Fabryka dla gunicorna ('app:create_app()') i python app.py: uruchamia
+    w tle dobudowę paczki katalogu (CATALOG_FILE) i rozgrzewkę rendererów
+    (PREWARM=0 wyłącza), loguje czasy importów. Wywoływana w workerze, więc
+    port jest już związany – pierwsze żądania nie czekają na reportlab i numpy.
+    """
+    global _started
+    if _started:
+        return app
+    _started = True
+    startup.mark("app")
+    # pod gunicornem logujemy do jego dziennika błędów (ma już handler)
+    log = logging.getLogger("gunicorn.error" if "gunicorn" in sys.modules else __name__)
 
-# if __name__ == "__main__":
-#    def open_browser():
-#        time.sleep(1)
-#        webbrowser.open_new("http://127.0.0.1:5000/")
-#
-#    threading.Thread(target=open_browser).start()
-#    app.run()
+    # CATALOG_FILE = przyrostowa dobudowa paczki w tle przy starcie workera
+    if CATALOG_PACK and os.environ.get("CATALOG_FILE"):
+        threading.Thread(
+            target=lambda: catalog.warm_up(os.environ["CATALOG_FILE"], _catalog_store().path),
+            name="catalog-warm-up",
+            daemon=True,
+        ).start()
+    if prewarm is None:
+        prewarm = os.environ.get("PREWARM", "1") != "0"
+    if prewarm:
+        # font, style i logo kart przygotowujemy raz na worker, nie w żądaniu
+        startup.prewarm(RENDER_MODULES, then=("cards.warm_up",), logger=log)
+    else:
+        log.info("Start: %s", startup.report())
+    return app
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
+    create_app().run(host='0.0.0.0', port=port, debug=False)
@@ -0,0 +1,122 @@
+"""
+assets.py – wspólny rejestr zasobów graficznych dla generator.py i cards.py.
+
+Plik (np. logo) jest wczytywany raz na proces; rejestr trzyma surowe bajty,
+postać base64 oraz formy zdekodowane przez renderery (ImageReader reportlab,
+ImageSurface cairo) i przeładowuje wszystko, gdy zmieni się mtime pliku.
+"""
+import base64
+import os
+import struct
+import threading
+from io import BytesIO
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+LOGO_PATH = BASE_DIR / "templates" / "MB-print-logo11.png"
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _image_info(data):
+    """(mime, szerokość, wysokość) z nagłówka PNG, JPEG lub BMP – bez dekodowania."""
+    if data.startswith(_PNG_SIGNATURE):
+        width, height = struct.unpack(">II", data[16:24])
+        return "image/png", width, height
+    if data.startswith(b"\xff\xd8"):
+        pos = 2
+        while pos + 9 < len(data):
+            if data[pos] != 0xFF:
+                pos += 1
+                continue
+            marker = data[pos + 1]
+            length = struct.unpack(">H", data[pos + 2:pos + 4])[0]
+            # SOF0..SOF15 poza DHT (C4), JPG (C8) i DAC (CC)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", data[pos + 5:pos + 9])
+                return "image/jpeg", width, height
+            pos += 2 + length
+    if data.startswith(b"BM"):
+        width, height = struct.unpack("<ii", data[18:26])
+        return "image/bmp", width, abs(height)
+    raise ValueError("Nieobsługiwany format obrazu (oczekiwano PNG, JPEG lub BMP)")
+
+
+class ImageAsset:
+    """Jeden plik obrazu wczytany do pamięci wraz z postaciami pochodnymi."""
+
+    def __init__(self, path, data, mtime_ns):
+        self.path = Path(path)
+        self.data = data
+        self.mtime_ns = mtime_ns
+        self.mime, self.width, self.height = _image_info(data)
+        self._b64 = None
+        self._derived = {}
+        self._lock = threading.Lock()
+
+    @property
+    def aspect(self):
+        """Stosunek wysokości do szerokości."""
+        return self.height / self.width
+
+    @property
+    def b64(self):
+        if self._b64 is None:
+            self._b64 = base64.b64encode(self.data).decode()
+        return self._b64
+
+    @property
+    def data_uri(self):
+        return f"data:{self.mime};base64,{self.b64}"
+
+    def derived(self, name, factory):
+        """Forma pochodna liczona raz: factory(asset) przy pierwszym użyciu."""
+        with self._lock:
+            if name not in self._derived:
+                self._derived[name] = factory(self)
+            return self._derived[name]
+
+    def image_reader(self):
+        """reportlab ImageReader (zdekodowany obraz) dla cards.py."""
+        from reportlab.lib.utils import ImageReader
+
+        return self.derived("reportlab", lambda a: ImageReader(BytesIO(a.data)))
+
+    @property
+    def nbytes(self):
+        """Przybliżony rozmiar w pamięci: plik + base64 + zdekodowane piksele (RGBA)."""
+        size = len(self.data) + (len(self._b64) if self._b64 else 0)
+        return size + len(self._derived) * self.width * self.height * 4
+
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def get_image(path=LOGO_PATH):
+    """
+    ImageAsset dla pliku albo None, jeśli plik nie istnieje.
+    Wczytuje plik przy pierwszym użyciu i ponownie, gdy zmieni się mtime.
+    """
+    path = Path(path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    key = str(path.resolve())
+    asset = _registry.get(key)
+    if asset is not None and asset.mtime_ns == mtime_ns:
+        return asset
+
+    with _registry_lock:
+        asset = _registry.get(key)
+        if asset is None or asset.mtime_ns != mtime_ns:
+            asset = ImageAsset(path, path.read_bytes(), mtime_ns)
+            _registry[key] = asset
+        return asset
+
+
+def footprint():
+    """Łączny rozmiar zasobów w pamięci (bajty) – do monitoringu."""
+    return sum(asset.nbytes for asset in list(_registry.values()))
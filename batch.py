@@ -0,0 +1,246 @@
+"""
+batch.py – wiele rozmiarów pudełek w jednym żądaniu.
+
+Wiersze (L, B, H, R, ep1) z CSV lub JSON renderujemy przez wspólny, rozgrzany
+stan procesu (skompilowane segmenty, rejestr logo) do jednego wielostronicowego
+PDF-a (strona = siatka) albo ZIP-a z osobnymi PDF-ami. Błędny wiersz trafia do
+raportu i nie przerywa partii.
+
+Użycie:
+    python batch.py rozmiary.csv -o wycena.pdf
+    python batch.py rozmiary.json -o wycena.zip
+"""
+import argparse
+import csv
+import io
+import json
+import sys
+import zipfile
+from collections import namedtuple
+from math import isfinite
+
+import assets
+import generator
+import validation
+from pdf_cache import normalize
+from validation import DEFAULT_R
+
+FIELDS = ("L", "B", "H", "R", "ep1")
+MAX_ROWS = 500
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)   # stała data wpisów: ten sam wejściowy zestaw = ten sam ZIP
+
+BatchRow = namedtuple("BatchRow", "index params error")
+
+
+def _row_params(raw):
+    """Słownik lub lista wartości -> znormalizowana krotka (L, B, H, R, ep1)."""
+    if isinstance(raw, dict):
+        raw = {k.strip(): v for k, v in raw.items() if k}
+        if raw.get("R") in (None, ""):
+            raw["R"] = DEFAULT_R
+        missing = [f for f in FIELDS if raw.get(f) in (None, "")]
+        if missing:
+            raise ValueError(f"brak pól: {', '.join(missing)}")
+        values = [raw[f] for f in FIELDS]
+    else:
+        values = list(raw)
+        if len(values) == 4:
+            values.insert(3, DEFAULT_R)
+        if len(values) != len(FIELDS):
+            raise ValueError(f"oczekiwano {len(FIELDS)} wartości (L, B, H, R, ep1)")
+    # przecinek dziesiętny z polskiego Excela
+    values = [v.strip().replace(",", ".") if isinstance(v, str) else v for v in values]
+    params = normalize(*values)
+    if not all(isfinite(p) for p in params):
+        raise ValueError("wartości muszą być skończone")
+    # te same zakresy (grubość, profil tektury, powierzchnia strony) co w app.py
+    validation.check_box(*params)
+    return params
+
+
+def parse_rows(text, fmt=None):
+    """
+    Tekst CSV (z nagłówkiem L,B,H,R,ep1; separator , ; lub tab) albo JSON
+    (lista obiektów lub list) -> lista BatchRow. Wiersze z błędem mają
+    params=None i opis w error.
+    """
+    if fmt is None:
+        fmt = "json" if text.lstrip()[:1] in ("[", "{") else "csv"
+
+    if fmt == "json":
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = data.get("rows", [])
+        if not isinstance(data, list) or not all(isinstance(r, (dict, list)) for r in data):
+            raise ValueError("JSON musi być listą obiektów lub list (L, B, H, R, ep1)")
+        raws = data
+    else:
+        sample = text[:2048]
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        raws = [r for r in csv.DictReader(io.StringIO(text), dialect=dialect)
+                if any((v or "").strip() for v in r.values() if isinstance(v, str))]
+
+    if len(raws) > MAX_ROWS:
+        raise ValueError(f"za dużo wierszy ({len(raws)} > {MAX_ROWS})")
+
+    rows = []
+    for i, raw in enumerate(raws):
+        try:
+            rows.append(BatchRow(i, _row_params(raw), None))
+        except (TypeError, ValueError) as e:
+            rows.append(BatchRow(i, None, str(e)))
+    return rows
+
+
+def report(rows, errors):
+    """Raport partii: liczniki + lista błędów (numery wierszy od 1)."""
+    failed = {r.index: r.error for r in rows if r.error}
+    failed.update(errors)
+    return {
+        "rows": len(rows),
+        "ok": len(rows) - len(failed),
+        "failed": [{"row": i + 1, "error": failed[i]} for i in sorted(failed)],
+    }
+
+
+class _ChunkSink:
+    """Obiekt plikowy tylko do zapisu – zbiera fragmenty do wysłania."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_pdf(rows, *, logo_path=assets.LOGO_PATH, errors=None, progress=None):
+    """
+    Strumień bajtów wielostronicowego PDF-a; błędy renderu trafiają do errors.
+    progress(zrobione, wszystkie) – opcjonalnie po każdej stronie.
+    """
+    errors = {} if errors is None else errors
+    valid = [r for r in rows if r.error is None]
+
+    def summary():
+        rep = report(rows, errors)
+        if not rep["failed"]:
+            return []
+        return [f"Batch: {rep['ok']}/{rep['rows']} OK"] + [
+            f"row {f['row']}: {f['error']}" for f in rep["failed"]
+        ]
+
+    sink = _ChunkSink()
+    pages = generator.pdf_pages_from_params(
+        (r.params for r in valid), sink, logo_path=logo_path, summary=summary
+    )
+    for n, error in pages:
+        if error is not None:
+            errors[valid[n].index] = str(error)
+        if progress is not None:
+            progress(n + 1, len(valid))
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    yield sink.drain()
+
+
+def _zip_entry(name):
+    info = zipfile.ZipInfo(name, date_time=ZIP_DATE)
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def iter_zip(rows, render_many=None, *, errors=None, progress=None):
+    """
+    Strumień bajtów ZIP-a: jeden PDF na poprawny wiersz + report.json.
+    render_many(lista params) -> iterator (bajty PDF, błąd) w tej samej
+    kolejności – szeregowo (render_serial) albo w puli procesów
+    (scheduler.RenderScheduler.render_boxes). progress jak w iter_pdf.
+    """
+    errors = {} if errors is None else errors
+    render_many = render_many or render_serial
+    valid = [r for r in rows if r.error is None]
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as zf:
+        results = zip(valid, render_many([r.params for r in valid]))
+        for n, (row, (data, error)) in enumerate(results, 1):
+            if progress is not None:
+                progress(n, len(valid))
+            if error is not None:
+                errors[row.index] = str(error)
+                continue
+            L, B, H, R, ep1 = row.params
+            zf.writestr(_zip_entry(f"{row.index + 1:03d}_{generator.box_file_name(L, B, H, ep1)}"), data)
+            yield sink.drain()
+        zf.writestr(_zip_entry("report.json"), json.dumps(report(rows, errors), ensure_ascii=False, indent=2))
+    yield sink.drain()
+
+
+def render_box_pdf(params, logo_path=assets.LOGO_PATH):
+    """Jeden PDF pudełka (jak w app.index)."""
+    L, B, H, R, ep1 = params
+    return generator.pdf_bytes_from_params(
+        L, B, H, R, ep1,
+        logo_path=logo_path,
+        ext_dims=generator.external_dims(L, B, H, ep1),
+    )
+
+
+def render_serial(params_list, render=render_box_pdf):
+    """(PDF, błąd) dla każdej krotki – w bieżącym procesie."""
+    for params in params_list:
+        try:
+            yield render(params), None
+        except Exception as e:
+            yield None, e
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Partia pudełek: CSV/JSON -> PDF lub ZIP")
+    parser.add_argument("source", help="plik CSV lub JSON z kolumnami L, B, H, R, ep1")
+    parser.add_argument("-o", "--output", required=True, help="plik wynikowy (.pdf lub .zip)")
+    parser.add_argument("--format", choices=["pdf", "zip"], help="domyślnie z rozszerzenia -o")
+    parser.add_argument("--workers", type=int, default=1, help="procesy renderujące (tylko zip)")
+    args = parser.parse_args()
+
+    with open(args.source, encoding="utf-8-sig") as f:
+        text = f.read()
+    fmt = "json" if args.source.lower().endswith(".json") else None
+    rows = parse_rows(text, fmt)
+    out_fmt = args.format or ("zip" if args.output.lower().endswith(".zip") else "pdf")
+
+    errors = {}
+    sched = None
+    if out_fmt == "zip":
+        render_many = render_serial
+        if args.workers > 1:
+            from scheduler import RenderScheduler
+
+            sched = RenderScheduler(max_workers=args.workers)
+            render_many = sched.render_boxes
+        chunks = iter_zip(rows, render_many, errors=errors)
+    else:
+        chunks = iter_pdf(rows, errors=errors)
+    with open(args.output, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    if sched is not None:
+        sched.shutdown()
+
+    rep = report(rows, errors)
+    print(f"✓ zapisano {args.output}  ({rep['ok']}/{rep['rows']} pudełek)")
+    for fail in rep["failed"]:
+        print(f"✗ wiersz {fail['row']}: {fail['error']}", file=sys.stderr)
+    sys.exit(0 if rep["ok"] else 1)
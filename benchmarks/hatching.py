@@ -0,0 +1,102 @@
+"""
+benchmarks/hatching.py – kreskowanie kart: osobne linie vs wzór kafelkowy.
+
+Dla rosnących wymiarów karty porównuje rozmiar PDF, czas generowania
+i czas rastrowania (RIP) dawnego kreskowania (jedno c.line na kreskę)
+z obecnym wypełnieniem wzorem (cards.draw_hatching). Rastrowanie przez
+PyMuPDF albo Ghostscript – gdy żadnego nie ma, kolumna RIP jest pusta.
+
+Użycie (z katalogu repozytorium):
+    python benchmarks/hatching.py
+    python benchmarks/hatching.py --sizes 85x55,300x200,1000x700 --dpi 300
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cards  # noqa: E402
+from reportlab.lib.colors import HexColor  # noqa: E402
+from reportlab.lib.units import mm  # noqa: E402
+
+
+def legacy_hatching(c, x, y, w, h, step_mm=2):
+    """Kreskowanie sprzed wzoru: osobna linia na każdą kreskę całej strony."""
+    step = step_mm * mm
+    c.setStrokeColor(HexColor('#0000FF'))
+    c.setLineWidth(0.3)
+    c.setStrokeAlpha(0.4)
+    max_dim = w + h
+    for i in range(0, int(max_dim), int(step)):
+        c.line(x + i - h, y, x + i, y + h)
+    return {}
+
+
+def _rasterizer():
+    try:
+        import pymupdf
+    except ImportError:
+        pymupdf = None
+    if pymupdf is not None:
+        def rip(pdf, dpi):
+            with pymupdf.open(stream=pdf, filetype="pdf") as doc:
+                doc[0].get_pixmap(dpi=dpi)
+        return "pymupdf", rip
+
+    gs = shutil.which("gs")
+    if gs:
+        def rip(pdf, dpi):
+            with tempfile.NamedTemporaryFile(suffix=".pdf") as f:
+                f.write(pdf)
+                f.flush()
+                subprocess.run([gs, "-q", "-dNOPAUSE", "-dBATCH", "-sDEVICE=ppmraw", f"-r{dpi}",
+                                "-sOutputFile=/dev/null", f.name], check=True)
+        return "ghostscript", rip
+    return None, None
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def measure(width_mm, height_mm, rip, dpi, repeat):
+    pdf = cards.create_template(width_mm, height_mm, "EN")
+    t_gen = _best(lambda: cards.create_template(width_mm, height_mm, "EN"), repeat)
+    t_rip = _best(lambda: rip(pdf, dpi), repeat) if rip else None
+    return len(pdf), t_gen, t_rip
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kreskowanie: linie vs wzór kafelkowy")
+    parser.add_argument("--sizes", default="85x55,100x50,210x297,500x350",
+                        help="wymiary kart w mm, np. 85x55,1000x700")
+    parser.add_argument("--dpi", type=int, default=150, help="rozdzielczość rastrowania")
+    parser.add_argument("--repeat", type=int, default=5, help="powtórzenia (bierzemy najlepszy czas)")
+    args = parser.parse_args()
+
+    cards.warm_up()
+    rip_name, rip = _rasterizer()
+    print(f"RIP: {rip_name or 'brak (zainstaluj pymupdf albo ghostscript)'}, {args.dpi} dpi")
+    print(f"{'karta [mm]':>12} {'wariant':>8} {'PDF [B]':>9} {'gen [ms]':>9} {'RIP [ms]':>9}")
+
+    pattern_hatching = cards.draw_hatching
+    for size in args.sizes.split(","):
+        w, h = (float(v) for v in size.lower().split("x"))
+        for label, impl in (("linie", legacy_hatching), ("wzór", pattern_hatching)):
+            cards.draw_hatching = impl
+            try:
+                nbytes, t_gen, t_rip = measure(w, h, rip, args.dpi, args.repeat)
+            finally:
+                cards.draw_hatching = pattern_hatching
+            rip_ms = f"{t_rip * 1000:9.1f}" if t_rip is not None else f"{'-':>9}"
+            print(f"{size:>12} {label:>8} {nbytes:9d} {t_gen * 1000:9.1f} {rip_ms}")
@@ -0,0 +1,131 @@
+"""
+benchmarks/response_copies.py – ile kopii pliku powstaje w drodze do klienta.
+
+Każde żądanie przechodzi przez app.wsgi_app tak jak pod gunicornem: ciało
+odpowiedzi jest konsumowane kawałek po kawałku i od razu porzucane. Szczyt
+pamięci Pythona (tracemalloc) w trakcie żądania podzielony przez rozmiar
+pliku to liczba jednoczesnych kopii; przy renderze dochodzą struktury
+renderera, więc tam liczy się raczej różnica między wariantami.
+
+Wariant "bufor" odtwarza dawną ścieżkę (send_file z BytesIO, pełna kopia
+wpisu z paczki, reportlab save() do BytesIO), "strumień" – obecną.
+
+Karta A4 z paczki: 2,08 -> 1,02 kopii. Render karty ma w obu wariantach
+ten sam szczyt (ok. 1,3 MB, 12,5 rozmiaru pliku) – dominuje pamięć robocza
+reportlab, strumieniowanie odpowiedzi go nie zmniejsza.
+
+Użycie (z katalogu repozytorium):
+    python benchmarks/response_copies.py
+    python benchmarks/response_copies.py --box 300x200x100 --card 210x297
+"""
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+import tracemalloc
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import send_file  # noqa: E402
+from reportlab.pdfgen import canvas  # noqa: E402
+from werkzeug.test import EnvironBuilder  # noqa: E402
+
+import app  # noqa: E402
+import catalog  # noqa: E402
+
+
+def legacy_send_result(result, etag=None, max_age=None):
+    return send_file(BytesIO(bytes(result.data)), download_name=result.filename,
+                     mimetype=result.mimetype, as_attachment=True,
+                     etag=etag or True, max_age=max_age)
+
+
+def legacy_view(key):
+    view = catalog.CatalogStore.view(app.catalog_store, key)
+    return None if view is None else bytes(view)
+
+
+def legacy_getpdfdata(self):
+    buf = BytesIO()
+    self._filename = buf
+    self.save()
+    return buf.getvalue()
+
+
+def request(path, **kwargs):
+    """(rozmiar ciała, szczyt pamięci w bajtach) jednego żądania."""
+    environ = EnvironBuilder(path=path, **kwargs).get_environ()
+    status = []
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    body = app.app.wsgi_app(environ, lambda s, h, exc_info=None: status.append(s))
+    size = 0
+    try:
+        for chunk in body:
+            size += len(chunk)
+    finally:
+        getattr(body, "close", lambda: None)()
+    if not status[0].startswith("200"):
+        raise RuntimeError(f"{path}: {status[0]}")
+    return size, tracemalloc.get_traced_memory()[1] - base
+
+
+# nowy rozmiar = pewny render, bez trafienia w cache (wspólny dla obu wariantów)
+fresh = itertools.count(1)
+
+
+def cases(box, card):
+    L, B, H = box
+    width, height = card
+    box_form = {"L": L, "B": B, "H": H, "R": 15, "ep1": 2}
+    card_query = f"width={width}&height={height}&language=PL"
+
+    def render_box():
+        return request("/", method="POST", data=dict(box_form, L=L + next(fresh) / 10))
+
+    def render_card():
+        return request(f"/card.pdf?width={width + next(fresh) / 10}&height={height}&language=PL")
+
+    return [
+        ("pudełko: render", render_box),
+        ("pudełko: cache", lambda: request("/", method="POST", data=box_form)),
+        ("pudełko: paczka", lambda: request(f"/box.pdf?L={L}&B={B}&H={H}&ep1=2")),
+        ("karta: render", render_card),
+        ("karta: paczka", lambda: request(f"/card.pdf?{card_query}")),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kopie pliku w ścieżce odpowiedzi")
+    parser.add_argument("--box", default="300x200x100", help="wymiary pudełka LxBxH w mm")
+    parser.add_argument("--card", default="210x297", help="wymiary karty w mm")
+    args = parser.parse_args()
+    box = tuple(float(v) for v in args.box.lower().split("x"))
+    card = tuple(float(v) for v in args.card.lower().split("x"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_path = os.path.join(tmp, "catalog.pack")
+        catalog.build(catalog.catalog_entries({"boxes": [[*box, 2]], "cards": [[*card, "PL"]]}), pack_path)
+        app.CATALOG_PACK = pack_path
+        app.catalog_store = catalog.CatalogStore(pack_path)
+
+        tracemalloc.start()
+        print(f"{'przypadek':<18} {'wariant':>8} {'plik [B]':>10} {'szczyt [B]':>11} {'kopie':>6}")
+        for variant in ("bufor", "strumień"):
+            legacy = variant == "bufor"
+            send_result, getpdfdata, view = app._send_result, canvas.Canvas.getpdfdata, app.catalog_store.view
+            if legacy:
+                app._send_result = legacy_send_result
+                canvas.Canvas.getpdfdata = legacy_getpdfdata
+                app.catalog_store.view = legacy_view
+            try:
+                for name, run in cases(box, card):
+                    run()  # rozgrzewka (fonty, logo, cache)
+                    size, peak = run()
+                    print(f"{name:<18} {variant:>8} {size:10d} {peak:11d} {peak / size:6.2f}")
+            finally:
+                app._send_result, canvas.Canvas.getpdfdata = send_result, getpdfdata
+                app.catalog_store.view = view
+        tracemalloc.stop()
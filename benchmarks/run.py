@@ -0,0 +1,202 @@
+"""
+benchmarks/run.py – powtarzalne pomiary generator.py i cards.py.
+
+Każdy przypadek przechodzi całą siatkę wymiarów (pudełka: wszystkie grubości
+ep1) z rozgrzewką, potem zbiera czasy pojedynczych wywołań. Raport: p50/p99,
+przepustowość, szczytowe RSS procesu i rozmiar wyniku. Wynik można zapisać
+jako JSON (--save) i porównać z wcześniejszym (--baseline): przebieg kończy
+się kodem 1, gdy p50 któregoś przypadku jest wolniejsze o więcej niż
+--threshold (domyślnie 20%).
+
+Użycie (z katalogu repozytorium, bez usług zewnętrznych):
+    python benchmarks/run.py --save benchmarks/baseline.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json --threshold 0.15
+    python benchmarks/run.py --filter card --repeat 20
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import assets  # noqa: E402
+import cards  # noqa: E402
+import generator  # noqa: E402
+
+EP1_VALUES = (1, 1.5, 2)
+BOX_DIMS = ((60, 40, 20), (100, 70, 30), (150, 100, 60), (300, 200, 100))
+R = 15.0
+CARD_SIZES = ((50, 30), (85, 55), (100, 50), (210, 297))
+CARD_LANGS = ("PL", "EN")
+
+
+def _box_grid():
+    return [(L, B, H, R, ep1) for L, B, H in BOX_DIMS for ep1 in EP1_VALUES]
+
+
+def _box_call(fn):
+    def call(params):
+        L, B, H, R_, ep1 = params
+        return fn(L, B, H, R_, ep1, logo_path=assets.LOGO_PATH,
+                  ext_dims=generator.external_dims(L, B, H, ep1))
+    return call
+
+
+# nazwa -> (siatka parametrów, funkcja(params) -> wynik)
+CASES = {
+    "generator._derived_vars": (_box_grid(), lambda p: generator._derived_vars(*p)),
+    "generator._segment_list": (
+        [generator._derived_vars(*p) for p in _box_grid()], generator._segment_list),
+    "generator.merge_segments": (
+        [generator.box_segments(*p) for p in _box_grid()], generator.merge_segments),
+    "generator.svg_bytes_from_params": (_box_grid(), _box_call(generator.svg_bytes_from_params)),
+    # PDF rysuje bezpośrednio cairo (pycairo), bez konwersji SVG -> PDF
+    "generator.pdf_bytes_from_params": (_box_grid(), _box_call(generator.pdf_bytes_from_params)),
+    "cards.create_template": (
+        [(w, h, lang) for w, h in CARD_SIZES for lang in CARD_LANGS],
+        lambda p: cards.create_template(*p)),
+}
+
+
+def _peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux podaje KiB, macOS bajty
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _percentile(sorted_values, q):
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = (len(sorted_values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def _size(result):
+    if isinstance(result, (bytes, bytearray)):
+        return len(result)
+    return None
+
+
+def run_case(grid, fn, repeat, warmup):
+    """Czasy (s) każdego wywołania: repeat przejść po całej siatce."""
+    for _ in range(warmup):
+        for params in grid:
+            fn(params)
+    gc.collect()
+    times = []
+    sizes = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for params in grid:
+            t0 = time.perf_counter()
+            fn(params)
+            times.append(time.perf_counter() - t0)
+    wall = time.perf_counter() - started
+    # rozmiar wyniku poza pomiarem (wynik jest deterministyczny)
+    for params in grid:
+        size = _size(fn(params))
+        if size is not None:
+            sizes.append(size)
+
+    times.sort()
+    return {
+        "calls": len(times),
+        "p50_ms": round(_percentile(times, 0.50) * 1000, 4),
+        "p99_ms": round(_percentile(times, 0.99) * 1000, 4),
+        "mean_ms": round(statistics.fmean(times) * 1000, 4),
+        "ops_per_s": round(len(times) / wall, 1),
+        "output_bytes": round(statistics.fmean(sizes)) if sizes else None,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def _git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """Lista (przypadek, stare p50, nowe p50, zmiana) przekraczających próg."""
+    regressions = []
+    for name, res in results["cases"].items():
+        old = baseline.get("cases", {}).get(name)
+        if not old or not old.get("p50_ms"):
+            continue
+        change = res["p50_ms"] / old["p50_ms"] - 1
+        res["p50_change"] = round(change, 4)
+        if change > threshold:
+            regressions.append((name, old["p50_ms"], res["p50_ms"], change))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark generatora pudełek i kart")
+    parser.add_argument("--repeat", type=int, default=10, help="przejścia po siatce na przypadek")
+    parser.add_argument("--warmup", type=int, default=1, help="przejścia rozgrzewające")
+    parser.add_argument("--filter", default="", help="tylko przypadki zawierające ten tekst")
+    parser.add_argument("--save", help="zapisz wyniki jako JSON")
+    parser.add_argument("--baseline", help="JSON z poprzedniego przebiegu do porównania")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="dopuszczalny wzrost p50 względem baseline (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    cards.warm_up()
+    assets.get_image()
+
+    results = {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git": _git_rev(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "generator_version": generator.GENERATOR_VERSION,
+            "repeat": args.repeat,
+        },
+        "cases": {},
+    }
+
+    print(f"{'przypadek':<34} {'wywołań':>8} {'p50 [ms]':>10} {'p99 [ms]':>10} "
+          f"{'op/s':>10} {'wynik [B]':>10} {'RSS [MB]':>9}")
+    for name, (grid, fn) in CASES.items():
+        if args.filter not in name:
+            continue
+        res = run_case(grid, fn, args.repeat, args.warmup)
+        results["cases"][name] = res
+        size = res["output_bytes"] if res["output_bytes"] is not None else "-"
+        print(f"{name:<34} {res['calls']:>8} {res['p50_ms']:>10.3f} {res['p99_ms']:>10.3f} "
+              f"{res['ops_per_s']:>10.1f} {size:>10} {res['peak_rss_mb']:>9.1f}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        print(f"\nporównanie z {args.baseline} ({baseline.get('meta', {}).get('git')}), "
+              f"próg +{args.threshold:.0%} p50:")
+        for name, res in results["cases"].items():
+            if "p50_change" in res:
+                mark = "✗" if res["p50_change"] > args.threshold else "✓"
+                print(f"  {mark} {name:<34} {res['p50_change']:+.1%}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ zapisano {args.save}")
+
+    if regressions:
+        print(f"\n✗ regresja w {len(regressions)} przypadkach", file=sys.stderr)
+        sys.exit(1)
@@ -1,15 +1,22 @@
 import argparse
+import logging
 import os
 import sys
+import threading
+from functools import lru_cache
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import mm
 from reportlab.lib.colors import HexColor, Color
-from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase import pdfdoc, pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import Paragraph, Frame, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER
-from reportlab.lib.utils import ImageReader
+
+import assets
+import metrics
+
+log = logging.getLogger(__name__)
 
 # --- SŁOWNIK TŁUMACZEŃ ---
 TRANSLATIONS = {
@@ -59,8 +66,57 @@ def register_polish_font():
         pass
     return font_name
 
+class CardContext:
+    """
+    Stan renderowania kart budowany raz na worker: zarejestrowany font
+    (TTF parsowany jeden raz, reportlab trzyma przy nim cache podzbiorów
+    glifów) oraz fabryka stylów akapitów kluczowana rozmiarami fontów.
+    """
+
+    def __init__(self):
+        self.font_name = register_polish_font()
+        self._normal = getSampleStyleSheet()['Normal']
+        self.styles = lru_cache(maxsize=256)(self._build_styles)
+
+    def _build_styles(self, desc_size, header_size, data_size):
+        """(style_desc, style_header, style_data) dla danych rozmiarów."""
+        style_desc = ParagraphStyle('Desc', parent=self._normal, fontName=self.font_name, 
+                                    fontSize=desc_size, leading=desc_size+2, 
+                                    alignment=TA_CENTER, textColor=HexColor('#000000'))
+        style_header = ParagraphStyle('Header', parent=self._normal, fontName=self.font_name, 
+                                      fontSize=header_size, leading=header_size+2, 
+                                      alignment=TA_CENTER, spaceBefore=3, textColor=HexColor('#000000'))
+        style_data = ParagraphStyle('Data', parent=self._normal, fontName=self.font_name, 
+                                    fontSize=data_size, leading=data_size+2, 
+                                    alignment=TA_CENTER, textColor=HexColor('#000000'))
+        return style_desc, style_header, style_data
+
+_context = None
+_context_lock = threading.Lock()
+
+def get_context():
+    """CardContext procesu – tworzony przy pierwszym użyciu."""
+    global _context
+    if _context is None:
+        with _context_lock:
+            if _context is None:
+                _context = CardContext()
+    return _context
+
+def warm_up():
+    """Rozgrzewka przy starcie aplikacji: font, style i zdekodowane logo."""
+    ctx = get_context()
+    ctx.styles(7, 8, 8)
+    logo_file = find_logo_file()
+    if logo_file:
+        try:
+            assets.get_image(logo_file).image_reader()
+        except Exception as e:
+            log.warning("Rozgrzewka kart: nie można wczytać logo %s: %s", logo_file, e)
+    return ctx
+
 def find_logo_file():
-    candidates = ["templates/MB-print-logo11.png", "logo.jpg", "logo.jpeg", "logo.png", "logo.bmp"]
+    candidates = [assets.LOGO_PATH, "logo.jpg", "logo.jpeg", "logo.png", "logo.bmp"]
     for filename in candidates:
         if os.path.exists(filename):
             return filename
@@ -78,29 +134,87 @@ def add_round_rect_reverse(path, x, y, w, h, r):
     path.curveTo(x + r * 0.45, y + h, x, y + h - r * 0.45, x, y + h - r)
     path.close()
 
+def hatch_pattern(c, step_mm=2):
+    """
+    Wzór kafelkowy PDF (PatternType 1) z jedną ukośną kreską na kafelek
+    step x step. Rejestrowany raz na dokument; zwraca (nazwa, referencja).
+    """
+    # odstęp w pełnych punktach, jak przy dawnych kreskach co int(step) (2 mm -> 5 pt)
+    step = int(step_mm * mm)
+    name = f"Hatch{step_mm:g}".replace('.', '_')
+    internal = f"Pattern.{name}"
+    doc = c._doc
+    if internal not in doc.idToObject:
+        # kreska pod 45° i jej ucięte końce z sąsiednich kafelków (bez przerw w narożnikach)
+        content = (f"/GS0 gs 0 0 1 RG 0.3 w "
+                   f"-1 -1 m {step + 1:.4f} {step + 1:.4f} l "
+                   f"-1 {step - 1:.4f} m 1 {step + 1:.4f} l "
+                   f"{step - 1:.4f} -1 m {step + 1:.4f} 1 l S\n")
+        pattern = pdfdoc.PDFStream(pdfdoc.PDFDictionary({
+            'Type': pdfdoc.PDFName('Pattern'),
+            'PatternType': 1,
+            'PaintType': 1,
+            'TilingType': 1,
+            'BBox': pdfdoc.PDFArray([0, 0, step, step]),
+            'XStep': step,
+            'YStep': step,
+            'Resources': pdfdoc.PDFDictionary({
+                'ExtGState': pdfdoc.PDFDictionary({'GS0': pdfdoc.PDFDictionary({'CA': 0.4})}),
+            }),
+        }), content)
+        doc.Reference(pattern, internal)
+    return name, pdfdoc.PDFObjectReference(internal)
+
 def draw_hatching(c, x, y, w, h, step_mm=2):
-    step = step_mm * mm
-    c.setStrokeColor(HexColor('#0000FF'))
-    c.setLineWidth(0.3)
-    c.setStrokeAlpha(0.4)
-    max_dim = w + h
-    for i in range(0, int(max_dim), int(step)):
-        c.line(x + i - h, y, x + i, y + h)
-
-def create_template(width_mm, height_mm, lang):
+    """
+    Kreskowanie prostokąta jednym wypełnieniem wzorem kafelkowym – rozmiar
+    strumienia i czas rastrowania nie rosną z wymiarem karty. Zwraca
+    {nazwa: referencja} wzoru do słownika zasobów formy (_end_form).
+    """
+    name, ref = hatch_pattern(c, step_mm)
+    c.addLiteral(f"/Pattern cs /{name} scn")
+    c.rect(x, y, w, h, fill=1, stroke=0)
+    return {name: ref}
+
+def template_filename(width_mm, height_mm, lang):
     lang = lang.upper()
     if lang not in TRANSLATIONS: lang = 'EN'
+    return f"template_{width_mm}x{height_mm}mm_{lang}.pdf"
+
+# Wersja wyglądu kart – zmień przy każdej zmianie rysunku (ETag /card.pdf).
+# Canvas(invariant=1): stała data i /ID, więc te same parametry = te same bajty
+TEMPLATE_VERSION = "2"
+
+# SPAD
+BLEED_MM = 3
+
+# arkusze do montażu kart (szerokość, wysokość) w mm
+SHEETS = {
+    'A4': (210, 297),
+    'A3': (297, 420),
+    'SRA3': (320, 450),
+}
+SHEET_MARGIN_MM = 10    # miejsce na znaczniki cięcia
+CROP_MARK_MM = 5        # długość znacznika
+CROP_OFFSET_MM = 2      # odstęp znacznika od spadu
+
+def card_page_size(width_mm, height_mm):
+    """Wymiar strony karty ze spadem (brutto) w punktach."""
+    return (width_mm + 2 * BLEED_MM) * mm, (height_mm + 2 * BLEED_MM) * mm
+
+def _draw_card(c, width_mm, height_mm, lang):
+    """
+    Rysuje jedną kartę ze spadem w układzie (0, 0)–card_page_size().
+    Zwraca wzory użyte w rysunku (do zasobów formy).
+    """
     txt = TRANSLATIONS[lang]
-    font_name = register_polish_font()
-    
-    filename = f"template_{width_mm}x{height_mm}mm_{lang}.pdf"
-    
+    ctx = get_context()
+
     # GEOMETRIA
-    BLEED = 3 * mm
+    BLEED = BLEED_MM * mm
     CUT_W = width_mm * mm
     CUT_H = height_mm * mm
-    PAGE_W = CUT_W + (2 * BLEED)
-    PAGE_H = CUT_H + (2 * BLEED)
+    PAGE_W, PAGE_H = card_page_size(width_mm, height_mm)
     
     SAFE_MARGIN = 4 * mm
     SAFE_W = CUT_W - (2 * SAFE_MARGIN)
@@ -109,9 +223,6 @@ def create_template(width_mm, height_mm, lang):
     SAFE_Y = BLEED + SAFE_MARGIN
     CORNER_RADIUS = 5 * mm
 
-    c = canvas.Canvas(filename, pagesize=(PAGE_W, PAGE_H))
-    c.setTitle(f"Szablon {width_mm}x{height_mm} {lang}")
-
     # --- 1. WARSTWY TŁA ---
     # Czerwony Spad
     c.saveState()
@@ -130,7 +241,7 @@ def create_template(width_mm, height_mm, lang):
     p_unsafe.roundRect(BLEED, BLEED, CUT_W, CUT_H, CORNER_RADIUS)
     add_round_rect_reverse(p_unsafe, SAFE_X, SAFE_Y, SAFE_W, SAFE_H, CORNER_RADIUS)
     c.clipPath(p_unsafe, stroke=0, fill=0)
-    draw_hatching(c, 0, 0, PAGE_W, PAGE_H, step_mm=2)
+    patterns = draw_hatching(c, 0, 0, PAGE_W, PAGE_H, step_mm=2)
     c.restoreState()
 
     # Linia cięcia
@@ -154,13 +265,14 @@ def create_template(width_mm, height_mm, lang):
     if logo_file:
         try:
             # KLUCZOWE: Wczytanie obrazu do obiektu przed rysowaniem
-            logo_obj = ImageReader(logo_file)
-            iw, ih = logo_obj.getSize()
-            aspect = ih / float(iw)
+            # (rejestr assets trzyma zdekodowany obraz między żądaniami)
+            logo_asset = assets.get_image(logo_file)
+            logo_obj = logo_asset.image_reader()
+            iw, ih = logo_asset.width, logo_asset.height
+            aspect = logo_asset.aspect
             target_w = min(30 * mm, SAFE_W * 0.5) * logo_scale_factor
             target_h = target_w * aspect
             logo_height_final = target_h
-            print(f"ZNALAZŁEM: {logo_file} ({iw}x{ih})")
         except Exception as e:
             print(f"BŁĄD PLIKU: {e}")
     else:
@@ -188,16 +300,7 @@ def create_template(width_mm, height_mm, lang):
             base_header_size = max(5, base_header_size * scale)
             base_data_size = max(5, base_data_size * scale)
 
-    styles = getSampleStyleSheet()
-    style_desc = ParagraphStyle('Desc', parent=styles['Normal'], fontName=font_name, 
-                                fontSize=base_desc_size, leading=base_desc_size+2, 
-                                alignment=TA_CENTER, textColor=HexColor('#000000'))
-    style_header = ParagraphStyle('Header', parent=styles['Normal'], fontName=font_name, 
-                                  fontSize=base_header_size, leading=base_header_size+2, 
-                                  alignment=TA_CENTER, spaceBefore=3, textColor=HexColor('#000000'))
-    style_data = ParagraphStyle('Data', parent=styles['Normal'], fontName=font_name, 
-                                fontSize=base_data_size, leading=base_data_size+2, 
-                                alignment=TA_CENTER, textColor=HexColor('#000000'))
+    style_desc, style_header, style_data = ctx.styles(base_desc_size, base_header_size, base_data_size)
 
     story = []
     story.append(Spacer(1, logo_height_final + 2*mm))
@@ -232,7 +335,8 @@ def create_template(width_mm, height_mm, lang):
     frame = Frame(SAFE_X + 1*mm, SAFE_Y + 1*mm, 
                   SAFE_W - 2*mm, SAFE_H - 2*mm, 
                   leftPadding=0, bottomPadding=0, rightPadding=0, topPadding=0, showBoundary=0)
-    frame.addFromList(story, c)
+    with metrics.stage("card.layout"):
+        frame.addFromList(story, c)
 
     # --- 4. RYSOWANIE LOGO (CRITICAL FIX) ---
     
@@ -257,9 +361,142 @@ def create_template(width_mm, height_mm, lang):
         c.line(pos_x, pos_y, pos_x + target_w, pos_y + target_h)
         c.line(pos_x, pos_y + target_h, pos_x + target_w, pos_y)
 
-    c.save()
-    print(f"GOTOWE: {filename}")
-    return filename
+    return patterns
+
+def create_template(width_mm, height_mm, lang, target=None):
+    """
+    Renderuje szablon karty w pamięci i zwraca bajty PDF.
+    target (opcjonalnie): ścieżka pliku albo obiekt plikowy, do którego
+    zostanie też zapisany wynik – używane tylko przez CLI.
+    """
+    lang = lang.upper()
+    if lang not in TRANSLATIONS: lang = 'EN'
+
+    page_w, page_h = card_page_size(width_mm, height_mm)
+    # getpdfdata() zamiast save() do BytesIO: jedna kopia dokumentu zamiast trzech
+    c = canvas.Canvas(None, pagesize=(page_w, page_h), invariant=1)
+    c.setTitle(f"Szablon {width_mm}x{height_mm} {lang}")
+    # karta jako forma – tylko zasoby formy mogą nieść wzór kreskowania
+    c.beginForm("card", upperx=page_w, uppery=page_h)
+    with metrics.stage("card.draw"):
+        _end_form(c, "card", _draw_card(c, width_mm, height_mm, lang))
+    c.doForm("card")
+    with metrics.stage("card.save"):
+        pdf_bytes = c.getpdfdata()
+    return _write_target(pdf_bytes, target)
+
+def _write_target(pdf_bytes, target):
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as f:
+            f.write(pdf_bytes)
+    elif target is not None:
+        target.write(pdf_bytes)
+    return pdf_bytes
+
+def sheet_layout(width_mm, height_mm, sheet='SRA3', gutter_mm=None):
+    """
+    Najlepsze ułożenie kart na arkuszu: (kolumny, wiersze, obrót, krok_x, krok_y)
+    w mm. gutter_mm – odstęp między liniami cięcia (domyślnie dwa spady, czyli
+    spady sąsiednich kart stykają się). Obrót o 90° wybieramy, gdy mieści więcej kart.
+    """
+    sheet_w, sheet_h = SHEETS[sheet.upper()] if isinstance(sheet, str) else sheet
+    gutter = 2 * BLEED_MM if gutter_mm is None else gutter_mm
+    # siatka zajmuje n*krok - odstęp + 2 spady, więc odstęp/spady doliczamy do obszaru
+    area_w = sheet_w - 2 * SHEET_MARGIN_MM - 2 * BLEED_MM + gutter
+    area_h = sheet_h - 2 * SHEET_MARGIN_MM - 2 * BLEED_MM + gutter
+
+    best = None
+    for rotated in (False, True):
+        cw, ch = (height_mm, width_mm) if rotated else (width_mm, height_mm)
+        cols = int(area_w // (cw + gutter))
+        rows = int(area_h // (ch + gutter))
+        if best is None or cols * rows > best[0] * best[1]:
+            best = (cols, rows, rotated, cw + gutter, ch + gutter)
+    if best[0] * best[1] == 0:
+        raise ValueError(f"Karta {width_mm:g}x{height_mm:g} mm nie mieści się na arkuszu {sheet_w}x{sheet_h} mm")
+    return best
+
+def _end_form(c, name, patterns=None):
+    """
+    endForm() z pełnym słownikiem zasobów formy. reportlab nie przepisuje
+    do zasobów formy stanów ExtGState (przezroczystość spadu) ani wzorów
+    (kreskowanie), więc operatory gs/scn wskazywałyby na nieistniejące zasoby.
+    """
+    c.endForm()
+    form = c._doc.idToObject[c._doc.getXObjectName(name)]
+    resources = pdfdoc.PDFResourceDictionary()
+    resources.basicFonts()
+    resources.allProcs()
+    if form.XObjects:
+        resources.XObject = form.XObjects
+    if form.ExtGState:
+        resources.ExtGState = form.ExtGState
+    if patterns:
+        resources.Pattern = patterns
+    form.Resources = resources
+
+def _crop_marks(c, xs, ys, x0, y0, x1, y1):
+    """Znaczniki cięcia na przedłużeniu linii xs / ys poza prostokątem siatki."""
+    off = CROP_OFFSET_MM * mm
+    length = CROP_MARK_MM * mm
+    c.setStrokeColor(HexColor('#000000'))
+    c.setLineWidth(0.25)
+    c.setStrokeAlpha(1.0)
+    for x in xs:
+        c.line(x, y0 - off - length, x, y0 - off)
+        c.line(x, y1 + off, x, y1 + off + length)
+    for y in ys:
+        c.line(x0 - off - length, y, x0 - off, y)
+        c.line(x1 + off, y, x1 + off + length, y)
+
+def create_sheet(width_mm, height_mm, lang, sheet='SRA3', gutter_mm=None, target=None):
+    """
+    Arkusz N-up: karta rysowana raz jako form XObject i wstawiana w każdą
+    komórkę siatki (doForm), plus znaczniki cięcia. Zwraca bajty PDF.
+    """
+    lang = lang.upper()
+    if lang not in TRANSLATIONS: lang = 'EN'
+    sheet_w, sheet_h = SHEETS[sheet.upper()] if isinstance(sheet, str) else sheet
+    cols, rows, rotated, step_x, step_y = sheet_layout(width_mm, height_mm, (sheet_w, sheet_h), gutter_mm)
+    card_w, card_h = (height_mm, width_mm) if rotated else (width_mm, height_mm)
+    gutter = step_x - card_w
+
+    c = canvas.Canvas(None, pagesize=(sheet_w * mm, sheet_h * mm), invariant=1)
+    c.setTitle(f"Arkusz {cols * rows}x {width_mm}x{height_mm} {lang}")
+
+    page_w, page_h = card_page_size(width_mm, height_mm)
+    c.beginForm("card", upperx=page_w, uppery=page_h)
+    with metrics.stage("card.draw"):
+        _end_form(c, "card", _draw_card(c, width_mm, height_mm, lang))
+
+    # lewy dolny róg pierwszej linii cięcia – siatka wyśrodkowana na arkuszu
+    grid_w = cols * step_x - gutter
+    grid_h = rows * step_y - gutter
+    x0 = (sheet_w - grid_w) / 2
+    y0 = (sheet_h - grid_h) / 2
+    for col in range(cols):
+        for row in range(rows):
+            # komórka to karta ze spadem, przesunięta o spad przed linię cięcia
+            x = (x0 + col * step_x - BLEED_MM) * mm
+            y = (y0 + row * step_y - BLEED_MM) * mm
+            c.saveState()
+            if rotated:
+                c.translate(x + page_h, y)
+                c.rotate(90)
+            else:
+                c.translate(x, y)
+            c.doForm("card")
+            c.restoreState()
+
+    xs = [(x0 + col * step_x + d) * mm for col in range(cols) for d in (0, card_w)]
+    ys = [(y0 + row * step_y + d) * mm for row in range(rows) for d in (0, card_h)]
+    _crop_marks(c, sorted(set(xs)), sorted(set(ys)),
+                (x0 - BLEED_MM) * mm, (y0 - BLEED_MM) * mm,
+                (x0 + grid_w + BLEED_MM) * mm, (y0 + grid_h + BLEED_MM) * mm)
+
+    with metrics.stage("card.save"):
+        pdf_bytes = c.getpdfdata()
+    return _write_target(pdf_bytes, target)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generator makiety v10 (Alpha Reset)")
@@ -267,5 +504,16 @@ if __name__ == "__main__":
     parser.add_argument("height", type=float, help="Wysokość (mm)")
     parser.add_argument("lang", type=str, choices=['PL', 'EN', 'pl', 'en'], help="Język (PL lub EN)")
     
+    parser.add_argument("--sheet", choices=sorted(SHEETS), type=str.upper, help="Arkusz N-up z kartami (np. SRA3)")
+    parser.add_argument("--gutter", type=float, help="Odstęp między kartami (mm), domyślnie 2 x spad")
+    
     args = parser.parse_args()
-    create_template(args.width, args.height, args.lang)
+    if args.sheet:
+        cols, rows, rotated, _, _ = sheet_layout(args.width, args.height, args.sheet, args.gutter)
+        filename = f"sheet_{args.sheet}_{args.width}x{args.height}mm_{args.lang.upper()}.pdf"
+        create_sheet(args.width, args.height, args.lang, args.sheet, args.gutter, target=filename)
+        print(f"GOTOWE: {filename} ({cols}x{rows} = {cols * rows} kart{', obrócone' if rotated else ''})")
+    else:
+        filename = template_filename(args.width, args.height, args.lang)
+        create_template(args.width, args.height, args.lang, target=filename)
+        print(f"GOTOWE: {filename}")
@@ -0,0 +1,334 @@
+"""
+catalog.py – katalog standardowych rozmiarów wyrenderowany z góry do jednego pliku.
+
+Plik katalogu (JSON) wymienia wymiary wewnętrzne pudełek i formaty kart:
+
+    {
+      "boxes": [[100, 70, 30], {"L": 120, "B": 80, "H": 40, "ep1": 2}],
+      "cards": [[85, 55], {"width": 100, "height": 50, "language": "PL"}]
+    }
+
+Pudełko bez ep1 rozwija się na wszystkie grubości z materials.json
+(THICKNESSES), karta bez języka – na wszystkie języki cards.TRANSLATIONS.
+
+Wynik to jeden plik-paczka: nagłówek, treści PDF jedna za drugą i indeks
+JSON {klucz: [offset, długość, rodzaj, parametry]}. Klucz to ten sam skrót
+co w pdf_cache i ETag (parametry + wersja generatora), więc serwer szuka
+w paczce bez żadnego przeliczania, a dane czyta z mmap (strony dzielone
+przez wszystkie workery przez cache systemu plików). Przebudowa jest
+przyrostowa: wpisy, których klucz już jest w starej paczce, są kopiowane,
+renderowane są tylko nowe (zmienione parametry albo wersja generatora).
+
+Użycie:
+    python catalog.py katalog.json -o catalog.pack
+    python catalog.py katalog.json -o catalog.pack --workers 4
+"""
+import argparse
+import fcntl
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import batch
+import cards
+import generator
+import materials
+from pdf_cache import cache_key, normalize
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"MBCATPK1"
+HEADER = struct.Struct("<8sQQ")  # magic, offset indeksu, długość indeksu
+THICKNESSES = materials.thicknesses()
+
+# klucz -> zadanie dla scheduler.render_job
+CatalogEntry = namedtuple("CatalogEntry", "key kind params")
+
+
+def box_key(params):
+    return cache_key("box.pdf", params, generator.GENERATOR_VERSION)
+
+
+def card_key(width, height, lang, sheet=""):
+    return cache_key("card", (width, height, lang, sheet), cards.TEMPLATE_VERSION)
+
+
+def _box_entries(raw):
+    if isinstance(raw, dict):
+        thicknesses = [raw["ep1"]] if raw.get("ep1") not in (None, "") else THICKNESSES
+        variants = [dict(raw, ep1=ep1) for ep1 in thicknesses]
+    else:
+        values = list(raw)
+        # [L, B, H] albo [L, B, H, ep1] albo pełne [L, B, H, R, ep1]
+        variants = [values + [ep1] for ep1 in THICKNESSES] if len(values) == 3 else [values]
+    for variant in variants:
+        params = batch._row_params(variant)
+        yield CatalogEntry(box_key(params), "box", params)
+
+
+def _card_entries(raw):
+    if isinstance(raw, dict):
+        width, height, language = raw["width"], raw["height"], raw.get("language")
+    else:
+        width, height, language = (list(raw) + [None])[:3]
+    width, height = normalize(width, height)
+    if width <= 0 or height <= 0:
+        raise ValueError("wymiary karty muszą być dodatnie")
+    if language:
+        langs = [str(language).upper()]
+        if langs[0] not in cards.TRANSLATIONS:
+            raise ValueError(f"nieznany język: {language}")
+    else:
+        langs = sorted(cards.TRANSLATIONS)
+    for lang in langs:
+        yield CatalogEntry(card_key(width, height, lang), "card", (width, height, lang))
+
+
+def load_catalog(path):
+    """Plik katalogu -> lista CatalogEntry (bez powtórzeń, w kolejności pliku)."""
+    with open(path, encoding="utf-8") as f:
+        return catalog_entries(json.load(f))
+
+
+def catalog_entries(data):
+    """Słownik katalogu {"boxes": [...], "cards": [...]} -> lista CatalogEntry."""
+    entries = {}
+    for section, expand in (("boxes", _box_entries), ("cards", _card_entries)):
+        for i, raw in enumerate(data.get(section, [])):
+            try:
+                for entry in expand(raw):
+                    entries.setdefault(entry.key, entry)
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"{section}[{i}]: {e}") from None
+    return list(entries.values())
+
+
+class Pack:
+    """Paczka tylko do odczytu: indeks w słowniku, treści prosto z mmap."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self.mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, index_offset, index_length = HEADER.unpack_from(self._mm)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path}: to nie jest paczka katalogu")
+            self.index = json.loads(self._mm[index_offset:index_offset + index_length])
+        except (struct.error, ValueError):
+            self._mm.close()
+            raise
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def view(self, key):
+        """memoryview treści bez kopiowania albo None."""
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        offset, length = entry[0], entry[1]
+        return memoryview(self._mm)[offset:offset + length]
+
+    def get(self, key):
+        view = self.view(key)
+        return None if view is None else bytes(view)
+
+    def close(self):
+        self._mm.close()
+
+
+class CatalogStore:
+    """
+    Paczka podpięta pod serwer: otwierana leniwie i ponownie, gdy zmieni się
+    mtime pliku (przebudowa podmienia plik atomowo), jak assets.get_image.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path) if path else None
+        self._pack = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _current(self):
+        if self.path is None:
+            return None
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+        pack = self._pack
+        if pack is not None and pack.mtime_ns == mtime_ns:
+            return pack
+        with self._lock:
+            if self._pack is None or self._pack.mtime_ns != mtime_ns:
+                try:
+                    # starej paczki nie zamykamy – ktoś może właśnie z niej czytać
+                    self._pack = Pack(self.path)
+                except (OSError, ValueError) as e:
+                    log.warning("Nie można otworzyć paczki katalogu %s: %s", self.path, e)
+                    self._pack = None
+            return self._pack
+
+    def view(self, key):
+        """Treść jako memoryview na mmap paczki (bez kopii) albo None."""
+        pack = self._current()
+        data = pack.view(key) if pack is not None else None
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return data
+
+    def get(self, key):
+        view = self.view(key)
+        return None if view is None else bytes(view)
+
+    def stats(self):
+        pack = self._current()
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(pack) if pack is not None else 0,
+            }
+
+
+def _render_all(entries, workers):
+    """(wpis, bajty, błąd) dla każdego wpisu – w puli procesów lub szeregowo."""
+    import scheduler
+
+    jobs = [(entry.kind, entry.params) for entry in entries]
+    if workers > 1:
+        sched = scheduler.RenderScheduler(max_workers=workers)
+        try:
+            yield from ((e, data, err) for e, (data, err) in zip(entries, sched.map(jobs)))
+        finally:
+            sched.shutdown()
+        return
+    for entry, job in zip(entries, jobs):
+        try:
+            yield entry, scheduler.render_job(job), None
+        except Exception as e:
+            yield entry, None, e
+
+
+def build(entries, pack_path, *, workers=1, force=False):
+    """
+    Zapisuje paczkę z wpisami katalogu (atomowo, pod blokadą pliku .lock).
+    Wpisy obecne w starej paczce są kopiowane, reszta renderowana.
+    Zwraca statystyki: total, reused, rendered, failed, bytes, seconds.
+    """
+    pack_path = Path(pack_path)
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    with open(f"{pack_path}.lock", "w") as lock:
+        # kilka workerów gunicorna naraz: jeden buduje, reszta czeka i nic nie robi
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            old = None if force else Pack(pack_path)
+        except (OSError, ValueError):
+            old = None
+
+        stats = {"total": len(entries), "reused": 0, "rendered": 0, "failed": 0}
+        if old is not None and len(old) == len(entries) and all(e.key in old for e in entries):
+            stats.update(reused=len(entries), bytes=os.path.getsize(pack_path),
+                         seconds=round(time.perf_counter() - started, 3))
+            old.close()
+            return stats
+
+        index = {}
+        fd, tmp = tempfile.mkstemp(dir=pack_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"\0" * HEADER.size)
+
+                def add(entry, data):
+                    index[entry.key] = [f.tell(), len(data), entry.kind, list(entry.params)]
+                    f.write(data)
+
+                missing = []
+                for entry in entries:
+                    view = old.view(entry.key) if old is not None else None
+                    if view is None:
+                        missing.append(entry)
+                        continue
+                    add(entry, view)
+                    view.release()
+                    stats["reused"] += 1
+
+                for entry, data, error in _render_all(missing, workers):
+                    if error is not None:
+                        log.warning("Katalog: %s %s – %s", entry.kind, entry.params, error)
+                        stats["failed"] += 1
+                        continue
+                    add(entry, data)
+                    stats["rendered"] += 1
+
+                index_offset = f.tell()
+                raw_index = json.dumps(index, separators=(",", ":")).encode("utf-8")
+                f.write(raw_index)
+                f.seek(0)
+                f.write(HEADER.pack(MAGIC, index_offset, len(raw_index)))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, pack_path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        finally:
+            if old is not None:
+                old.close()
+    stats.update(bytes=os.path.getsize(pack_path), seconds=round(time.perf_counter() - started, 3))
+    return stats
+
+
+def warm_up(catalog_path, pack_path, workers=1):
+    """
+    Hak startowy serwera: przyrostowo dobudowuje paczkę z pliku katalogu.
+    Błędy tylko logujemy – serwer działa dalej, renderując na żądanie.
+    """
+    try:
+        stats = build(load_catalog(catalog_path), pack_path, workers=workers)
+    except Exception:
+        log.exception("Nie udało się zbudować paczki katalogu %s", pack_path)
+        return None
+    log.info("Katalog %s: %s", pack_path, stats)
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Paczka katalogowa standardowych rozmiarów")
+    parser.add_argument("catalog", help="plik katalogu (JSON)")
+    parser.add_argument("-o", "--output", required=True, help="plik paczki, np. catalog.pack")
+    parser.add_argument("--workers", type=int, default=1, help="procesy renderujące")
+    parser.add_argument("--force", action="store_true", help="renderuj wszystko od nowa")
+    args = parser.parse_args()
+
+    try:
+        entries = load_catalog(args.catalog)
+    except (OSError, ValueError) as e:
+        sys.exit(f"✗ {e}")
+    stats = build(entries, args.output, workers=args.workers, force=args.force)
+    print(f"✓ {args.output}: {stats['total']} wpisów, {stats['rendered']} wyrenderowanych, "
+          f"{stats['reused']} bez zmian, {stats['failed']} błędów, "
+          f"{stats['bytes'] / 1024:.0f} KiB, {stats['seconds']:.1f} s")
+    if stats["failed"]:
+        sys.exit(1)
@@ -2,10 +2,20 @@
 generator.py – rysuje siatkę pudełka (spód + oklejka) dokładnie wg logiki
 oryginalnego skryptu PackLib, ale bez żadnych bibliotek CAD.
 """
+import logging
+import re
 import svgwrite
-import base64
-from math import isclose
-from pathlib import Path
+import numpy as np
+from io import BytesIO
+
+from collections import namedtuple
+
+import assets
+import materials
+import metrics
+from segments_full import SEGMENTS
+
+log = logging.getLogger(__name__)
 
 # Stałe graficzne
 CUT_STROKE   = {'stroke': '#ff0000', 'stroke_width': '0.25mm', 'fill': 'none'}
@@ -16,92 +26,342 @@ FOLD_STROKE  = {
     'stroke_dasharray': '2,2'
 }
 
-LOGO_ASPECT = 672 / 1000  # height/width ratio of MB-print-logo11.png
+# Wersja wyjścia generatora – zmień przy każdej zmianie wyglądu PDF-a,
+# unieważnia zapisane w cache pliki
+GENERATOR_VERSION = "6"
 
-def _derived_vars(L, B, H, R, ep):
-    """przekładka BuildParameterStack + blok 'formulas' z Twojego skryptu"""
+# Tekst informacyjny: przeskalowanie, aby 5 linii zmieściło się w miejscu 3
+# Oryginalnie: gap 11mm, font 10mm. Mnożymy przez 0.6 (3/5)
+INFO_LINE_GAP = 6.6
+INFO_FONT_SIZE = 6
+
+# Jednostki dla backendu cairo
+PT_PER_MM = 72 / 25.4
+PX = 25.4 / 96  # 1 jednostka użytkownika SVG (px) w mm (CSS: 96 px na cal)
+
+# Stała data w metadanych PDF: te same parametry = te same bajty (ETag, cache)
+PDF_DATE = "2000-01-01T00:00:00Z"
+
+def _formulas(L, B, H, R, ep, m, where):
+    """
+    Wzory wspólne dla wersji skalarnej i tablicowej; m – profil tektury
+    (materials.Profile), where(warunek, a, b) – if/else albo np.where.
+    """
     H2 = H          # uproszczenie: H2 = H
     Ep = ep
-    L2 = B + 2*Ep + 2.5
-    B2 = L + 2*Ep + 2.5
-    B3 = B2 + 2*Ep + 1
-    V  = Ep - 0.45
+    L2 = B + 2*Ep + m.clearance
+    B2 = L + 2*Ep + m.clearance
+    B3 = B2 + 2*Ep + m.wrap_clearance
+    V  = Ep - m.groove_offset
     L3 = L2 + 2*Ep
     H3 = H2 + Ep
     R1 = R
     H1 = H + Ep
-    B1 = L + 2*Ep + 1.0
+    B1 = L + 2*Ep + m.wrap_clearance
     L1 = B + 2*Ep
-    V1, V2, V3 = 12, 3, Ep + 0.5
+    V1, V2, V3 = m.flap_v1, m.flap_v2, Ep + m.flap_v3
     Pdp = 30
     P1x = R1+H3+L3/2-(L2/2+H2)
     P2x = R1+H3+L3+H3+R1+Pdp
     P2y = R1+H3+B3/2-(B1/2+H1+R)
     P3x = P2x+R+H1+L1/2-(H+B/2)
-    if (R1+H3+B3/2) > (R+H1+B1/2):
-        P1y = R1+H3+B3+H3+R1+Pdp
-    else:
-        P1y = R+H1+B1+H1+R+Pdp
+    P1y = where((R1+H3+B3/2) > (R+H1+B1/2),
+                R1+H3+B3+H3+R1+Pdp,
+                R+H1+B1+H1+R+Pdp)
     P3y = P1y+H2+B2/2-(L/2+H)
+    del m, where
     return locals()  # zwraca słownik wszystkich zmiennych pomocniczych
 
+
+def _choose(cond, a, b):
+    return a if cond else b
+
+
+def _derived_vars(L, B, H, R, ep):
+    """przekładka BuildParameterStack + blok 'formulas' z Twojego skryptu"""
+    return _formulas(L, B, H, R, ep, materials.profile(ep), _choose)
+
+
+def derived_vars_array(L, B, H, R, ep):
+    """
+    _derived_vars dla całych tablic rozmiarów naraz (numpy, z broadcastingiem):
+    zwraca słownik {zmienna: tablica}. ep może być dowolną grubością –
+    profil tektury jest interpolowany (materials.profile_array).
+    """
+    L, B, H, R, ep = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (L, B, H, R, ep)))
+    return _formulas(L, B, H, R, ep, materials.profile_array(ep), np.where)
+
+_TERM_RE = re.compile(r"([+-]?)\s*([A-Za-z_]\w*|\d+(?:\.\d*)?|\.\d+)\s*")
+
+
+def _compile_segments(segments):
+    """
+    Kompiluje tabelę SEGMENTS (wyrażenia typu 'R1+H3+L3-V3') jednorazowo
+    do macierzy współczynników. Każde wyrażenie jest liniową sumą zmiennych
+    z _derived_vars i stałych, więc wiersz macierzy = współczynniki zmiennych
+    + wyraz wolny w ostatniej kolumnie.
+    Zwraca (kinds, names, coeffs) – coeffs ma kształt (4*N, len(names)+1).
+    """
+    rows = []
+    for _, *exprs in segments:
+        for expr in exprs:
+            terms = {}
+            pos = 0
+            src = expr.replace(" ", "")
+            while pos < len(src):
+                m = _TERM_RE.match(src, pos)
+                if not m or m.end() == pos or (pos and not m.group(1)):
+                    raise ValueError(f"Nieobsługiwane wyrażenie segmentu: {expr!r}")
+                sign = -1.0 if m.group(1) == "-" else 1.0
+                tok = m.group(2)
+                key = None if tok[0].isdigit() or tok[0] == "." else tok
+                val = sign * (float(tok) if key is None else 1.0)
+                terms[key] = terms.get(key, 0.0) + val
+                pos = m.end()
+            rows.append(terms)
+
+    names = sorted({k for terms in rows for k in terms if k is not None})
+    col = {name: i for i, name in enumerate(names)}
+    coeffs = np.zeros((len(rows), len(names) + 1))
+    for r, terms in enumerate(rows):
+        for key, val in terms.items():
+            coeffs[r, col[key] if key is not None else -1] = val
+
+    kinds = np.array([seg[0] for seg in segments])
+    return kinds, tuple(names), coeffs
+
+
+_SEG_KINDS, _SEG_VARS, _SEG_COEFFS = _compile_segments(SEGMENTS)
+
+
+def _segment_array(v):
+    """
+    Geometria całej siatki jednym iloczynem macierz × wektor.
+    Zwraca (kinds, coords): coords ma kształt (N, 4) = x0, y0, x1, y1,
+    odcinki o zerowej długości są już odfiltrowane.
+    """
+    vec = np.array([v[name] for name in _SEG_VARS] + [1.0], dtype=float)
+    coords = (_SEG_COEFFS @ vec).reshape(-1, 4)
+
+    # pomijamy zerowe długości (zabezpieczenie – float’y), semantyka
+    # math.isclose(a, b) z domyślnym rel_tol=1e-9
+    x0, y0, x1, y1 = coords.T
+    same_x = np.abs(x0 - x1) <= 1e-9 * np.maximum(np.abs(x0), np.abs(x1))
+    same_y = np.abs(y0 - y1) <= 1e-9 * np.maximum(np.abs(y0), np.abs(y1))
+    keep = ~(same_x & same_y)
+    return _SEG_KINDS[keep], coords[keep]
+
+
 def _segment_list(v):
     """
     1:1 port z PackLib – każda krotka: (CUT/FOLD, x0,y0,x1,y1)
-    ▸ Dla czytelności trzymam tu tylko kilkanaście pierwszych odcinków.
-    ▸ **PEŁNĄ** listę (160 + 82 + 162 = 404 segmenty) znajdziesz w pliku
-      `segments_full.py` – jest generowana automatem z Twojego źródła
-      i importowana tutaj, żeby kod główny pozostał przejrzysty.
-    """
-    from segments_full import SEGMENTS
-    # funkcje lambda w SEGMENTS odwołują się do słownika v
-    out = []
-    for kind, fx0, fy0, fx1, fy1 in SEGMENTS:
-        x0 = fx0(v) if callable(fx0) else fx0
-        y0 = fy0(v) if callable(fy0) else fy0
-        x1 = fx1(v) if callable(fx1) else fx1
-        y1 = fy1(v) if callable(fy1) else fy1
-        # pomijamy zerowe długości (zabezpieczenie – float’y)
-        if not isclose(x0, x1) or not isclose(y0, y1):
-            out.append((kind, x0, y0, x1, y1))
-    return out
+    Wyrażenia z `segments_full.py` (generowanego automatem z Twojego
+    źródła) są kompilowane raz przy imporcie – patrz _compile_segments.
+    """
+    kinds, coords = _segment_array(v)
+    return [(kind, *xy) for kind, xy in zip(kinds.tolist(), coords.tolist())]
+
+
+MergeStats = namedtuple("MergeStats", "segments edges polylines merged")
+
+
+def merge_segments(segs, tol=1e-6):
+    """
+    Łączy odcinki tego samego rodzaju w łamane:
+    1) odcinki współliniowe, nakładające się lub stykające się -> jeden odcinek
+       (duplikaty znikają),
+    2) odcinki o wspólnych końcach -> jedna łamana.
+    Zwraca ({kind: [[(x, y), ...], ...]}, MergeStats).
+    """
+    def q(val):
+        return round(val / tol)
+
+    lines = {}
+    for kind, x0, y0, x1, y1 in segs:
+        dx, dy = x1 - x0, y1 - y0
+        norm = (dx * dx + dy * dy) ** 0.5
+        ux, uy = dx / norm, dy / norm
+        if ux < -tol or (abs(ux) <= tol and uy < 0):
+            ux, uy = -ux, -uy
+        # prosta: kierunek + odległość od początku układu
+        key = (kind, q(ux), q(uy), q(x0 * uy - y0 * ux))
+        t0, t1 = sorted((x0 * ux + y0 * uy, x1 * ux + y1 * uy))
+        lines.setdefault(key, (ux, uy, x0, y0, []))[4].append((t0, t1))
+
+    edges = {}
+    for (kind, *_), (ux, uy, px, py, spans) in lines.items():
+        spans.sort()
+        merged = [list(spans[0])]
+        for t0, t1 in spans[1:]:
+            if t0 <= merged[-1][1] + tol:
+                merged[-1][1] = max(merged[-1][1], t1)
+            else:
+                merged.append([t0, t1])
+        # punkt na prostej najbliższy początkowi układu
+        base = px * ux + py * uy
+        ox, oy = px - base * ux, py - base * uy
+        for t0, t1 in merged:
+            edges.setdefault(kind, []).append(
+                ((ox + t0 * ux, oy + t0 * uy), (ox + t1 * ux, oy + t1 * uy))
+            )
+
+    paths = {}
+    n_edges = 0
+    for kind, kind_edges in edges.items():
+        n_edges += len(kind_edges)
+        adj = {}
+        for i, (a, b) in enumerate(kind_edges):
+            adj.setdefault((q(a[0]), q(a[1])), []).append(i)
+            adj.setdefault((q(b[0]), q(b[1])), []).append(i)
+        used = [False] * len(kind_edges)
+
+        def walk(start_i, point):
+            poly = [point]
+            i = start_i
+            while i is not None:
+                used[i] = True
+                a, b = kind_edges[i]
+                point = b if (q(a[0]), q(a[1])) == (q(point[0]), q(point[1])) else a
+                poly.append(point)
+                i = next((j for j in adj[(q(point[0]), q(point[1]))] if not used[j]), None)
+            return poly
+
+        polys = []
+        # najpierw od końców (wierzchołki nieparzystego stopnia), potem pętle
+        for node, ids in sorted(adj.items()):
+            if len(ids) % 2:
+                for i in ids:
+                    if not used[i]:
+                        a, b = kind_edges[i]
+                        polys.append(walk(i, a if (q(a[0]), q(a[1])) == node else b))
+        for i, (a, b) in enumerate(kind_edges):
+            if not used[i]:
+                polys.append(walk(i, a))
+        paths[kind] = polys
+
+    stats = MergeStats(len(segs), n_edges, sum(len(p) for p in paths.values()), len(segs) - n_edges)
+    log.debug("merge: %d odcinków -> %d krawędzi w %d łamanych (scalono %d)",
+              stats.segments, stats.edges, stats.polylines, stats.merged)
+    return paths, stats
+
+
+def _path_data(polys, scale=1.0):
+    """Atrybut d ścieżki SVG: 'M x,y L x,y x,y M ...'."""
+    def num(val):
+        return f"{val * scale:.3f}".rstrip("0").rstrip(".")
+    return " ".join(
+        f"M{num(p[0][0])},{num(p[0][1])} L" + " ".join(f"{num(x)},{num(y)}" for x, y in p[1:])
+        for p in polys
+    )
 
 
 def external_dims(L: float, B: float, H: float, ep: float):
     """Compute external box dimensions used in the info label."""
-    if ep == 1:
-        add_x, add_y = 6, 6
-    elif ep == 1.5:
-        add_x, add_y = 8, 8
-    elif ep == 2:
-        add_x, add_y = 10, 10
-    else:
-        add_x = add_y = 0
+    add = materials.profile(ep).external_allowance
     return (
-        round(L + add_x, 1),
-        round(B + add_y, 1),
+        round(L + add, 1),
+        round(B + add, 1),
         round(H + ep, 1),
     )
 
-def svg_bytes_from_params(
-    L: float,
-    B: float,
-    H: float,
-    R: float,
-    ep: float,
-    *,
-    logo_path: str | None = None,
-    ext_dims: tuple | None = None,
-):
-    """Return SVG drawing bytes of the box layout with margins and labels."""
-    v = _derived_vars(L, B, H, R, ep)
-    segs = _segment_list(v)
 
-    # Determine bounding box of generated segments
+def external_dims_array(L, B, H, ep):
+    """external_dims dla tablic rozmiarów -> tablica (..., 3): X, Y, Z zewnętrzne."""
+    L, B, H, ep = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (L, B, H, ep)))
+    add = materials.profile_array(ep).external_allowance
+    return np.round(np.stack([L + add, B + add, H + ep], axis=-1), 1)
+
+
+def net_size_array(L, B, H, R, ep, chunk=4096):
+    """
+    Wymiary siatki (szerokość, wysokość) w mm dla tablic rozmiarów naraz –
+    te same współczynniki segmentów co _segment_array, bez budowania odcinków.
+    Zwraca tablicę (n, 2); wejście spłaszczane do jednego wymiaru.
+    """
+    v = derived_vars_array(L, B, H, R, ep)
+    n = v["L"].size
+    cols = np.stack([v[name].ravel() for name in _SEG_VARS] + [np.ones(n)], axis=1)
+    out = np.empty((n, 2))
+    for start in range(0, n, chunk):
+        coords = (cols[start:start + chunk] @ _SEG_COEFFS.T).reshape(-1, len(_SEG_KINDS), 4)
+        x0, y0, x1, y1 = np.moveaxis(coords, -1, 0)
+        # odcinki zerowej długości pomijamy jak w _segment_array
+        same_x = np.abs(x0 - x1) <= 1e-9 * np.maximum(np.abs(x0), np.abs(x1))
+        same_y = np.abs(y0 - y1) <= 1e-9 * np.maximum(np.abs(y0), np.abs(y1))
+        keep = ~(same_x & same_y)
+        xs = np.where(keep[..., None], np.stack([x0, x1], axis=-1), np.nan)
+        ys = np.where(keep[..., None], np.stack([y0, y1], axis=-1), np.nan)
+        out[start:start + chunk, 0] = np.nanmax(xs, axis=(1, 2)) - np.nanmin(xs, axis=(1, 2))
+        out[start:start + chunk, 1] = np.nanmax(ys, axis=(1, 2)) - np.nanmin(ys, axis=(1, 2))
+    return out
+
+def box_file_name(L, B, H, ep, ext="pdf"):
+    """Nazwa pobieranego pliku, np. Box_100x70x30_2mm.pdf."""
+    return f"Box_{L:g}x{B:g}x{H:g}_{ep:g}mm.{ext}"
+
+
+def segment_bounds(segs):
+    """Prostokąt otaczający odcinki: (min_x, min_y, max_x, max_y) w mm."""
     min_x = min(min(x0, x1) for _, x0, _, x1, _ in segs)
     min_y = min(min(y0, y1) for _, _, y0, _, y1 in segs)
     max_x = max(max(x0, x1) for _, x0, _, x1, _ in segs)
     max_y = max(max(y0, y1) for _, _, y0, _, y1 in segs)
+    return min_x, min_y, max_x, max_y
+
+
+def box_segments(L, B, H, R, ep):
+    """Odcinki siatki pudełka (CUT/FOLD, x0, y0, x1, y1) w mm."""
+    with metrics.stage("box.derived_vars"):
+        v = _derived_vars(L, B, H, R, ep)
+    with metrics.stage("box.segments"):
+        return _segment_list(v)
+
+
+def preview_geometry(L, B, H, R, ep, decimals=2):
+    """
+    Lekka geometria do podglądu w przeglądarce (bez łączenia w łamane, bez
+    strony i logo): {"bounds": [min_x, min_y, max_x, max_y], "external": [...],
+    "cut": [[x0, y0, x1, y1], ...], "fold": [...]} w mm, zaokrąglone do decimals.
+    """
+    with metrics.stage("box.derived_vars"):
+        v = _derived_vars(L, B, H, R, ep)
+    with metrics.stage("box.segments"):
+        kinds, coords = _segment_array(v)
+    coords = np.round(coords, decimals)
+    xs, ys = coords[:, 0::2], coords[:, 1::2]
+    return {
+        "bounds": [float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())],
+        "external": list(external_dims(L, B, H, ep)),
+        "cut": coords[kinds == "CUT"].tolist(),
+        "fold": coords[kinds == "FOLD"].tolist(),
+    }
+
+
+def preview_svg(geom):
+    """Minimalny SVG podglądu z preview_geometry: dwie ścieżki, viewBox w mm."""
+    min_x, min_y, max_x, max_y = geom["bounds"]
+    pad = 0.02 * max(max_x - min_x, max_y - min_y)
+
+    def d(segs):
+        return "".join(f"M{x0:g} {y0:g}L{x1:g} {y1:g}" for x0, y0, x1, y1 in segs)
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" '
+        f'viewBox="{min_x - pad:g} {min_y - pad:g} {max_x - min_x + 2 * pad:g} {max_y - min_y + 2 * pad:g}">'
+        f'<path d="{d(geom["cut"])}" fill="none" stroke="#ff0000" stroke-width="0.5" '
+        f'vector-effect="non-scaling-stroke"/>'
+        f'<path d="{d(geom["fold"])}" fill="none" stroke="#0000ff" stroke-width="0.5" '
+        f'stroke-dasharray="2,2" vector-effect="non-scaling-stroke"/>'
+        f'</svg>'
+    )
+
+
+def _page_layout(L, B, H, R, ep):
+    """Segmenty siatki + geometria strony: (segs, min_x, min_y, margin, dwg_w, dwg_h) w mm."""
+    segs = box_segments(L, B, H, R, ep)
+
+    # Determine bounding box of generated segments
+    min_x, min_y, max_x, max_y = segment_bounds(segs)
 
     width = max_x - min_x
     height = max_y - min_y
@@ -110,6 +370,54 @@ def svg_bytes_from_params(
 
     dwg_w = width + 2 * margin
     dwg_h = height + 2 * margin
+    return segs, min_x, min_y, margin, dwg_w, dwg_h
+
+
+def page_size(L, B, H, R, ep):
+    """
+    (dwg_w, dwg_h) strony w mm jak w _page_layout, ale bez budowania listy
+    odcinków – tylko macierz segmentów (do walidacji przed renderem).
+    """
+    _, coords = _segment_array(_derived_vars(L, B, H, R, ep))
+    xs, ys = coords[:, 0::2], coords[:, 1::2]
+    margin = 0.5 * H
+    return (float(xs.max() - xs.min()) + 2 * margin,
+            float(ys.max() - ys.min()) + 2 * margin)
+
+
+def _info_lines(L, B, H, ext_dims):
+    # Definicja 5 linii tekstu zgodnie z instrukcją
+    return [
+        "Inner Size:",                                     # Nowy napis
+        f"{L:g}×{B:g}×{H:g} mm",                                 # Dawna linia 1
+        "Outer Size:",                                     # Nowy napis
+        f"{ext_dims[0]:g}×{ext_dims[1]:g}×{ext_dims[2]:g} mm",   # Dawna linia 2
+        "www.mbprint.pl"                                         # Dawna linia 3
+    ]
+
+
+def _logo_box(dwg_w, H, aspect):
+    """Logo w prawym górnym rogu: (x, y, w, h) w mm; aspect = wysokość / szerokość."""
+    # Scale logo to height Z*1.5 while keeping aspect ratio
+    logo_h = H * 1
+    logo_w = logo_h / aspect
+    # offset from page edges (in mm)
+    offset = 0
+    return dwg_w - logo_w - offset, offset, logo_w, logo_h
+
+
+def svg_bytes_from_params(
+    L: float,
+    B: float,
+    H: float,
+    R: float,
+    ep: float,
+    *,
+    logo_path: str | None = None,
+    ext_dims: tuple | None = None,
+):
+    """Return SVG drawing bytes of the box layout with margins and labels."""
+    segs, min_x, min_y, margin, dwg_w, dwg_h = _page_layout(L, B, H, R, ep)
 
     dwg = svgwrite.Drawing(size=(f"{dwg_w}mm", f"{dwg_h}mm"), profile="tiny")
 
@@ -133,21 +441,11 @@ def svg_bytes_from_params(
 
 # Informational text on top margin split into five lines
     if ext_dims is not None:
-        # Definicja 5 linii tekstu zgodnie z instrukcją
-        texts = [
-            "Inner Size:",                                     # Nowy napis
-            f"{L:g}×{B:g}×{H:g} mm",                                 # Dawna linia 1
-            "Outer Size:",                                     # Nowy napis
-            f"{ext_dims[0]:g}×{ext_dims[1]:g}×{ext_dims[2]:g} mm",   # Dawna linia 2
-            "www.mbprint.pl"                                         # Dawna linia 3
-        ]
+        texts = _info_lines(L, B, H, ext_dims)
 
         base_y = margin / 3
-        
-        # Przeskalowanie, aby 5 linii zmieściło się w miejscu 3
-        # Oryginalnie: gap 11mm, font 10mm. Mnożymy przez 0.6 (3/5)
-        line_gap = 6.6  
-        current_font_size = 6 
+        line_gap = INFO_LINE_GAP
+        current_font_size = INFO_FONT_SIZE
 
         for i, txt in enumerate(texts):
             dwg.add(
@@ -166,37 +464,178 @@ def svg_bytes_from_params(
     cut_layer = content.add(dwg.g(id="CUT", **CUT_STROKE))
     fold_layer = content.add(dwg.g(id="FOLD", **FOLD_STROKE))
 
-    for kind, x0, y0, x1, y1 in segs:
-        layer = cut_layer if kind == "CUT" else fold_layer
-        layer.add(
-            dwg.line(
-                start=(f"{x0}mm", f"{y0}mm"),
-                end=(f"{x1}mm", f"{y1}mm"),
-            )
-        )
+    # jedna ścieżka na warstwę; d nie ma jednostek (px), stąd skala mm -> px
+    with metrics.stage("box.merge"):
+        paths, _ = merge_segments(segs)
+    for kind, layer in (("CUT", cut_layer), ("FOLD", fold_layer)):
+        if paths.get(kind):
+            layer.add(dwg.path(d=_path_data(paths[kind], 1 / PX)))
 
     dwg.add(content)
 
     # Position logo in the upper right corner if provided
-    if logo_path:
-        logo_file = Path(logo_path)
-        if logo_file.exists():
-            b64 = base64.b64encode(logo_file.read_bytes()).decode()
-            # Scale logo to height Z*1.5 while keeping aspect ratio
-            logo_h = H * 1
-            logo_w = logo_h / LOGO_ASPECT
-            # offset from page edges (in mm)
-            offset = 0
-            logo_x = dwg_w - logo_w - offset
-            logo_y = offset
-            dwg.add(
-                dwg.image(
-                    href=f"data:image/png;base64,{b64}",
-                    insert=(f"{logo_x}mm", f"{logo_y}mm"),
-                    size=(f"{logo_w}mm", f"{logo_h}mm"),
-                )
+    logo = assets.get_image(logo_path) if logo_path else None
+    if logo:
+        logo_x, logo_y, logo_w, logo_h = _logo_box(dwg_w, H, logo.aspect)
+        dwg.add(
+            dwg.image(
+                href=logo.data_uri,
+                insert=(f"{logo_x}mm", f"{logo_y}mm"),
+                size=(f"{logo_w}mm", f"{logo_h}mm"),
             )
+        )
+
+    with metrics.stage("box.svg_serialize"):
+        return dwg.tostring().encode("utf-8")
+
+
+def pdf_surface(target, width_pt, height_pt):
+    """
+    cairo.PDFSurface z ustaloną datą utworzenia/modyfikacji – cairo wpisuje
+    inaczej bieżący czas i dwa rendery tych samych parametrów różnią się bajtami.
+    """
+    import cairo
+
+    surface = cairo.PDFSurface(target, width_pt, height_pt)
+    surface.set_metadata(cairo.PDFMetadata.CREATE_DATE, PDF_DATE)
+    surface.set_metadata(cairo.PDFMetadata.MOD_DATE, PDF_DATE)
+    return surface
+
+
+def _cairo_image(asset):
+    import cairo
+
+    return cairo.ImageSurface.create_from_png(BytesIO(asset.data))
+
+
+def _draw_box(ctx, L, B, H, R, ep, layout, *, logo_path=None, ext_dims=None):
+    """Rysuje siatkę na kontekście cairo ustawionym w mm (warstwy jak w SVG)."""
+    segs, min_x, min_y, margin, dwg_w, dwg_h = layout
+
+    if ext_dims is not None:
+        ctx.select_font_face("sans-serif")
+        ctx.set_font_size(INFO_FONT_SIZE)
+        ctx.set_source_rgb(0, 0, 0)
+        base_y = margin / 3
+        for i, txt in enumerate(_info_lines(L, B, H, ext_dims)):
+            # text-anchor="middle" liczy się od szerokości przesunięcia
+            ctx.move_to(dwg_w / 2 - ctx.text_extents(txt).x_advance / 2,
+                        base_y + i * INFO_LINE_GAP)
+            ctx.show_text(txt)
+
+    # translate(...) w SVG nie ma jednostek, więc działa w px – zachowujemy to
+    ctx.save()
+    ctx.translate((margin - min_x) * PX, (margin - min_y) * PX)
+    ctx.set_line_width(0.25)
+    with metrics.stage("box.merge"):
+        paths, _ = merge_segments(segs)
+    for kind, rgb, dash in (("CUT", (1, 0, 0), ()), ("FOLD", (0, 0, 1), (2 * PX, 2 * PX))):
+        for poly in paths.get(kind, ()):
+            ctx.move_to(*poly[0])
+            for point in poly[1:]:
+                ctx.line_to(*point)
+        ctx.set_source_rgb(*rgb)
+        ctx.set_dash(dash)
+        ctx.stroke()
+    ctx.restore()
+
+    logo = assets.get_image(logo_path) if logo_path else None
+    if logo:
+        image = logo.derived("cairo", _cairo_image)
+        logo_x, logo_y, logo_w, logo_h = _logo_box(dwg_w, H, logo.aspect)
+        ctx.save()
+        ctx.translate(logo_x, logo_y)
+        ctx.scale(logo_w / image.get_width(), logo_h / image.get_height())
+        ctx.set_source_surface(image, 0, 0)
+        ctx.paint()
+        ctx.restore()
+
+
+def pdf_bytes_from_params(
+    L: float,
+    B: float,
+    H: float,
+    R: float,
+    ep: float,
+    *,
+    logo_path: str | None = None,
+    ext_dims: tuple | None = None,
+):
+    """Return PDF bytes of the box layout drawn directly with pycairo (no SVG round-trip)."""
+    import cairo
+
+    layout = _page_layout(L, B, H, R, ep)
+    dwg_w, dwg_h = layout[4], layout[5]
+
+    buf = BytesIO()
+    surface = pdf_surface(buf, dwg_w * PT_PER_MM, dwg_h * PT_PER_MM)
+    ctx = cairo.Context(surface)
+    ctx.scale(PT_PER_MM, PT_PER_MM)
+    with metrics.stage("box.pdf_draw"):
+        _draw_box(ctx, L, B, H, R, ep, layout, logo_path=logo_path, ext_dims=ext_dims)
+    with metrics.stage("box.pdf_finish"):
+        surface.finish()
+    return buf.getvalue()
+
+
+def pdf_pages_from_params(rows, target, *, logo_path=None, summary=None):
+    """
+    Wielostronicowy PDF: jedna siatka na stronę, strona ma rozmiar swojej siatki.
+    rows – iterowalne krotki (L, B, H, R, ep); wynik trafia do obiektu plikowego
+    target w miarę rysowania. Generator: po każdym wierszu zwraca
+    (indeks, wyjątek lub None) – błędny wiersz nie przerywa całości. Stronę
+    rysujemy najpierw na RecordingSurface i przenosimy (wektorowo) dopiero
+    po udanym rysunku, więc wyjątek w _draw_box pomija wiersz tak samo jak
+    błąd układu, zamiast urwać strumień w połowie strony.
+    summary – opcjonalna funkcja zwracająca linie tekstu na ostatnią stronę A4
+    (np. raport błędów); pusta lista = bez dodatkowej strony.
+    """
+    import cairo
+
+    surface = ctx = None
+    for i, (L, B, H, R, ep) in enumerate(rows):
+        try:
+            layout = _page_layout(L, B, H, R, ep)
+            ext_dims = external_dims(L, B, H, ep)
+            w_pt, h_pt = layout[4] * PT_PER_MM, layout[5] * PT_PER_MM
+            page = cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, cairo.Rectangle(0, 0, w_pt, h_pt))
+            page_ctx = cairo.Context(page)
+            page_ctx.scale(PT_PER_MM, PT_PER_MM)
+            with metrics.stage("box.pdf_draw"):
+                _draw_box(page_ctx, L, B, H, R, ep, layout, logo_path=logo_path, ext_dims=ext_dims)
+            page.flush()
+        except Exception as e:
+            yield i, e
+            continue
 
-    return dwg.tostring().encode("utf-8")
+        if surface is None:
+            surface = pdf_surface(target, w_pt, h_pt)
+            ctx = cairo.Context(surface)
+        else:
+            surface.set_size(w_pt, h_pt)
+        ctx.set_source_surface(page, 0, 0)
+        ctx.paint()
+        ctx.show_page()
+        yield i, None
 
+    lines = summary() if summary is not None else []
+    if lines:
+        a4_w, a4_h = 210 * PT_PER_MM, 297 * PT_PER_MM
+        if surface is None:
+            surface = pdf_surface(target, a4_w, a4_h)
+            ctx = cairo.Context(surface)
+        else:
+            surface.set_size(a4_w, a4_h)
+        ctx.save()
+        ctx.scale(PT_PER_MM, PT_PER_MM)
+        ctx.select_font_face("sans-serif")
+        ctx.set_font_size(4)
+        ctx.set_source_rgb(0, 0, 0)
+        for n, txt in enumerate(lines):
+            ctx.move_to(15, 20 + n * 6)
+            ctx.show_text(txt)
+        ctx.restore()
+        ctx.show_page()
 
+    if surface is not None:
+        surface.finish()
@@ -0,0 +1,263 @@
+"""
+imposition.py – montaż wielu siatek pudełek na arkuszu drukarskim.
+
+Każda siatka zajmuje prostokąt otaczający jej odcinki (generator.segment_bounds).
+Prostokąty układamy algorytmem skyline (bottom-left) z opcjonalnym obrotem
+o 90°, otwierając kolejne arkusze, gdy miejsce się kończy. Po ułożeniu
+wspólne krawędzie sąsiednich siatek są scalane (generator.merge_segments),
+więc wspólną linię cięcia nóż przechodzi tylko raz.
+
+Użycie:
+    python imposition.py rozmiary.csv --sheet SRA3 -o arkusze.pdf
+    python imposition.py rozmiary.csv --sheet B1 --gap 0 --no-rotate
+"""
+import argparse
+import sys
+import time
+from collections import namedtuple
+
+import generator
+
+# arkusze (szerokość, wysokość) w mm
+SHEETS = {
+    "A3": (297, 420),
+    "SRA3": (320, 450),
+    "SRA2": (450, 640),
+    "B2": (500, 707),
+    "B1": (707, 1000),
+    "SRA1": (640, 900),
+}
+
+Net = namedtuple("Net", "params segs width height cut_length")
+Placement = namedtuple("Placement", "net x y width height rotated")
+Sheet = namedtuple("Sheet", "width height placements utilization")
+
+
+def _length(polys):
+    return sum(((b[0] - a[0]) ** 2 + (b[1] - a[1]) ** 2) ** 0.5
+               for poly in polys for a, b in zip(poly, poly[1:]))
+
+
+def make_nets(param_rows):
+    """
+    Krotki (L, B, H, R, ep) -> lista Net; odcinki przesunięte do (0, 0),
+    cut_length to długość cięcia pojedynczej siatki (po scaleniu).
+    """
+    cache = {}
+    nets = []
+    for params in param_rows:
+        if params not in cache:
+            segs = generator.box_segments(*params)
+            min_x, min_y, max_x, max_y = generator.segment_bounds(segs)
+            local = [(k, x0 - min_x, y0 - min_y, x1 - min_x, y1 - min_y) for k, x0, y0, x1, y1 in segs]
+            paths, _ = generator.merge_segments(local)
+            cache[params] = Net(params, local, max_x - min_x, max_y - min_y, _length(paths.get("CUT", [])))
+        nets.append(cache[params])
+    return nets
+
+
+class _Skyline:
+    """Linia horyzontu [(x, y, szerokość), ...] pasa o szerokości width."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.segments = [(0.0, 0.0, width)]
+
+    def find(self, w, h):
+        """Najniższe (potem najbardziej lewe) miejsce dla w×h: (top, x, y, i) albo None."""
+        best = None
+        segs = self.segments
+        for i, (x, _, _) in enumerate(segs):
+            if x + w > self.width + 1e-9:
+                break
+            y, j, right = 0.0, i, x
+            while right < x + w - 1e-9:
+                sx, sy, sw = segs[j]
+                y = max(y, sy)
+                right = sx + sw
+                j += 1
+            if y + h <= self.height + 1e-9:
+                cand = (y + h, x, y, i)
+                if best is None or cand < best:
+                    best = cand
+        return best
+
+    def place(self, i, x, y, w, h):
+        segs = self.segments
+        new = [(x, y + h, w)]
+        end = x + w
+        j = i
+        while j < len(segs) and segs[j][0] < end - 1e-9:
+            sx, sy, sw = segs[j]
+            if sx + sw > end + 1e-9:
+                # segment wystaje za nowy – zostaje jego prawa część
+                new.append((end, sy, sx + sw - end))
+            j += 1
+        segs[i:j] = new
+        # scalamy sąsiadów o tej samej wysokości
+        merged = []
+        for seg in segs:
+            if merged and abs(merged[-1][1] - seg[1]) < 1e-9:
+                px, py, pw = merged[-1]
+                merged[-1] = (px, py, pw + seg[2])
+            else:
+                merged.append(seg)
+        self.segments = merged
+
+
+def impose(nets, sheet="SRA3", *, rotate=True, gap=0.0, margin=10.0):
+    """
+    Układa siatki na arkuszach. sheet – nazwa z SHEETS albo (szer, wys) w mm,
+    gap – odstęp między siatkami, margin – margines arkusza.
+    Zwraca listę Sheet; siatka większa niż arkusz podnosi ValueError.
+    """
+    sheet_w, sheet_h = SHEETS[sheet] if isinstance(sheet, str) else sheet
+    # odstęp doliczamy do każdego prostokąta i do obszaru roboczego
+    area_w = sheet_w - 2 * margin + gap
+    area_h = sheet_h - 2 * margin + gap
+
+    order = sorted(range(len(nets)), key=lambda n: (-max(nets[n].width, nets[n].height),
+                                                    -nets[n].width * nets[n].height))
+    sheets = []   # [(skyline, placements)]
+    for n in order:
+        net = nets[n]
+        options = [(net.width, net.height, False)]
+        if rotate and abs(net.width - net.height) > 1e-9:
+            options.append((net.height, net.width, True))
+
+        # pierwszy arkusz, na którym siatka się mieści; w ostateczności nowy
+        for skyline, placements in sheets + [(_Skyline(area_w, area_h), [])]:
+            best = None
+            for w, h, rotated in options:
+                spot = skyline.find(w + gap, h + gap)
+                if spot and (best is None or spot < best[0]):
+                    best = (spot, w, h, rotated)
+            if best is not None:
+                break
+        else:
+            raise ValueError(f"Siatka {net.width:.1f}×{net.height:.1f} mm nie mieści się na arkuszu "
+                             f"{sheet_w}×{sheet_h} mm")
+
+        (_, x, y, i), w, h, rotated = best
+        skyline.place(i, x, y, w + gap, h + gap)
+        if not placements:
+            sheets.append((skyline, placements))
+        placements.append(Placement(n, margin + x, margin + y, w, h, rotated))
+
+    result = []
+    for _, placements in sheets:
+        used = sum(p.width * p.height for p in placements)
+        result.append(Sheet(sheet_w, sheet_h, placements, used / (sheet_w * sheet_h)))
+    return result
+
+
+def sheet_segments(sheet, nets):
+    """
+    Odcinki wszystkich siatek arkusza we współrzędnych arkusza
+    (obrót o 90° zgodnie z ruchem wskazówek zegara).
+    """
+    out = []
+    for p in sheet.placements:
+        net = nets[p.net]
+        for k, x0, y0, x1, y1 in net.segs:
+            if p.rotated:
+                x0, y0, x1, y1 = net.height - y0, x0, net.height - y1, x1
+            out.append((k, p.x + x0, p.y + y0, p.x + x1, p.y + y1))
+    return out
+
+
+def sheet_paths(sheet, nets):
+    """
+    Scalone łamane arkusza: wspólne krawędzie sąsiadów liczone raz.
+    Zwraca (paths, stats) – stats zawiera m.in. zaoszczędzoną długość cięcia.
+    """
+    paths, merge = generator.merge_segments(sheet_segments(sheet, nets))
+    raw_cut = sum(nets[p.net].cut_length for p in sheet.placements)
+    cut = _length(paths.get("CUT", []))
+    return paths, {
+        "segments": merge.segments,
+        "merged": merge.merged,
+        "cut_length_mm": round(cut, 1),
+        "shared_cut_mm": round(raw_cut - cut, 1),
+    }
+
+
+def render_pdf(sheets, nets, target):
+    """Arkusze jako wielostronicowy PDF (cairo) zapisany do obiektu plikowego."""
+    import cairo
+
+    mm = generator.PT_PER_MM
+    surface = None
+    for sheet in sheets:
+        if surface is None:
+            surface = generator.pdf_surface(target, sheet.width * mm, sheet.height * mm)
+            ctx = cairo.Context(surface)
+        else:
+            surface.set_size(sheet.width * mm, sheet.height * mm)
+        paths, _ = sheet_paths(sheet, nets)
+        ctx.save()
+        ctx.scale(mm, mm)
+        ctx.set_line_width(0.25)
+        for kind, rgb, dash in (("CUT", (1, 0, 0), ()), ("FOLD", (0, 0, 1), (2 * generator.PX,) * 2)):
+            for poly in paths.get(kind, ()):
+                ctx.move_to(*poly[0])
+                for point in poly[1:]:
+                    ctx.line_to(*point)
+            ctx.set_source_rgb(*rgb)
+            ctx.set_dash(dash)
+            ctx.stroke()
+        ctx.restore()
+        ctx.show_page()
+    if surface is not None:
+        surface.finish()
+
+
+if __name__ == "__main__":
+    import batch
+
+    parser = argparse.ArgumentParser(description="Montaż siatek pudełek na arkuszu")
+    parser.add_argument("source", help="plik CSV lub JSON z kolumnami L, B, H, R, ep1 (opcjonalnie qty)")
+    parser.add_argument("--sheet", default="SRA3", help=f"{', '.join(SHEETS)} albo SZERxWYS w mm")
+    parser.add_argument("--gap", type=float, default=0.0, help="odstęp między siatkami [mm]")
+    parser.add_argument("--margin", type=float, default=10.0, help="margines arkusza [mm]")
+    parser.add_argument("--no-rotate", action="store_true", help="bez obracania siatek")
+    parser.add_argument("--copies", type=int, default=1, help="ile razy powtórzyć każdy wiersz")
+    parser.add_argument("-o", "--output", help="plik PDF z arkuszami")
+    parser.add_argument("-v", "--verbose", action="store_true", help="statystyki każdego arkusza")
+    args = parser.parse_args()
+
+    sheet = args.sheet.upper()
+    if sheet not in SHEETS:
+        sheet = tuple(float(v) for v in sheet.split("X"))
+
+    with open(args.source, encoding="utf-8-sig") as f:
+        text = f.read()
+    rows = batch.parse_rows(text, "json" if args.source.lower().endswith(".json") else None)
+    for row in rows:
+        if row.error:
+            print(f"✗ wiersz {row.index + 1}: {row.error}", file=sys.stderr)
+
+    t0 = time.perf_counter()
+    nets = make_nets([r.params for r in rows if r.error is None] * args.copies)
+    try:
+        sheets = impose(nets, sheet, rotate=not args.no_rotate, gap=args.gap, margin=args.margin)
+    except ValueError as e:
+        sys.exit(f"✗ {e}")
+    t_pack = time.perf_counter() - t0
+    print(f"✓ {len(nets)} siatek na {len(sheets)} arkuszach ({t_pack * 1000:.0f} ms)")
+    cut = shared = 0.0
+    for n, s in enumerate(sheets, 1):
+        _, stats = sheet_paths(s, nets)
+        cut += stats["cut_length_mm"]
+        shared += stats["shared_cut_mm"]
+        if args.verbose:
+            print(f"  arkusz {n}: {len(s.placements)} siatek, wykorzystanie {s.utilization:.1%}, "
+                  f"cięcie {stats['cut_length_mm']:.0f} mm (wspólne krawędzie -{stats['shared_cut_mm']:.0f} mm)")
+    print(f"  wykorzystanie średnio {sum(s.utilization for s in sheets) / len(sheets):.1%}, "
+          f"cięcie {cut / 1000:.2f} m (wspólne krawędzie -{shared / 1000:.2f} m)")
+
+    if args.output:
+        with open(args.output, "wb") as f:
+            render_pdf(sheets, nets, f)
+        print(f"✓ zapisano {args.output}")
@@ -0,0 +1,172 @@
+"""
+job_store.py – stan i wyniki zadań asynchronicznych wspólne dla wszystkich workerów.
+
+Zadanie przyjmuje jeden worker gunicorna, a GET /jobs/<id>, /events i
+/result może trafić do dowolnego innego. JobQueue zapisuje więc tutaj każdą
+zmianę stanu (postęp najwyżej co jobs.PROGRESS_INTERVAL s) i gotowy wynik,
+a zadania, których nie ma we własnej pamięci, czyta z bazy.
+
+Jeden plik SQLite na maszynę/wolumin, jak render_store.py: tryb WAL,
+zapis w BEGIN IMMEDIATE z busy_timeout, połączenie na wątek i proces.
+Przy zapisie wyniku usuwane są zadania zakończone ponad ttl s temu,
+porzucone (bez zmiany stanu przez ttl s – np. worker zginął w trakcie)
+i najstarsze zakończone, gdy wyniki razem przekraczają max_bytes. Błąd bazy
+nigdy nie psuje żądania: odczyt jest wtedy brakiem zadania (404), a zapis
+jest pomijany (ostrzeżenie w logu).
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from jobs import Job, JobResult
+
+log = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+BUSY_TIMEOUT = 5.0  # s czekania na blokadę zapisu innego workera
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id       TEXT PRIMARY KEY,
+    kind     TEXT NOT NULL,
+    status   TEXT NOT NULL,
+    done     INTEGER NOT NULL,
+    total    INTEGER NOT NULL,
+    error    TEXT,
+    created  REAL NOT NULL,
+    started  REAL,
+    finished REAL,
+    version  INTEGER NOT NULL,
+    updated  REAL NOT NULL,
+    data     BLOB,
+    mimetype TEXT,
+    filename TEXT,
+    size     INTEGER
+);
+CREATE INDEX IF NOT EXISTS jobs_updated ON jobs (updated);
+"""
+
+_STATE = ("id", "kind", "status", "done", "total", "error", "created", "started", "finished", "version")
+_UPSERT = (f"INSERT INTO jobs ({', '.join(_STATE)}, updated) VALUES ({', '.join('?' * (len(_STATE) + 1))}) "
+           f"ON CONFLICT (id) DO UPDATE SET "
+           f"{', '.join(f'{c} = excluded.{c}' for c in _STATE[1:])}, updated = excluded.updated")
+
+
+class JobStore:
+    """Zadania po id w jednym pliku SQLite; wyniki najwyżej ttl s i max_bytes łącznie."""
+
+    def __init__(self, path, ttl=600, max_bytes=256 * 1024 * 1024):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.errors = 0
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _conn(self):
+        """Połączenie na wątek i proces (po fork nie używamy połączenia rodzica)."""
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            conn.execute("PRAGMA synchronous = NORMAL")
+            local.conn, local.pid = conn, os.getpid()
+        return local.conn
+
+    def _failed(self, action, error):
+        with self._lock:
+            self.errors += 1
+        log.warning("Baza zadań %s: %s nie powiódł się: %s", self.path, action, error)
+
+    def save(self, job):
+        """Zapisuje stan zadania (bez wyniku)."""
+        try:
+            self._conn().execute(_UPSERT, (*(getattr(job, c) for c in _STATE), time.time()))
+        except sqlite3.Error as e:
+            self._failed("zapis stanu", e)
+
+    def finish(self, job):
+        """Stan zakończonego zadania razem z wynikiem; sprzątanie starych wpisów."""
+        result = job.result
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                conn.execute(_UPSERT, (*(getattr(job, c) for c in _STATE), now))
+                if result is not None:
+                    conn.execute("UPDATE jobs SET data = ?, mimetype = ?, filename = ?, size = ? WHERE id = ?",
+                                 (result.data, result.mimetype, result.filename, len(result.data), job.id))
+                self._purge(conn, job.id, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            self._failed("zapis wyniku", e)
+
+    def _purge(self, conn, keep, now):
+        """Usuwa wygasłe i porzucone zadania oraz najstarsze wyniki ponad limit (w transakcji)."""
+        limit = now - self.ttl
+        conn.execute("DELETE FROM jobs WHERE id != ? AND (finished < ? OR (finished IS NULL AND updated < ?))",
+                     (keep, limit, limit))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM jobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        rows = conn.execute("SELECT id, size FROM jobs WHERE id != ? AND size IS NOT NULL ORDER BY finished",
+                            (keep,)).fetchall()
+        for job_id, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((job_id,))
+            total -= size
+        conn.executemany("DELETE FROM jobs WHERE id = ?", victims)
+
+    def load(self, job_id):
+        """Zadanie zapisane przez dowolny worker (bez bajtów wyniku) albo None."""
+        try:
+            row = self._conn().execute(
+                f"SELECT {', '.join(_STATE)}, filename, size FROM jobs WHERE id = ?",
+                (job_id,)).fetchone()
+        except sqlite3.Error as e:
+            self._failed("odczyt stanu", e)
+            return None
+        if row is None:
+            return None
+        job = Job(row[1], None)
+        for name, value in zip(_STATE, row):
+            setattr(job, name, value)
+        if job.finished is not None and job.finished < time.time() - self.ttl:
+            return None
+        job.remote = True
+        job.filename, job.size = row[len(_STATE):]
+        return job
+
+    def result(self, job_id):
+        """Bajty wyniku zakończonego zadania -> JobResult albo None."""
+        try:
+            row = self._conn().execute(
+                "SELECT data, mimetype, filename FROM jobs WHERE id = ? AND data IS NOT NULL AND finished >= ?",
+                (job_id, time.time() - self.ttl)).fetchone()
+        except sqlite3.Error as e:
+            self._failed("odczyt wyniku", e)
+            return None
+        return None if row is None else JobResult(*row)
+
+    def stats(self):
+        try:
+            entries, size = self._conn().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM jobs").fetchone()
+        except sqlite3.Error as e:
+            self._failed("statystyki", e)
+            entries, size = 0, 0
+        with self._lock:
+            return {"entries": entries, "bytes": size, "max_bytes": self.max_bytes, "errors": self.errors}
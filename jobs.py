@@ -0,0 +1,261 @@
+"""
+jobs.py – asynchroniczne zadania renderowania z ograniczoną kolejką.
+
+Żądanie HTTP tylko przyjmuje zadanie i zwraca jego id; render odbywa się
+w puli wątków procesu (a przy RENDER_WORKERS – dalej w puli procesów
+scheduler.py), więc worker gunicorna od razu wraca do obsługi innych
+klientów. Kolejka ma stały limit: gdy jest pełna, submit() podnosi
+QueueFull z szacowanym czasem, po którym warto spróbować ponownie
+(HTTP 429 + Retry-After). Zakończone zadania są trzymane przez ttl sekund,
+a łączny rozmiar ich wyników – najwyżej max_result_bytes (ponad limit
+wypadają najstarsze zakończone). Sprzątanie idzie przy każdym submit, get,
+stats i po zakończeniu zadania, więc pamięć nie rośnie także bez nowych zadań.
+
+Z store (job_store.JobStore) stan i wynik każdego zadania trafiają też do
+wspólnej bazy: get(), result() i events() znajdują wtedy zadania przyjęte
+przez inne workery gunicorna (remote = True, stan odświeżany z bazy).
+
+Renderer zadania to funkcja (params, progress) -> JobResult; progress(done,
+total) aktualizuje postęp widoczny w GET /jobs/<id> i w strumieniu SSE.
+"""
+import copy
+import json
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+JobResult = namedtuple("JobResult", "data mimetype filename")
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+PROGRESS_INTERVAL = 0.5  # s – częściej nie zapisujemy samego postępu do store
+REMOTE_POLL = 0.5        # s – odpytywanie store przez strumień SSE innego workera
+
+
+class QueueFull(Exception):
+    """Kolejka pełna – klient powinien ponowić po retry_after sekundach."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Kolejka zadań pełna, spróbuj za {retry_after} s")
+        self.retry_after = retry_after
+
+
+class Job:
+    """Jedno zadanie: stan, postęp i (po zakończeniu) wynik albo błąd."""
+
+    def __init__(self, kind, params):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.status = QUEUED
+        self.done = 0
+        self.total = 1
+        self.result = None
+        self.filename = None
+        self.size = None  # bajty wyniku
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.version = 0  # rośnie przy każdej zmianie – dla strumienia SSE
+        self.remote = False  # wczytane z JobStore, liczone przez inny worker
+        self.saved = 0.0  # czas ostatniego zapisu do JobStore
+
+    def to_dict(self):
+        d = {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": {"done": self.done, "total": self.total},
+            "created": round(self.created, 3),
+        }
+        if self.finished is not None:
+            d["seconds"] = round(self.finished - (self.started or self.created), 3)
+        if self.error is not None:
+            d["error"] = self.error
+        if self.filename is not None:
+            d["filename"] = self.filename
+            d["bytes"] = self.size
+        return d
+
+
+class JobQueue:
+    """Pula wątków renderujących z limitem zadań w toku i pamięcią wyników."""
+
+    def __init__(self, renderers, max_workers=2, max_pending=16, ttl=600,
+                 max_result_bytes=256 * 1024 * 1024, store=None):
+        self.renderers = renderers
+        self.store = store
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self.max_result_bytes = max_result_bytes
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="render-job")
+        self._jobs = OrderedDict()
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._result_bytes = 0  # suma len(result.data) zadań w _jobs
+        self._last_finished = None
+        self._avg_seconds = 1.0  # średnia krocząca czasu zadania (do Retry-After)
+
+    def _drop(self, job_id):
+        job = self._jobs.pop(job_id)
+        if job.result is not None:
+            self._result_bytes -= len(job.result.data)
+
+    def _purge(self):
+        # wywoływane pod blokadą; zadania są w kolejności utworzenia
+        limit = time.time() - self.ttl
+        for job_id in list(self._jobs):
+            job = self._jobs[job_id]
+            if job.finished is not None and job.finished < limit:
+                self._drop(job_id)
+            elif job.created >= limit:
+                break
+        # limit bajtów: najstarsze zakończone wypadają przed terminem; ostatnio
+        # zakończone zostaje, nawet gdy sam jego wynik przekracza limit
+        for job_id in list(self._jobs):
+            if self._result_bytes <= self.max_result_bytes:
+                break
+            job = self._jobs[job_id]
+            if job.finished is not None and job is not self._last_finished:
+                self._drop(job_id)
+
+    def retry_after(self):
+        """Szacowany czas (s) do zwolnienia miejsca w kolejce."""
+        waves = max(1, self._pending - self.max_workers + 1) / self.max_workers
+        return max(1, math.ceil(self._avg_seconds * waves))
+
+    def submit(self, kind, params):
+        """Przyjmuje zadanie i zwraca Job; QueueFull, gdy kolejka jest pełna."""
+        if kind not in self.renderers:
+            raise ValueError(f"Nieznany rodzaj zadania: {kind!r}")
+        with self._cond:
+            self._purge()
+            if self._pending >= self.max_pending:
+                raise QueueFull(self.retry_after())
+            job = Job(kind, params)
+            self._jobs[job.id] = job
+            self._pending += 1
+        # w bazie przed odpowiedzią 202 – następne żądanie może trafić do innego workera
+        self._save(job)
+        self._pool.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        """Zadanie z pamięci tego procesu, a jeśli go tu nie ma – ze store."""
+        with self._cond:
+            self._purge()
+            job = self._jobs.get(job_id)
+        if job is None and self.store is not None:
+            job = self.store.load(job_id)
+        return job
+
+    def result(self, job):
+        """JobResult zakończonego zadania (z pamięci albo ze store) albo None."""
+        if job.result is not None or not job.remote:
+            return job.result
+        return self.store.result(job.id)
+
+    def _save(self, job, progress_only=False):
+        if self.store is None:
+            return
+        now = time.time()
+        if progress_only and now - job.saved < PROGRESS_INTERVAL:
+            return
+        job.saved = now
+        self.store.save(job)
+
+    def _apply(self, job, changes):
+        with self._cond:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.version += 1
+            self._cond.notify_all()
+
+    def _update(self, job, **changes):
+        self._apply(job, changes)
+        self._save(job, progress_only=changes.keys() <= {"done", "total"})
+
+    def _run(self, job):
+        self._update(job, status=RUNNING, started=time.time())
+
+        def progress(done, total):
+            self._update(job, done=done, total=total)
+
+        try:
+            result = self.renderers[job.kind](job.params, progress)
+        except Exception as e:
+            changes = {"status": FAILED, "error": str(e) or type(e).__name__}
+        else:
+            changes = {"status": DONE, "result": result, "done": job.total,
+                       "filename": result.filename, "size": len(result.data)}
+        finished = changes["finished"] = time.time()
+        if self.store is not None:
+            # najpierw baza: kto zobaczy koniec tutaj, znajdzie go też w innym workerze
+            snapshot = copy.copy(job)
+            vars(snapshot).update(changes, version=job.version + 1)
+            self.store.finish(snapshot)
+        with self._cond:
+            self._pending -= 1
+            self._avg_seconds = 0.8 * self._avg_seconds + 0.2 * (finished - job.started)
+            if changes.get("result") is not None:
+                self._result_bytes += len(changes["result"].data)
+            self._last_finished = job
+            self._apply(job, changes)
+            self._purge()
+
+    def wait(self, job, version, timeout):
+        """Czeka, aż zadanie zmieni się względem version (albo minie timeout)."""
+        with self._cond:
+            self._cond.wait_for(lambda: job.version != version, timeout=timeout)
+            return job.version
+
+    def events(self, job, keepalive=15):
+        """
+        Strumień Server-Sent Events: stan zadania po każdej zmianie, do końca.
+        Zadanie innego workera odczytujemy ze store co REMOTE_POLL s.
+        """
+        version = -1
+        idle = 0.0
+        while True:
+            if job.version != version:
+                version = job.version
+                idle = 0.0
+                state = job.to_dict()
+                yield f"event: {state['status']}\ndata: {json.dumps(state)}\n\n"
+                if job.finished is not None:
+                    return
+            elif job.remote:
+                time.sleep(REMOTE_POLL)
+                idle += REMOTE_POLL
+                job = self.store.load(job.id)
+                if job is None:
+                    return  # wygasło albo usunięte
+                if idle >= keepalive and job.version == version:
+                    idle = 0.0
+                    yield ": keepalive\n\n"
+            elif self.wait(job, version, keepalive) == version:
+                yield ": keepalive\n\n"
+
+    def stats(self):
+        with self._cond:
+            self._purge()
+            by_status = {}
+            for job in self._jobs.values():
+                by_status[job.status] = by_status.get(job.status, 0) + 1
+            return {
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "workers": self.max_workers,
+                "avg_seconds": round(self._avg_seconds, 3),
+                "jobs": by_status,
+                "result_bytes": self._result_bytes,
+                "max_result_bytes": self.max_result_bytes,
+            }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True, cancel_futures=True)
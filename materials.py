@@ -0,0 +1,146 @@
+"""
+materials.py – profile tektury (gatunek -> grubość, naddatki, stałe klapek).
+
+Profile są w pliku danych materials.json (albo MATERIALS_FILE), wczytywanym
+raz na proces. Pola profilu (mm):
+    thickness           grubość ep1
+    external_allowance  naddatek wymiaru zewnętrznego X i Y względem wewnętrznego
+    clearance           luz oklejki: L2 = B + 2*ep + clearance (B2 analogicznie)
+    wrap_clearance      luz spodu/wieka: B1 = L + 2*ep + wrap_clearance, B3 = B2 + 2*ep + ...
+    groove_offset       V = ep - groove_offset
+    flap_v1, flap_v2    stałe klapek V1, V2
+    flap_v3             V3 = ep + flap_v3
+Pola opcjonalne – limity wymiarów sprawdzane w validation.py; brak pola
+to brak limitu. Wartości należy brać z kart technicznych tektury albo
+z ograniczeń maszyny, dla której powstaje siatka:
+    min_inner/max_inner dopuszczalny wymiar wewnętrzny L i B
+    min_depth/max_depth dopuszczalna głębokość H
+
+Grubość spoza tabeli dostaje profil interpolowany liniowo między sąsiednimi
+gatunkami (poza zakresem – przedłużenie skrajnego odcinka), zamiast po cichu
+zerowego naddatku. Limity nie są interpolowane: bierzemy je z wiersza
+o najbliższej grubości, żeby nie wymyślać wartości, których nikt nie podał.
+profile_array() robi to samo dla całej tablicy grubości.
+"""
+import json
+import math
+import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+MATERIALS_PATH = Path(__file__).resolve().parent / "materials.json"
+
+GEOMETRY_FIELDS = ("thickness", "external_allowance", "clearance", "wrap_clearance",
+                   "groove_offset", "flap_v1", "flap_v2", "flap_v3")
+# pole -> wartość, gdy profil go nie podaje (bez limitu)
+LIMIT_DEFAULTS = {"min_inner": 0.0, "max_inner": math.inf, "min_depth": 0.0, "max_depth": math.inf}
+FIELDS = GEOMETRY_FIELDS + tuple(LIMIT_DEFAULTS)
+
+Profile = namedtuple("Profile", ("grade", "name") + FIELDS)
+
+
+class Registry:
+    """Gatunki tektury posortowane wg grubości + interpolacja pomiędzy nimi."""
+
+    def __init__(self, boards):
+        profiles = []
+        for board in boards:
+            missing = [f for f in ("grade",) + GEOMETRY_FIELDS if board.get(f) is None]
+            if missing:
+                raise ValueError(f"profil {board.get('grade', '?')}: brak pól {', '.join(missing)}")
+            limits = [board[f] if board.get(f) is not None else default
+                      for f, default in LIMIT_DEFAULTS.items()]
+            profiles.append(Profile(board["grade"], board.get("name", board["grade"]),
+                                    *(board[f] for f in GEOMETRY_FIELDS), *limits))
+        if not profiles:
+            raise ValueError("brak profili tektury")
+        profiles.sort(key=lambda p: p.thickness)
+        thicknesses = [p.thickness for p in profiles]
+        if len(set(thicknesses)) != len(thicknesses):
+            raise ValueError("dwa profile o tej samej grubości")
+
+        self.profiles = tuple(profiles)
+        self.by_grade = {p.grade.upper(): p for p in profiles}
+        self._by_thickness = {p.thickness: p for p in profiles}
+        self._table = np.array([[getattr(p, f) for f in GEOMETRY_FIELDS] for p in profiles], dtype=float)
+        self._limits = np.array([[getattr(p, f) for f in LIMIT_DEFAULTS] for p in profiles], dtype=float)
+        self._interpolated = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=MATERIALS_PATH):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f)["boards"])
+
+    def thicknesses(self):
+        return tuple(p.thickness for p in self.profiles)
+
+    def grade(self, name):
+        """Profil gatunku po nazwie (np. "GB2")."""
+        try:
+            return self.by_grade[str(name).upper()]
+        except KeyError:
+            raise ValueError(f"Nieznany gatunek tektury: {name}") from None
+
+    def _interp(self, ep):
+        """
+        Profil dla tablicy grubości -> (..., len(FIELDS)): pola geometrii
+        interpolowane, limity z wiersza o najbliższej grubości.
+        """
+        t = self._table[:, 0]
+        if len(t) == 1:
+            return np.broadcast_to(np.concatenate([self._table[0], self._limits[0]]),
+                                   ep.shape + (len(FIELDS),)).copy()
+        i = np.clip(np.searchsorted(t, ep), 1, len(t) - 1)
+        w = ((ep - t[i - 1]) / (t[i] - t[i - 1]))[..., None]
+        # a*(1-w) + b*w: w == 0 albo 1 daje dokładnie wartość z tabeli
+        geometry = self._table[i - 1] * (1 - w) + self._table[i] * w
+        # bliżej (albo tak samo blisko) cieńszego sąsiada -> jego limity
+        nearest = np.where(ep - t[i - 1] <= t[i] - ep, i - 1, i)
+        return np.concatenate([geometry, self._limits[nearest]], axis=-1)
+
+    def profile(self, ep):
+        """Profil dla grubości ep: z tabeli albo interpolowany (zapamiętywany)."""
+        p = self._by_thickness.get(ep) or self._interpolated.get(ep)
+        if p is not None:
+            return p
+        values = self._interp(np.asarray([float(ep)]))[0]
+        p = Profile(None, f"{ep:g} mm (interpolacja)", float(ep), *values[1:].tolist())
+        with self._lock:
+            return self._interpolated.setdefault(ep, p)
+
+    def profile_array(self, ep):
+        """Profil jako Profile tablic numpy – pola w kształcie tablicy ep."""
+        ep = np.asarray(ep, dtype=float)
+        values = self._interp(ep)
+        return Profile(None, None, ep, *(values[..., k] for k in range(1, len(FIELDS))))
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def registry():
+    """Rejestr procesu – wczytany przy pierwszym użyciu z MATERIALS_FILE albo materials.json."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = Registry.load(os.environ.get("MATERIALS_FILE") or MATERIALS_PATH)
+    return _registry
+
+
+def profile(ep):
+    return registry().profile(ep)
+
+
+def profile_array(ep):
+    return registry().profile_array(ep)
+
+
+def thicknesses():
+    """Grubości zapisane w pliku danych (np. do rozwinięcia katalogu)."""
+    return registry().thicknesses()
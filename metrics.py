@@ -0,0 +1,201 @@
+"""
+metrics.py – liczniki, histogramy i czasy etapów w formacie Prometheusa.
+
+Bez zależności: każdy pomiar to perf_counter(), bisect po kubełkach i krótka
+blokada, więc instrumentacja może zostać włączona na produkcji. Etapy
+renderowania mierzy stage("box.merge") – czas trafia do histogramu
+render_stage_seconds{stage=...} oraz, w obrębie żądania HTTP, do nagłówka
+Server-Timing (server_timing()). Wartości są per proces: każdy worker
+gunicorna wystawia własne /metrics (Prometheus agreguje po instancjach).
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# kubełki czasu (s) i rozmiaru wyniku (bajty)
+TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (1e3, 1e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 5e6, 2.5e7)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _num(value):
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """Licznik monotoniczny z etykietami."""
+
+    kind = "counter"
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_labels(self.labelnames, key)} {_num(value)}"
+
+
+class Histogram:
+    """Histogram o stałych kubełkach (skumulowanych przy eksporcie)."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=TIME_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def samples(self):
+        with self._lock:
+            items = sorted((k, (list(c), s, n)) for k, (c, s, n) in self._series.items())
+        for key, (counts, total, count) in items:
+            running = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                running += n
+                le = "+Inf" if bound == float("inf") else _num(bound)
+                yield f"{self.name}_bucket{_labels(self.labelnames, key, [('le', le)])} {running}"
+            yield f"{self.name}_sum{_labels(self.labelnames, key)} {_num(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, key)} {count}"
+
+
+class Gauge:
+    """
+    Wartość odczytywana przy eksporcie: fn() -> liczba albo {etykieta: liczba}.
+    kind="counter" dla wartości narastających liczonych gdzie indziej (np. PdfCache.stats).
+    """
+
+    def __init__(self, name, help, fn, labelname=None, kind="gauge"):
+        self.name = name
+        self.help = help
+        self.fn = fn
+        self.labelname = labelname
+        self.kind = kind
+
+    def samples(self):
+        value = self.fn()
+        if self.labelname is None:
+            yield f"{self.name} {_num(value)}"
+            return
+        for label, v in sorted(value.items()):
+            yield f"{self.name}{_labels((self.labelname,), (label,))} {_num(v)}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = {}
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help, labelnames=()):
+        return self.register(Counter(name, help, labelnames))
+
+    def histogram(self, name, help, labelnames=(), buckets=TIME_BUCKETS):
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def gauge(self, name, help, fn, labelname=None, kind="gauge"):
+        return self.register(Gauge(name, help, fn, labelname, kind))
+
+    def render(self):
+        """Format tekstowy Prometheusa (text/plain; version=0.0.4)."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "render_stage_seconds", "Czas etapów renderowania pudełek i kart", ("stage",))
+REQUESTS = REGISTRY.counter(
+    "http_requests_total", "Żądania HTTP wg trasy, metody i statusu", ("endpoint", "method", "status"))
+REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_seconds", "Czas obsługi żądania HTTP (bez strumieniowanej treści)", ("endpoint",))
+BOX_REQUESTS = REGISTRY.counter(
+    "box_renders_total", "Rendery pudełek wg formatu i grubości ep1", ("format", "ep1"))
+CARD_REQUESTS = REGISTRY.counter(
+    "card_renders_total", "Rendery kart wg języka i arkusza", ("lang", "sheet"))
+OUTPUT_BYTES = REGISTRY.histogram(
+    "render_output_bytes", "Rozmiar wygenerowanych plików", ("kind",), buckets=BYTES_BUCKETS)
+
+_timings = ContextVar("render_timings", default=None)
+
+
+def start_request():
+    """Zaczyna zbieranie czasów etapów dla bieżącego żądania."""
+    _timings.set({})
+
+
+def stop_request():
+    """Kończy zbieranie; zwraca {etap: sekundy} zebrane w żądaniu."""
+    timings = _timings.get()
+    _timings.set(None)
+    return timings or {}
+
+
+@contextmanager
+def stage(name):
+    """Mierzy blok kodu jako etap name (histogram + Server-Timing)."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        dt = time.perf_counter() - t0
+        STAGE_SECONDS.observe(dt, stage=name)
+        timings = _timings.get()
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + dt
+
+
+def server_timing(timings, total=None):
+    """Wartość nagłówka Server-Timing z {etap: sekundy} (czasy w ms)."""
+    parts = [f"{name};dur={dt * 1000:.2f}" for name, dt in timings.items()]
+    if total is not None:
+        parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts)
+
+
+def ep1_label(ep1):
+    """Etykieta grubości – tylko znane wartości, żeby nie mnożyć serii."""
+    return f"{ep1:g}" if ep1 in (1, 1.5, 2) else "other"
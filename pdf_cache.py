@@ -0,0 +1,197 @@
+"""
+pdf_cache.py – pamięć podręczna gotowych PDF-ów adresowana treścią.
+
+Klucz to skrót SHA-256 z rodzaju dokumentu, wersji generatora i parametrów
+znormalizowanych do kroku formularza (0.1 mm), więc "100" i "100.0" trafiają
+w ten sam wpis. Poziom 1 to LRU w pamięci z limitem bajtów, poziom 2
+(opcjonalny) to magazyn współdzielony przez workery gunicorna: baza SQLite
+z LRU (store, render_store.RenderStore) i/lub katalog plików (disk_dir).
+
+Katalog ma limit disk_max_bytes: proces zna rozmiar katalogu z ostatniego
+przeglądu powiększony o własne zapisy, a po przekroczeniu limitu przegląda
+katalog i usuwa najdawniej używane pliki (mtime, odświeżany przy trafieniu
+najwyżej co DISK_TOUCH_INTERVAL s) do DISK_EVICT_TO limitu. Przy kilku
+workerach limit jest przybliżony – zapisów pozostałych proces nie widzi
+do następnego przeglądu.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+FORM_STEP_DECIMALS = 1  # krok pól formularza: 0.1 mm
+DISK_TOUCH_INTERVAL = 60.0  # s – rzadziej nie odświeżamy mtime pliku przy trafieniu
+DISK_EVICT_TO = 0.9         # po przeglądzie katalog zajmuje najwyżej tyle limitu
+
+
+def normalize(*values):
+    """Parametry jako floaty zaokrąglone do kroku formularza (bez -0.0)."""
+    return tuple(round(float(v), FORM_STEP_DECIMALS) + 0.0 for v in values)
+
+
+def cache_key(kind, params, version):
+    """Deterministyczny klucz: rodzaj dokumentu + wersja + parametry."""
+    raw = "|".join([kind, str(version), *(repr(p) for p in params)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class PdfCache:
+    """LRU gotowych plików z limitem pamięci w bajtach i opcjonalnym dyskiem."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk_dir=None, store=None,
+                 disk_max_bytes=1024 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.store = store
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_size = 0
+        self.hits = 0
+        self.store_hits = 0
+        self.disk_hits = 0
+        self.disk_evictions = 0
+        self.misses = 0
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_size = sum(size for _, size, _ in self._disk_files())
+
+    def _disk_path(self, key):
+        return self.disk_dir / key[:2] / f"{key}.pdf"
+
+    def _disk_files(self):
+        """(mtime, rozmiar, ścieżka) plików cache w katalogu."""
+        files = []
+        for sub in os.scandir(self.disk_dir):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".pdf"):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue  # usunięty przez inny worker
+                    files.append((st.st_mtime, st.st_size, entry.path))
+        return files
+
+    def _evict_disk(self):
+        """Usuwa najdawniej używane pliki, aż katalog zmieści się w DISK_EVICT_TO limitu."""
+        with self._disk_lock:
+            if self._disk_size <= self.disk_max_bytes:
+                return  # inny wątek właśnie posprzątał
+            files = sorted(self._disk_files())
+            total = sum(size for _, size, _ in files)
+            target = self.disk_max_bytes * DISK_EVICT_TO
+            evicted = 0
+            for _, size, path in files:
+                if total <= target:
+                    break
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                total -= size
+                evicted += 1
+            self._disk_size = total
+        with self._lock:
+            self.disk_evictions += evicted
+
+    def _remember(self, key, data):
+        # wywoływane pod blokadą
+        if len(data) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+        self._entries[key] = data
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        if self.store is not None:
+            data = self.store.get(key)
+            if data is not None:
+                with self._lock:
+                    self.store_hits += 1
+                    self._remember(key, data)
+                return data
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                data = path.read_bytes()
+                if time.time() - path.stat().st_mtime > DISK_TOUCH_INTERVAL:
+                    os.utime(path)  # świeży mtime = dawniej usuwany przez LRU
+            except OSError:
+                data = None
+            if data is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._remember(key, data)
+                return data
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, data):
+        with self._lock:
+            self._remember(key, data)
+
+        if self.store is not None:
+            self.store.put(key, data)
+
+        if self.disk_dir and len(data) <= self.disk_max_bytes:
+            path = self._disk_path(key)
+            path.parent.mkdir(exist_ok=True)
+            # zapis atomowy – inny worker nigdy nie zobaczy połowy pliku
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except OSError:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+            else:
+                with self._disk_lock:
+                    self._disk_size += len(data)
+                if self._disk_size > self.disk_max_bytes:
+                    self._evict_disk()
+
+    def get_or_render(self, key, render):
+        """Zwraca bajty z cache albo wynik render() (i zapisuje go)."""
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "store_hits": self.store_hits,
+                "disk_hits": self.disk_hits,
+                "disk_evictions": self.disk_evictions,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,215 @@
+"""
+plotter.py – eksport siatki pudełka dla stołu tnącego: DXF i HPGL.
+
+Odcinki z generator.box_segments są scalane w łamane (merge_segments), a potem
+porządkowane tak, żeby głowica jak najmniej jeździła w górze: najbliższy
+sąsiad (łamaną można przejść w obu kierunkach), potem poprawki 2-opt.
+Najpierw idą bigi (FOLD), potem cięcie (CUT) – wycięty element nie przesuwa
+się już pod narzędziem bigującym. CUT i FOLD trafiają na osobne warstwy DXF
+(CUT czerwona, FOLD niebieska) albo pióra HPGL (SP1 = nóż, SP2 = biga).
+
+Raport (PlotStats): przejazdy w górze przy kolejności odcinków z generatora
+(tak jak z konwertera PDF) i po optymalizacji; DXF ma go w komentarzach 999,
+HPGL w instrukcjach CO"..." (komentarz HP-GL/2, ploter go pomija).
+Układ maszyny: początek w lewym dolnym rogu siatki, oś Y w górę.
+
+Użycie:
+    python plotter.py 100 70 30 --ep1 2 -o pudelko.dxf
+    python plotter.py 100 70 30 --ep1 1.5 --format hpgl -o pudelko.plt
+"""
+import argparse
+import math
+import sys
+from collections import namedtuple
+
+import generator
+import metrics
+
+PLOT_ORDER = ("FOLD", "CUT")
+HPGL_UNITS_PER_MM = 40           # 1 jednostka plotera = 0,025 mm
+HPGL_PENS = {"CUT": 1, "FOLD": 2}
+DXF_COLORS = {"CUT": 1, "FOLD": 5}   # indeksy ACI: czerwony, niebieski
+TWO_OPT_PASSES = 20
+
+PlotStats = namedtuple(
+    "PlotStats",
+    "segments pen_ups_before pen_ups_after travel_before_mm travel_after_mm draw_mm",
+)
+
+
+def _dist(a, b):
+    return math.hypot(b[0] - a[0], b[1] - a[1])
+
+
+def _travel(paths, start=(0.0, 0.0)):
+    total = 0.0
+    pos = start
+    for _, poly in paths:
+        total += _dist(pos, poly[0])
+        pos = poly[-1]
+    return total, pos
+
+
+def _nearest_neighbor(polys, start):
+    """Zachłannie: zawsze najbliższy wolny koniec dowolnej łamanej."""
+    remaining = list(polys)
+    route = []
+    pos = start
+    while remaining:
+        best_i, best_d, best_rev = 0, math.inf, False
+        for i, poly in enumerate(remaining):
+            d0, d1 = _dist(pos, poly[0]), _dist(pos, poly[-1])
+            if d0 < best_d:
+                best_i, best_d, best_rev = i, d0, False
+            if d1 < best_d:
+                best_i, best_d, best_rev = i, d1, True
+        poly = remaining.pop(best_i)
+        route.append(poly[::-1] if best_rev else poly)
+        pos = route[-1][-1]
+    return route
+
+
+def _two_opt(route, start):
+    """
+    2-opt na trasie łamanych: odwrócenie fragmentu route[i..j] (kolejność
+    i kierunek każdej łamanej) zmienia tylko dwa przejazdy na jego brzegach.
+    """
+    for _ in range(TWO_OPT_PASSES):
+        improved = False
+        for i in range(len(route) - 1):
+            prev = start if i == 0 else route[i - 1][-1]
+            for j in range(i + 1, len(route)):
+                nxt = route[j + 1][0] if j + 1 < len(route) else None
+                old = _dist(prev, route[i][0]) + (_dist(route[j][-1], nxt) if nxt else 0.0)
+                new = _dist(prev, route[j][-1]) + (_dist(route[i][0], nxt) if nxt else 0.0)
+                if new < old - 1e-9:
+                    route[i:j + 1] = [poly[::-1] for poly in reversed(route[i:j + 1])]
+                    improved = True
+        if not improved:
+            break
+    return route
+
+
+def tool_paths(segs, optimize=True):
+    """
+    Odcinki (kind, x0, y0, x1, y1) w mm -> ([(kind, [(x, y), ...]), ...], PlotStats)
+    w układzie maszyny (Y w górę, początek w lewym dolnym rogu siatki).
+    """
+    min_x, min_y, max_x, max_y = generator.segment_bounds(segs)
+    local = [(k, x0 - min_x, max_y - y0, x1 - min_x, max_y - y1) for k, x0, y0, x1, y1 in segs]
+
+    # stan wyjściowy: każdy odcinek osobno, w kolejności z generatora
+    naive = [(k, [(x0, y0), (x1, y1)]) for kind in PLOT_ORDER
+             for k, x0, y0, x1, y1 in local if k == kind]
+    travel_before, _ = _travel(naive)
+
+    with metrics.stage("plot.order"):
+        merged, _ = generator.merge_segments(local)
+        paths = []
+        pos = (0.0, 0.0)
+        for kind in PLOT_ORDER:
+            polys = merged.get(kind, [])
+            if optimize:
+                polys = _two_opt(_nearest_neighbor(polys, pos), pos)
+            paths.extend((kind, poly) for poly in polys)
+            if polys:
+                pos = polys[-1][-1]
+    travel_after, _ = _travel(paths)
+
+    draw = sum(_dist(a, b) for _, poly in paths for a, b in zip(poly, poly[1:]))
+    stats = PlotStats(len(segs), len(naive), len(paths),
+                      round(travel_before, 1), round(travel_after, 1), round(draw, 1))
+    return paths, stats
+
+
+def _report(stats):
+    saved = 1 - stats.travel_after_mm / stats.travel_before_mm if stats.travel_before_mm else 0.0
+    return [
+        f"segments: {stats.segments}, draw length: {stats.draw_mm:.1f} mm",
+        f"pen-ups: {stats.pen_ups_before} -> {stats.pen_ups_after}",
+        f"pen-up travel: {stats.travel_before_mm:.1f} mm -> {stats.travel_after_mm:.1f} mm ({-saved:+.0%})",
+    ]
+
+
+def dxf_bytes(paths, stats):
+    """DXF R12 (ASCII): warstwy CUT/FOLD, jedna POLYLINE na łamaną, jednostki mm."""
+    # R12 (AC1009) nie ma $INSUNITS – jednostki podajemy w komentarzu
+    header = ["MB Print box die-line", "units: mm (1 drawing unit = 1 mm)"]
+    out = [f"999\n{line}" for line in header + _report(stats)]
+    out.append("0\nSECTION\n2\nHEADER\n9\n$ACADVER\n1\nAC1009\n0\nENDSEC")
+    out.append("0\nSECTION\n2\nTABLES\n"
+               "0\nTABLE\n2\nLTYPE\n70\n1\n"
+               "0\nLTYPE\n2\nCONTINUOUS\n70\n0\n3\nSolid line\n72\n65\n73\n0\n40\n0.0\n0\nENDTAB\n"
+               f"0\nTABLE\n2\nLAYER\n70\n{len(PLOT_ORDER)}")
+    for kind in PLOT_ORDER:
+        out.append(f"0\nLAYER\n2\n{kind}\n70\n0\n62\n{DXF_COLORS[kind]}\n6\nCONTINUOUS")
+    out.append("0\nENDTAB\n0\nENDSEC\n0\nSECTION\n2\nENTITIES")
+    for kind, poly in paths:
+        closed = len(poly) > 2 and _dist(poly[0], poly[-1]) < 1e-6
+        points = poly[:-1] if closed else poly
+        out.append(f"0\nPOLYLINE\n8\n{kind}\n66\n1\n70\n{1 if closed else 0}\n10\n0.0\n20\n0.0\n30\n0.0")
+        out.extend(f"0\nVERTEX\n8\n{kind}\n10\n{x:.3f}\n20\n{y:.3f}\n30\n0.0" for x, y in points)
+        out.append(f"0\nSEQEND\n8\n{kind}")
+    out.append("0\nENDSEC\n0\nEOF\n")
+    return "\n".join(out).encode("ascii")
+
+
+def hpgl_bytes(paths, stats):
+    """HPGL: pióro na rodzaj linii, jedna sekwencja PU/PD na łamaną, 40 jednostek/mm."""
+    def xy(point):
+        return f"{round(point[0] * HPGL_UNITS_PER_MM)},{round(point[1] * HPGL_UNITS_PER_MM)}"
+
+    out = ["IN;"]
+    out.extend(f'CO"{line}";' for line in ["MB Print box die-line"] + _report(stats))
+    pen = None
+    for kind, poly in paths:
+        if HPGL_PENS[kind] != pen:
+            pen = HPGL_PENS[kind]
+            out.append(f"SP{pen};")
+        out.append(f"PU{xy(poly[0])};PD{','.join(xy(p) for p in poly[1:])};")
+    out.append("PU0,0;SP0;\n")
+    return "\n".join(out).encode("ascii")
+
+
+WRITERS = {"dxf": dxf_bytes, "hpgl": hpgl_bytes}
+
+
+def plot_bytes_from_params(L, B, H, R, ep, fmt="dxf", *, optimize=True):
+    """Plik DXF/HPGL siatki pudełka -> (bajty, PlotStats)."""
+    paths, stats = tool_paths(generator.box_segments(L, B, H, R, ep), optimize)
+    return WRITERS[fmt](paths, stats), stats
+
+
+def dxf_bytes_from_params(L, B, H, R, ep, *, logo_path=None, ext_dims=None):
+    """Renderer formatu dxf (podpis jak generator.pdf_bytes_from_params)."""
+    return plot_bytes_from_params(L, B, H, R, ep, "dxf")[0]
+
+
+def hpgl_bytes_from_params(L, B, H, R, ep, *, logo_path=None, ext_dims=None):
+    """Renderer formatu hpgl (podpis jak generator.pdf_bytes_from_params)."""
+    return plot_bytes_from_params(L, B, H, R, ep, "hpgl")[0]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Eksport siatki pudełka do DXF/HPGL")
+    parser.add_argument("L", type=float, help="X mm (wysokość)")
+    parser.add_argument("B", type=float, help="Y mm (szerokość)")
+    parser.add_argument("H", type=float, help="Z mm (głębokość)")
+    parser.add_argument("--R", type=float, default=15.0, help="zawinięcie [mm]")
+    parser.add_argument("--ep1", type=float, default=2.0, help="grubość tektury [mm]")
+    parser.add_argument("--format", choices=sorted(WRITERS), help="domyślnie z rozszerzenia -o")
+    parser.add_argument("--no-optimize", action="store_true", help="kolejność łamanych bez optymalizacji")
+    parser.add_argument("-o", "--output", required=True, help="plik wynikowy (.dxf lub .plt/.hpgl)")
+    args = parser.parse_args()
+
+    fmt = args.format or ("dxf" if args.output.lower().endswith(".dxf") else "hpgl")
+    try:
+        data, stats = plot_bytes_from_params(args.L, args.B, args.H, args.R, args.ep1, fmt,
+                                             optimize=not args.no_optimize)
+    except (ValueError, ZeroDivisionError) as e:
+        sys.exit(f"✗ {e}")
+    with open(args.output, "wb") as f:
+        f.write(data)
+    print(f"✓ zapisano {args.output} ({fmt}, {len(data)} B)")
+    for line in _report(stats):
+        print(f"  {line}")
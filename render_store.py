@@ -0,0 +1,140 @@
+"""
+render_store.py – trwały magazyn gotowych plików w SQLite (WAL) dla wszystkich workerów.
+
+Jeden plik bazy na maszynę/wolumin: workery gunicorna (i kolejne deploye)
+widzą te same wpisy, więc render policzony w jednym procesie trafia do
+pozostałych i przeżywa restart. Klucz to pdf_cache.cache_key – parametry
+znormalizowane + wersja generatora/szablonu; po zmianie wersji stare wpisy
+nie są już trafiane i wypadają przez LRU.
+
+Współbieżność: tryb WAL (czytelnicy nie czekają na piszącego), zapis
+w BEGIN IMMEDIATE z busy_timeout, więc równolegli piszący ustawiają się
+w kolejce zamiast dostać "database is locked". Limit bajtów pilnowany przy
+każdym zapisie – usuwane są najdawniej używane wpisy (kolumna used,
+odświeżana przy odczycie najwyżej co TOUCH_INTERVAL s, żeby trafienia nie
+zamieniały się w zapisy). Błąd bazy nigdy nie psuje żądania: odczyt jest
+wtedy chybieniem, a zapis jest pomijany (ostrzeżenie w logu).
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+BUSY_TIMEOUT = 5.0      # s czekania na blokadę zapisu innego workera
+TOUCH_INTERVAL = 60.0   # s – rzadziej nie odświeżamy used przy odczycie
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS renders (
+    key  TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS renders_used ON renders (used);
+"""
+
+
+class RenderStore:
+    """Klucz -> bajty w jednym pliku SQLite, LRU z limitem max_bytes."""
+
+    def __init__(self, path, max_bytes=512 * 1024 * 1024):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.errors = 0
+        conn = self._conn()
+        # auto_vacuum działa tylko ustawione przed pierwszą tabelą
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _conn(self):
+        """Połączenie na wątek i proces (po fork nie używamy połączenia rodzica)."""
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            conn.execute("PRAGMA synchronous = NORMAL")
+            local.conn, local.pid = conn, os.getpid()
+        return local.conn
+
+    def _failed(self, action, error):
+        with self._lock:
+            self.errors += 1
+        log.warning("Magazyn renderów %s: %s nie powiódł się: %s", self.path, action, error)
+
+    def get(self, key):
+        try:
+            conn = self._conn()
+            row = conn.execute("SELECT data, used FROM renders WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            data, used = row
+            now = time.time()
+            if now - used > TOUCH_INTERVAL:
+                conn.execute("UPDATE renders SET used = ? WHERE key = ?", (now, key))
+            return data
+        except sqlite3.Error as e:
+            self._failed("odczyt", e)
+            return None
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("INSERT OR REPLACE INTO renders (key, data, size, used) VALUES (?, ?, ?, ?)",
+                             (key, data, len(data), time.time()))
+                evicted = self._evict(conn, key)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            if evicted:
+                # zwolnione strony wracają do systemu plików, plik nie rośnie bez końca
+                conn.execute("PRAGMA incremental_vacuum").fetchall()
+        except sqlite3.Error as e:
+            self._failed("zapis", e)
+
+    def _evict(self, conn, keep):
+        """Usuwa najdawniej używane wpisy ponad limit (w transakcji zapisu)."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM renders").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        victims = []
+        rows = conn.execute("SELECT key, size FROM renders WHERE key != ? ORDER BY used", (keep,)).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM renders WHERE key = ?", victims)
+        with self._lock:
+            self.evictions += len(victims)
+        return len(victims)
+
+    def stats(self):
+        try:
+            entries, size = self._conn().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM renders").fetchone()
+        except sqlite3.Error as e:
+            self._failed("statystyki", e)
+            entries, size = 0, 0
+        with self._lock:
+            return {
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "errors": self.errors,
+            }
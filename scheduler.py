@@ -0,0 +1,188 @@
+"""
+scheduler.py – równoległe renderowanie pudełek i kart w puli procesów.
+
+cairo i reportlab liczą w Pythonie/C trzymając GIL, więc partia renderowana
+w jednym workerze Flaska używa jednego rdzenia. RenderScheduler rozdziela
+zadania na ProcessPoolExecutor: każdy proces puli rozgrzewa się raz (font,
+logo, skompilowane segmenty), wyniki wracają w kolejności wejścia, a przy
+nasyconej puli podawanie kolejnych zadań czeka (ograniczone okno w locie).
+
+Zadanie to krotka (rodzaj, parametry):
+    ("box", (L, B, H, R, ep1))          -> PDF pudełka
+    ("box.svg", (L, B, H, R, ep1))      -> SVG pudełka
+    ("card", (width, height, lang))     -> PDF karty
+
+Pomiar skalowania:
+    python scheduler.py --jobs 200 --workers 1,2,4,8,16
+"""
+import argparse
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+def _warm_up():
+    """Initializer procesu puli: ładuje wszystko, co drogie, jeden raz."""
+    import assets
+    import cards
+    import generator  # kompiluje tabelę segmentów przy imporcie
+
+    assets.get_image()
+    cards.warm_up()
+
+
+def render_job(job):
+    """Wykonuje jedno zadanie i zwraca bajty wyniku (działa w procesie puli)."""
+    kind, params = job
+    if kind in ("box", "box.svg"):
+        import assets
+        import generator
+
+        L, B, H, R, ep1 = params
+        renderer = generator.pdf_bytes_from_params if kind == "box" else generator.svg_bytes_from_params
+        return renderer(L, B, H, R, ep1, logo_path=assets.LOGO_PATH,
+                        ext_dims=generator.external_dims(L, B, H, ep1))
+    if kind == "card":
+        import cards
+
+        return cards.create_template(*params)
+    raise ValueError(f"Nieznany rodzaj zadania: {kind!r}")
+
+
+class RenderScheduler:
+    """Pula procesów renderujących z zachowaniem kolejności i backpressure."""
+
+    def __init__(self, max_workers=None, max_pending=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # ile zadań może czekać w puli naraz; więcej = wstrzymujemy podawanie
+        self.max_pending = max_pending or 2 * self.max_workers
+        self._pool = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self.in_flight = 0
+
+    def _executor(self):
+        with self._lock:
+            if self._pool is None:
+                # spawn: bez dziedziczenia wątków/blokad procesu Flaska
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_up,
+                )
+            return self._pool
+
+    @property
+    def saturated(self):
+        return self.in_flight >= self.max_pending
+
+    def _submit(self, job):
+        self._slots.acquire()  # backoff: czekamy na wolne miejsce w oknie
+        with self._lock:
+            self.in_flight += 1
+        try:
+            pool = self._executor()
+            try:
+                future = pool.submit(render_job, job)
+            except BrokenProcessPool:
+                # proces puli padł (np. OOM) – zamykamy starą pulę (bez czekania,
+                # z anulowaniem zaległych zadań, żeby nie zostawić jej wątku
+                # zarządzającego i procesów) i stawiamy pulę od nowa
+                with self._lock:
+                    if self._pool is pool:
+                        self._pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+                future = self._executor().submit(render_job, job)
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future):
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def map(self, jobs):
+        """
+        Generator (wynik, błąd) dla każdego zadania w kolejności wejścia;
+        błąd jednego zadania nie przerywa pozostałych.
+        """
+        window = deque()
+        jobs = iter(jobs)
+        exhausted = False
+        while True:
+            # dokładamy zadania, dopóki okno ma miejsce
+            while not exhausted and len(window) < self.max_pending:
+                try:
+                    job = next(jobs)
+                except StopIteration:
+                    exhausted = True
+                    break
+                window.append(self._submit(job))
+            if not window:
+                return
+            future = window.popleft()
+            try:
+                yield future.result(), None
+            except Exception as e:
+                yield None, e
+
+    def render_boxes(self, params_list):
+        """(PDF, błąd) dla listy krotek (L, B, H, R, ep1) – interfejs jak batch.render_serial."""
+        return self.map(("box", params) for params in params_list)
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+
+_scheduler = None
+
+
+def get_scheduler():
+    """
+    Scheduler procesu sterowany RENDER_WORKERS (liczba procesów puli).
+    Zwraca None, gdy RENDER_WORKERS nie jest ustawione lub < 2 – wtedy
+    renderujemy szeregowo w bieżącym procesie.
+    """
+    global _scheduler
+    workers = int(os.environ.get("RENDER_WORKERS", "0") or 0)
+    if workers < 2:
+        return None
+    if _scheduler is None:
+        _scheduler = RenderScheduler(max_workers=workers)
+    return _scheduler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Skalowanie puli renderującej")
+    parser.add_argument("--jobs", type=int, default=200, help="liczba pudełek w partii")
+    parser.add_argument("--workers", default="1,2,4", help="lista rozmiarów puli, np. 1,2,4,16")
+    parser.add_argument("--kind", choices=["box", "box.svg", "card"], default="box")
+    args = parser.parse_args()
+
+    if args.kind == "card":
+        jobs = [("card", (50 + i % 40, 80 + i % 30, "PL")) for i in range(args.jobs)]
+    else:
+        jobs = [(args.kind, (80 + i % 50, 60 + i % 40, 20 + i % 30, 15, (1, 1.5, 2)[i % 3]))
+                for i in range(args.jobs)]
+
+    base = None
+    for n in (int(w) for w in args.workers.split(",")):
+        sched = RenderScheduler(max_workers=n)
+        list(sched.map(jobs[:n]))  # start i rozgrzewka puli poza pomiarem
+        t0 = time.perf_counter()
+        failed = sum(1 for _, err in sched.map(jobs) if err is not None)
+        dt = time.perf_counter() - t0
+        sched.shutdown()
+        base = base or dt  # pierwszy rozmiar z listy to punkt odniesienia
+        print(f"workers={n:3d}  {args.jobs / dt:8.1f} zadań/s  {dt:7.3f} s  "
+              f"przyspieszenie ×{base / dt:5.2f}  błędy={failed}")
@@ -0,0 +1,338 @@
+# AUTO-GENERATED przez build_segments_from_cs.py --codegen – nie edytuj ręcznie
+import numpy as np
+
+import materials
+
+
+def _derived_vars(L, B, H, R, ep):
+    """= generator._derived_vars (wzory wklejone przez --codegen)."""
+    m = materials.profile(ep)
+    H2 = H
+    Ep = ep
+    L2 = B + 2 * Ep + m.clearance
+    B2 = L + 2 * Ep + m.clearance
+    B3 = B2 + 2 * Ep + m.wrap_clearance
+    V = Ep - m.groove_offset
+    L3 = L2 + 2 * Ep
+    H3 = H2 + Ep
+    R1 = R
+    H1 = H + Ep
+    B1 = L + 2 * Ep + m.wrap_clearance
+    L1 = B + 2 * Ep
+    V1, V2, V3 = (m.flap_v1, m.flap_v2, Ep + m.flap_v3)
+    Pdp = 30
+    P1x = R1 + H3 + L3 / 2 - (L2 / 2 + H2)
+    P2x = R1 + H3 + L3 + H3 + R1 + Pdp
+    P2y = R1 + H3 + B3 / 2 - (B1 / 2 + H1 + R)
+    P3x = P2x + R + H1 + L1 / 2 - (H + B / 2)
+    P1y = R1 + H3 + B3 + H3 + R1 + Pdp if R1 + H3 + B3 / 2 > R + H1 + B1 / 2 else R + H1 + B1 + H1 + R + Pdp
+    P3y = P1y + H2 + B2 / 2 - (L / 2 + H)
+    return {'L': L, 'B': B, 'H': H, 'R': R, 'ep': ep, 'H2': H2, 'Ep': Ep, 'L2': L2, 'B2': B2, 'B3': B3, 'V': V, 'L3': L3, 'H3': H3, 'R1': R1, 'H1': H1, 'B1': B1, 'L1': L1, 'V1': V1, 'V2': V2, 'V3': V3, 'Pdp': Pdp, 'P1x': P1x, 'P2x': P2x, 'P2y': P2y, 'P3x': P3x, 'P1y': P1y, 'P3y': P3y}
+
+
+OUTER_WRAP_KINDS = ('CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT',
+ 'CUT', 'CUT', 'CUT', 'FOLD', 'FOLD', 'CUT', 'CUT', 'CUT', 'FOLD', 'FOLD', 'FOLD', 'FOLD', 'FOLD',
+ 'FOLD', 'FOLD', 'FOLD', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT',
+ 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'FOLD', 'CUT', 'CUT', 'FOLD', 'FOLD', 'FOLD', 'CUT', 'CUT',
+ 'CUT', 'CUT', 'CUT', 'FOLD', 'CUT', 'CUT', 'FOLD')
+
+
+def outer_wrap(L, B, H, R, Ep):
+    v = _derived_vars(L, B, H, R, Ep)
+    B3 = v['B3']
+    H3 = v['H3']
+    L3 = v['L3']
+    R1 = v['R1']
+    V1 = v['V1']
+    V2 = v['V2']
+    V3 = v['V3']
+    t0 = R1+H3
+    t1 = R1-V2
+    t2 = t0+B3
+    t3 = t0+Ep
+    t4 = t0+L3
+    t5 = t0+V3
+    t6 = t0-1.73193
+    t7 = t0-1.99988
+    t8 = t0-3.99994
+    t9 = t0-V1
+    t10 = t2+3.9465
+    t11 = t2+H3
+    t12 = t2-Ep
+    t13 = t4+2
+    t14 = t4+H3
+    t15 = t4+V1
+    t16 = t4-V3
+    t17 = t11+R1
+    t18 = t11+V2
+    t19 = t14+R1
+    out = np.empty((60, 4))
+    out[:] = (
+        (t9, t1, t6, t1),
+        (t0-1.73192, t1, t0, R1),
+        (t0, R1, t5, t1),
+        (t5, t1, t5, 0.0),
+        (t5, 0.0, t16, 0.0),
+        (t16, 0.0, t16, t1),
+        (t16, t1, t4, R1),
+        (t4, R1, t4+1.73222, t1),
+        (t4+1.73224, t1, t15, t1),
+        (t15, t1, t15, R1),
+        (t15, R1, t15, t0-4),
+        (t15, t0-3.99998, t4, t0),
+        (t4, t0, t13, t3),
+        (t13, t3, t14, t3),
+        (t14, t3, t19, t3),
+        (t19, t3, t19, t12),
+        (t19, t12, t14, t12),
+        (t14, t12, t14, t3),
+        (t4, t0, t0, t0),
+        (t0, t0, t9, t8),
+        (t9, t8, t9, R1),
+        (t9, R1, t9, t1),
+        (t9, R1, t0, R1),
+        (t0, R1, t4, R1),
+        (t4, R1, t15, R1),
+        (t4, R1, t4, t0),
+        (t4, t0, t4, t2),
+        (t4, t2, t4, t11),
+        (t4, t11, t0, t11),
+        (t0, t11, t9, t11),
+        (t9, t11, t9, t18),
+        (t9, t18, t6, t18),
+        (t0-1.73196, t18, t0, t11),
+        (t0, t11, t5, t18),
+        (t5, t18, t5, t17),
+        (t5, t17, t16, t17),
+        (t16, t17, t16, t18),
+        (t16, t18, t4, t11),
+        (t4, t11, t4+1.73209, t18),
+        (t4+1.73207, t18, t15, t18),
+        (t15, t18, t15, t11),
+        (t15, t11, t15, t10),
+        (t15, t10, t4, t2),
+        (t4, t2, t13, t12),
+        (t13, t12, t14, t12),
+        (t4, t2, t0, t2),
+        (t0, t2, t9, t2+3.94653),
+        (t9, t2+3.94655, t9, t11),
+        (t0, t11, t0, t2),
+        (t0, t2, t0, t0),
+        (t0, t0, t0, R1),
+        (t0, t0, t0-1.99989, t3),
+        (t7, t3, R1, t3),
+        (R1, t3, 0.0, t3),
+        (0.0, t3, 0.0, t12),
+        (0.0, t12, R1, t12),
+        (R1, t12, R1, t3),
+        (R1, t12, t7, t12),
+        (t0-1.99986, t12, t0, t2),
+        (t4, t11, t15, t11),
+    )
+    return out
+
+
+LID_KINDS = ('CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'FOLD', 'CUT', 'FOLD', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT',
+ 'FOLD', 'CUT', 'CUT', 'CUT', 'FOLD', 'CUT')
+
+
+def lid(L, B, H, R, Ep):
+    v = _derived_vars(L, B, H, R, Ep)
+    B2 = v['B2']
+    H2 = v['H2']
+    L2 = v['L2']
+    P1x = v['P1x']
+    P1y = v['P1y']
+    V = v['V']
+    t0 = P1x+H2
+    t1 = P1y+H2
+    t2 = t0+L2
+    t3 = t0-V
+    t4 = t1+B2
+    t5 = t2+H2
+    t6 = t2+V
+    t7 = t4+H2
+    out = np.empty((20, 4))
+    out[:] = (
+        (P1x, t1, P1x, t4),
+        (P1x, t4, t3, t4),
+        (t3, t4, t3, t7),
+        (t3, t7, t6, t7),
+        (t6, t7, t6, t4),
+        (t6, t4, t2, t4),
+        (t2, t4, t0, t4),
+        (t0, t4, t3, t4),
+        (t0, t4, t0, t1),
+        (t0, t1, t3, t1),
+        (t3, t1, t3, P1y),
+        (t3, P1y, t6, P1y),
+        (t6, P1y, t6, t1),
+        (t6, t1, t2, t1),
+        (t2, t1, t2, t4),
+        (t6, t4, t5, t4),
+        (t5, t4, t5, t1),
+        (t5, t1, t6, t1),
+        (t2, t1, t0, t1),
+        (t3, t1, P1x, t1),
+    )
+    return out
+
+
+BOTTOM_KINDS = ('CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'FOLD',
+ 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'FOLD', 'CUT', 'CUT', 'CUT', 'CUT', 'FOLD', 'FOLD', 'FOLD',
+ 'CUT', 'FOLD', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT',
+ 'CUT', 'FOLD', 'FOLD', 'CUT', 'CUT', 'FOLD', 'FOLD', 'FOLD', 'CUT', 'CUT', 'FOLD', 'CUT', 'CUT',
+ 'FOLD', 'FOLD', 'FOLD', 'CUT', 'CUT', 'FOLD')
+
+
+def bottom(L, B, H, R, Ep):
+    v = _derived_vars(L, B, H, R, Ep)
+    B1 = v['B1']
+    H1 = v['H1']
+    L1 = v['L1']
+    P2x = v['P2x']
+    P2y = v['P2y']
+    V1 = v['V1']
+    V2 = v['V2']
+    V3 = v['V3']
+    t0 = P2x+R
+    t1 = P2y+R
+    t2 = t0+H1
+    t3 = t1+H1
+    t4 = t1-V2
+    t5 = t2+L1
+    t6 = t2+V3
+    t7 = t2-1.73206
+    t8 = t2-2.00003
+    t9 = t2-2.00006
+    t10 = t2-V1
+    t11 = t3+B1
+    t12 = t3+Ep
+    t13 = t3-3.94653
+    t14 = t5+1.73206
+    t15 = t5+2
+    t16 = t5+H1
+    t17 = t5+V1
+    t18 = t5-V3
+    t19 = t11+4
+    t20 = t11+H1
+    t21 = t11-Ep
+    t22 = t16+R
+    t23 = t20+R
+    t24 = t20+V2
+    out = np.empty((60, 4))
+    out[:] = (
+        (P2x, t12, t0, t12),
+        (t0, t12, t9, t12),
+        (t8, t12, t2, t3),
+        (t2, t3, t10, t13),
+        (t10, t13, t10, t1),
+        (t10, t1, t10, t4),
+        (t10, t4, t7, t4),
+        (t7, t4, t2, t1),
+        (t2, t1, t6, t4),
+        (t6, t4, t6, P2y),
+        (t6, P2y, t18, P2y),
+        (t18, P2y, t18, t4),
+        (t18, t4, t5, t1),
+        (t5, t1, t5, t3),
+        (t5, t3, t15, t12),
+        (t15, t12, t16, t12),
+        (t16, t12, t22, t12),
+        (t22, t12, t22, t21),
+        (t22, t21, t16, t21),
+        (t16, t21, t16, t12),
+        (t17, t3-3.94647, t17, t1),
+        (t17, t1, t17, t4),
+        (t17, t4, t14, t4),
+        (t14, t4, t5, t1),
+        (t5, t1, t2, t1),
+        (t2, t1, t2, t3),
+        (t2, t3, t5, t3),
+        (t5, t3, t17, t13),
+        (t5, t3, t5, t11),
+        (t5, t11, t17, t19),
+        (t17, t19, t17, t20),
+        (t17, t20, t17, t24),
+        (t17, t24, t14, t24),
+        (t14, t24, t5, t20),
+        (t5, t20, t18, t24),
+        (t18, t24, t18, t23),
+        (t18, t23, t6, t23),
+        (t6, t23, t6, t24),
+        (t6, t24, t2, t20),
+        (t2, t20, t7, t24),
+        (t7, t24, t10, t24),
+        (t10, t24, t10, t20),
+        (t10, t20, t2, t20),
+        (t2, t20, t2, t11),
+        (t2, t11, t10, t19),
+        (t10, t19, t10, t20),
+        (t2, t20, t5, t20),
+        (t5, t20, t5, t11),
+        (t5, t11, t2, t11),
+        (t2, t11, t8, t21),
+        (t9, t21, t0, t21),
+        (t0, t21, t0, t12),
+        (P2x, t12, P2x, t21),
+        (P2x, t21, t0, t21),
+        (t2, t11, t2, t3),
+        (t2, t1, t10, t1),
+        (t5, t1, t17, t1),
+        (t5+2.00006, t21, t5, t11),
+        (t15, t21, t16, t21),
+        (t17, t20, t5, t20),
+    )
+    return out
+
+
+TRAY_KINDS = ('CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'FOLD', 'FOLD', 'FOLD', 'CUT', 'FOLD', 'CUT', 'CUT',
+ 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT', 'CUT')
+
+
+def tray(L, B, H, R, Ep):
+    v = _derived_vars(L, B, H, R, Ep)
+    P3x = v['P3x']
+    P3y = v['P3y']
+    V = v['V']
+    t0 = P3x+H
+    t1 = P3y+H
+    t2 = t0+B
+    t3 = t0-V
+    t4 = t1+L
+    t5 = t2+H
+    t6 = t2+V
+    t7 = t4+H
+    out = np.empty((20, 4))
+    out[:] = (
+        (P3x, t1, P3x, t4),
+        (P3x, t4, t3, t4),
+        (t3, t4, t3, t7),
+        (t3, t7, t6, t7),
+        (t6, t7, t6, t4),
+        (t6, t4, t2, t4),
+        (t2, t4, t2, t1),
+        (t2, t1, t0, t1),
+        (t0, t1, t0, t4),
+        (t0, t4, t3, t4),
+        (t0, t4, t2, t4),
+        (t6, t4, t5, t4),
+        (t5, t4, t5, t1),
+        (t5, t1, t6, t1),
+        (t6, t1, t2, t1),
+        (t6, t1, t6, P3y),
+        (t6, P3y, t3, P3y),
+        (t3, P3y, t3, t1),
+        (t3, t1, P3x, t1),
+        (t3, t1, t0, t1),
+    )
+    return out
+
+
+# rodzina -> (funkcja(L, B, H, R, Ep) -> ndarray (N, 4), rodzaje odcinków)
+FAMILIES = {
+    'outer_wrap': (outer_wrap, OUTER_WRAP_KINDS),
+    'lid': (lid, LID_KINDS),
+    'bottom': (bottom, BOTTOM_KINDS),
+    'tray': (tray, TRAY_KINDS),
+}
@@ -1,164 +1,162 @@
-# AUTO-GENERATED segments with eval-lambdas
-CUT, FOLD = 'CUT','FOLD'
-SEGMENTS = [
-    ('CUT', lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1-V2', {}, v), lambda v: eval('R1+H3-1.73193', {}, v), lambda v: eval('R1-V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3-1.73192', {}, v), lambda v: eval('R1-V2', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1', {}, v)),
-    ('CUT', lambda v: eval('R1+H3', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+V3', {}, v), lambda v: eval('R1-V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+V3', {}, v), lambda v: eval('R1-V2', {}, v), lambda v: eval('R1+H3+V3', {}, v), lambda v: eval('0.0', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+V3', {}, v), lambda v: eval('0.0', {}, v), lambda v: eval('R1+H3+L3-V3', {}, v), lambda v: eval('0.0', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3-V3', {}, v), lambda v: eval('0.0', {}, v), lambda v: eval('R1+H3+L3-V3', {}, v), lambda v: eval('R1-V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3-V3', {}, v), lambda v: eval('R1-V2', {}, v), lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+L3+1.73222', {}, v), lambda v: eval('R1-V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+1.73224', {}, v), lambda v: eval('R1-V2', {}, v), lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1-V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1-V2', {}, v), lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1+H3-4', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1+H3-3.99998', {}, v), lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+L3+2', {}, v), lambda v: eval('R1+H3+Ep', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+2', {}, v), lambda v: eval('R1+H3+Ep', {}, v), lambda v: eval('R1+H3+L3+H3', {}, v), lambda v: eval('R1+H3+Ep', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+H3', {}, v), lambda v: eval('R1+H3+Ep', {}, v), lambda v: eval('R1+H3+L3+H3+R1', {}, v), lambda v: eval('R1+H3+Ep', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+H3+R1', {}, v), lambda v: eval('R1+H3+Ep', {}, v), lambda v: eval('R1+H3+L3+H3+R1', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+H3+R1', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v), lambda v: eval('R1+H3+L3+H3', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3+L3+H3', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v), lambda v: eval('R1+H3+L3+H3', {}, v), lambda v: eval('R1+H3+Ep', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3', {}, v)),
-    ('CUT', lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1+H3-3.99994', {}, v)),
-    ('CUT', lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1+H3-3.99994', {}, v), lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1', {}, v)),
-    ('CUT', lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1-V2', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3+B3', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3+B3', {}, v), lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v), lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v)),
-    ('CUT', lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v), lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v), lambda v: eval('R1+H3-1.73193', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3-1.73196', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v)),
-    ('CUT', lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v), lambda v: eval('R1+H3+V3', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+V3', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v), lambda v: eval('R1+H3+V3', {}, v), lambda v: eval('R1+H3+B3+H3+R1', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+V3', {}, v), lambda v: eval('R1+H3+B3+H3+R1', {}, v), lambda v: eval('R1+H3+L3-V3', {}, v), lambda v: eval('R1+H3+B3+H3+R1', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3-V3', {}, v), lambda v: eval('R1+H3+B3+H3+R1', {}, v), lambda v: eval('R1+H3+L3-V3', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3-V3', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v), lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v), lambda v: eval('R1+H3+L3+1.73209', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+1.73207', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v), lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1+H3+B3+H3+V2', {}, v), lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v), lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1+H3+B3+3.9465', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1+H3+B3+3.9465', {}, v), lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3+B3', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3+B3', {}, v), lambda v: eval('R1+H3+L3+2', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v)),
-    ('CUT', lambda v: eval('R1+H3+L3+2', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v), lambda v: eval('R1+H3+L3+H3', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3+B3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+B3', {}, v)),
-    ('CUT', lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+B3', {}, v), lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1+H3+B3+3.94653', {}, v)),
-    ('CUT', lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1+H3+B3+3.94655', {}, v), lambda v: eval('R1+H3-V1', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+B3', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+B3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1', {}, v)),
-    ('CUT', lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3-1.99989', {}, v), lambda v: eval('R1+H3+Ep', {}, v)),
-    ('CUT', lambda v: eval('R1+H3-1.99988', {}, v), lambda v: eval('R1+H3+Ep', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+Ep', {}, v)),
-    ('CUT', lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+Ep', {}, v), lambda v: eval('0.0', {}, v), lambda v: eval('R1+H3+Ep', {}, v)),
-    ('CUT', lambda v: eval('0.0', {}, v), lambda v: eval('R1+H3+Ep', {}, v), lambda v: eval('0.0', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v)),
-    ('CUT', lambda v: eval('0.0', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v)),
-    ('FOLD', lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v), lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+Ep', {}, v)),
-    ('CUT', lambda v: eval('R1', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v), lambda v: eval('R1+H3-1.99988', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v)),
-    ('CUT', lambda v: eval('R1+H3-1.99986', {}, v), lambda v: eval('R1+H3+B3-Ep', {}, v), lambda v: eval('R1+H3', {}, v), lambda v: eval('R1+H3+B3', {}, v)),
-    ('FOLD', lambda v: eval('R1+H3+L3', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v), lambda v: eval('R1+H3+L3+V1', {}, v), lambda v: eval('R1+H3+B3+H3', {}, v)),
-    ('CUT', lambda v: eval('P1x', {}, v), lambda v: eval('P1y+H2', {}, v), lambda v: eval('P1x', {}, v), lambda v: eval('P1y+H2+B2', {}, v)),
-    ('CUT', lambda v: eval('P1x', {}, v), lambda v: eval('P1y+H2+B2', {}, v), lambda v: eval('P1x+H2-V', {}, v), lambda v: eval('P1y+H2+B2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2-V', {}, v), lambda v: eval('P1y+H2+B2', {}, v), lambda v: eval('P1x+H2-V', {}, v), lambda v: eval('P1y+H2+B2+H2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2-V', {}, v), lambda v: eval('P1y+H2+B2+H2', {}, v), lambda v: eval('P1x+H2+L2+V', {}, v), lambda v: eval('P1y+H2+B2+H2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2+L2+V', {}, v), lambda v: eval('P1y+H2+B2+H2', {}, v), lambda v: eval('P1x+H2+L2+V', {}, v), lambda v: eval('P1y+H2+B2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2+L2+V', {}, v), lambda v: eval('P1y+H2+B2', {}, v), lambda v: eval('P1x+H2+L2', {}, v), lambda v: eval('P1y+H2+B2', {}, v)),
-    ('FOLD', lambda v: eval('P1x+H2+L2', {}, v), lambda v: eval('P1y+H2+B2', {}, v), lambda v: eval('P1x+H2', {}, v), lambda v: eval('P1y+H2+B2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2', {}, v), lambda v: eval('P1y+H2+B2', {}, v), lambda v: eval('P1x+H2-V', {}, v), lambda v: eval('P1y+H2+B2', {}, v)),
-    ('FOLD', lambda v: eval('P1x+H2', {}, v), lambda v: eval('P1y+H2+B2', {}, v), lambda v: eval('P1x+H2', {}, v), lambda v: eval('P1y+H2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2', {}, v), lambda v: eval('P1y+H2', {}, v), lambda v: eval('P1x+H2-V', {}, v), lambda v: eval('P1y+H2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2-V', {}, v), lambda v: eval('P1y+H2', {}, v), lambda v: eval('P1x+H2-V', {}, v), lambda v: eval('P1y', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2-V', {}, v), lambda v: eval('P1y', {}, v), lambda v: eval('P1x+H2+L2+V', {}, v), lambda v: eval('P1y', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2+L2+V', {}, v), lambda v: eval('P1y', {}, v), lambda v: eval('P1x+H2+L2+V', {}, v), lambda v: eval('P1y+H2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2+L2+V', {}, v), lambda v: eval('P1y+H2', {}, v), lambda v: eval('P1x+H2+L2', {}, v), lambda v: eval('P1y+H2', {}, v)),
-    ('FOLD', lambda v: eval('P1x+H2+L2', {}, v), lambda v: eval('P1y+H2', {}, v), lambda v: eval('P1x+H2+L2', {}, v), lambda v: eval('P1y+H2+B2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2+L2+V', {}, v), lambda v: eval('P1y+H2+B2', {}, v), lambda v: eval('P1x+H2+L2+H2', {}, v), lambda v: eval('P1y+H2+B2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2+L2+H2', {}, v), lambda v: eval('P1y+H2+B2', {}, v), lambda v: eval('P1x+H2+L2+H2', {}, v), lambda v: eval('P1y+H2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2+L2+H2', {}, v), lambda v: eval('P1y+H2', {}, v), lambda v: eval('P1x+H2+L2+V', {}, v), lambda v: eval('P1y+H2', {}, v)),
-    ('FOLD', lambda v: eval('P1x+H2+L2', {}, v), lambda v: eval('P1y+H2', {}, v), lambda v: eval('P1x+H2', {}, v), lambda v: eval('P1y+H2', {}, v)),
-    ('CUT', lambda v: eval('P1x+H2-V', {}, v), lambda v: eval('P1y+H2', {}, v), lambda v: eval('P1x', {}, v), lambda v: eval('P1y+H2', {}, v)),
-    ('CUT', lambda v: eval('P2x', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v), lambda v: eval('P2x+R', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v)),
-    ('CUT', lambda v: eval('P2x+R', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v), lambda v: eval('P2x+R+H1-2.00006', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1-2.00003', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v), lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1', {}, v), lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R+H1-3.94653', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R+H1-3.94653', {}, v), lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R', {}, v), lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R-V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R-V2', {}, v), lambda v: eval('P2x+R+H1-1.73206', {}, v), lambda v: eval('P2y+R-V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1-1.73206', {}, v), lambda v: eval('P2y+R-V2', {}, v), lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R', {}, v), lambda v: eval('P2x+R+H1+V3', {}, v), lambda v: eval('P2y+R-V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+V3', {}, v), lambda v: eval('P2y+R-V2', {}, v), lambda v: eval('P2x+R+H1+V3', {}, v), lambda v: eval('P2y', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+V3', {}, v), lambda v: eval('P2y', {}, v), lambda v: eval('P2x+R+H1+L1-V3', {}, v), lambda v: eval('P2y', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1-V3', {}, v), lambda v: eval('P2y', {}, v), lambda v: eval('P2x+R+H1+L1-V3', {}, v), lambda v: eval('P2y+R-V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1-V3', {}, v), lambda v: eval('P2y+R-V2', {}, v), lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R', {}, v), lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1', {}, v), lambda v: eval('P2x+R+H1+L1+2', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+2', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v), lambda v: eval('P2x+R+H1+L1+H1', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+H1', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v), lambda v: eval('P2x+R+H1+L1+H1+R', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+H1+R', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v), lambda v: eval('P2x+R+H1+L1+H1+R', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+H1+R', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v), lambda v: eval('P2x+R+H1+L1+H1', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1+L1+H1', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v), lambda v: eval('P2x+R+H1+L1+H1', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R+H1-3.94647', {}, v), lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R', {}, v), lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R-V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R-V2', {}, v), lambda v: eval('P2x+R+H1+L1+1.73206', {}, v), lambda v: eval('P2y+R-V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+1.73206', {}, v), lambda v: eval('P2y+R-V2', {}, v), lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R', {}, v), lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R', {}, v), lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1', {}, v), lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1', {}, v), lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R+H1-3.94653', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1', {}, v), lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1+B1', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1+B1', {}, v), lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R+H1+B1+4', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R+H1+B1+4', {}, v), lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v), lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v), lambda v: eval('P2x+R+H1+L1+1.73206', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+1.73206', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v), lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v), lambda v: eval('P2x+R+H1+L1-V3', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1-V3', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v), lambda v: eval('P2x+R+H1+L1-V3', {}, v), lambda v: eval('P2y+R+H1+B1+H1+R', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1-V3', {}, v), lambda v: eval('P2y+R+H1+B1+H1+R', {}, v), lambda v: eval('P2x+R+H1+V3', {}, v), lambda v: eval('P2y+R+H1+B1+H1+R', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+V3', {}, v), lambda v: eval('P2y+R+H1+B1+H1+R', {}, v), lambda v: eval('P2x+R+H1+V3', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+V3', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v), lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v), lambda v: eval('P2x+R+H1-1.73206', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1-1.73206', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v), lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R+H1+B1+H1+V2', {}, v), lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v), lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v), lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1+B1', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1+B1', {}, v), lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R+H1+B1+4', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R+H1+B1+4', {}, v), lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v), lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v), lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1+B1', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1+B1', {}, v), lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1+B1', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1+B1', {}, v), lambda v: eval('P2x+R+H1-2.00003', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1-2.00006', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v), lambda v: eval('P2x+R', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v), lambda v: eval('P2x+R', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v)),
-    ('CUT', lambda v: eval('P2x', {}, v), lambda v: eval('P2y+R+H1+Ep', {}, v), lambda v: eval('P2x', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v)),
-    ('CUT', lambda v: eval('P2x', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v), lambda v: eval('P2x+R', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1+B1', {}, v), lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R+H1', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1', {}, v), lambda v: eval('P2y+R', {}, v), lambda v: eval('P2x+R+H1-V1', {}, v), lambda v: eval('P2y+R', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R', {}, v), lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+2.00006', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v), lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1+B1', {}, v)),
-    ('CUT', lambda v: eval('P2x+R+H1+L1+2', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v), lambda v: eval('P2x+R+H1+L1+H1', {}, v), lambda v: eval('P2y+R+H1+B1-Ep', {}, v)),
-    ('FOLD', lambda v: eval('P2x+R+H1+L1+V1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v), lambda v: eval('P2x+R+H1+L1', {}, v), lambda v: eval('P2y+R+H1+B1+H1', {}, v)),
-    ('CUT', lambda v: eval('P3x', {}, v), lambda v: eval('P3y+H', {}, v), lambda v: eval('P3x', {}, v), lambda v: eval('P3y+H+L', {}, v)),
-    ('CUT', lambda v: eval('P3x', {}, v), lambda v: eval('P3y+H+L', {}, v), lambda v: eval('P3x+H-V', {}, v), lambda v: eval('P3y+H+L', {}, v)),
-    ('CUT', lambda v: eval('P3x+H-V', {}, v), lambda v: eval('P3y+H+L', {}, v), lambda v: eval('P3x+H-V', {}, v), lambda v: eval('P3y+H+L+H', {}, v)),
-    ('CUT', lambda v: eval('P3x+H-V', {}, v), lambda v: eval('P3y+H+L+H', {}, v), lambda v: eval('P3x+H+B+V', {}, v), lambda v: eval('P3y+H+L+H', {}, v)),
-    ('CUT', lambda v: eval('P3x+H+B+V', {}, v), lambda v: eval('P3y+H+L+H', {}, v), lambda v: eval('P3x+H+B+V', {}, v), lambda v: eval('P3y+H+L', {}, v)),
-    ('CUT', lambda v: eval('P3x+H+B+V', {}, v), lambda v: eval('P3y+H+L', {}, v), lambda v: eval('P3x+H+B', {}, v), lambda v: eval('P3y+H+L', {}, v)),
-    ('FOLD', lambda v: eval('P3x+H+B', {}, v), lambda v: eval('P3y+H+L', {}, v), lambda v: eval('P3x+H+B', {}, v), lambda v: eval('P3y+H', {}, v)),
-    ('FOLD', lambda v: eval('P3x+H+B', {}, v), lambda v: eval('P3y+H', {}, v), lambda v: eval('P3x+H', {}, v), lambda v: eval('P3y+H', {}, v)),
-    ('FOLD', lambda v: eval('P3x+H', {}, v), lambda v: eval('P3y+H', {}, v), lambda v: eval('P3x+H', {}, v), lambda v: eval('P3y+H+L', {}, v)),
-    ('CUT', lambda v: eval('P3x+H', {}, v), lambda v: eval('P3y+H+L', {}, v), lambda v: eval('P3x+H-V', {}, v), lambda v: eval('P3y+H+L', {}, v)),
-    ('FOLD', lambda v: eval('P3x+H', {}, v), lambda v: eval('P3y+H+L', {}, v), lambda v: eval('P3x+H+B', {}, v), lambda v: eval('P3y+H+L', {}, v)),
-    ('CUT', lambda v: eval('P3x+H+B+V', {}, v), lambda v: eval('P3y+H+L', {}, v), lambda v: eval('P3x+H+B+H', {}, v), lambda v: eval('P3y+H+L', {}, v)),
-    ('CUT', lambda v: eval('P3x+H+B+H', {}, v), lambda v: eval('P3y+H+L', {}, v), lambda v: eval('P3x+H+B+H', {}, v), lambda v: eval('P3y+H', {}, v)),
-    ('CUT', lambda v: eval('P3x+H+B+H', {}, v), lambda v: eval('P3y+H', {}, v), lambda v: eval('P3x+H+B+V', {}, v), lambda v: eval('P3y+H', {}, v)),
-    ('CUT', lambda v: eval('P3x+H+B+V', {}, v), lambda v: eval('P3y+H', {}, v), lambda v: eval('P3x+H+B', {}, v), lambda v: eval('P3y+H', {}, v)),
-    ('CUT', lambda v: eval('P3x+H+B+V', {}, v), lambda v: eval('P3y+H', {}, v), lambda v: eval('P3x+H+B+V', {}, v), lambda v: eval('P3y', {}, v)),
-    ('CUT', lambda v: eval('P3x+H+B+V', {}, v), lambda v: eval('P3y', {}, v), lambda v: eval('P3x+H-V', {}, v), lambda v: eval('P3y', {}, v)),
-    ('CUT', lambda v: eval('P3x+H-V', {}, v), lambda v: eval('P3y', {}, v), lambda v: eval('P3x+H-V', {}, v), lambda v: eval('P3y+H', {}, v)),
-    ('CUT', lambda v: eval('P3x+H-V', {}, v), lambda v: eval('P3y+H', {}, v), lambda v: eval('P3x', {}, v), lambda v: eval('P3y+H', {}, v)),
-    ('CUT', lambda v: eval('P3x+H-V', {}, v), lambda v: eval('P3y+H', {}, v), lambda v: eval('P3x+H', {}, v), lambda v: eval('P3y+H', {}, v)),
-]
\ No newline at end of file
+# AUTO-GENERATED – nie edytuj ręcznie
+CUT, FOLD = "CUT", "FOLD"
+SEGMENTS = [('CUT', 'R1+H3-V1', 'R1-V2', 'R1+H3-1.73193', 'R1-V2'),
+ ('CUT', 'R1+H3-1.73192', 'R1-V2', 'R1+H3', 'R1'),
+ ('CUT', 'R1+H3', 'R1', 'R1+H3+V3', 'R1-V2'),
+ ('CUT', 'R1+H3+V3', 'R1-V2', 'R1+H3+V3', '0.0'),
+ ('CUT', 'R1+H3+V3', '0.0', 'R1+H3+L3-V3', '0.0'),
+ ('CUT', 'R1+H3+L3-V3', '0.0', 'R1+H3+L3-V3', 'R1-V2'),
+ ('CUT', 'R1+H3+L3-V3', 'R1-V2', 'R1+H3+L3', 'R1'),
+ ('CUT', 'R1+H3+L3', 'R1', 'R1+H3+L3+1.73222', 'R1-V2'),
+ ('CUT', 'R1+H3+L3+1.73224', 'R1-V2', 'R1+H3+L3+V1', 'R1-V2'),
+ ('CUT', 'R1+H3+L3+V1', 'R1-V2', 'R1+H3+L3+V1', 'R1'),
+ ('CUT', 'R1+H3+L3+V1', 'R1', 'R1+H3+L3+V1', 'R1+H3-4'),
+ ('CUT', 'R1+H3+L3+V1', 'R1+H3-3.99998', 'R1+H3+L3', 'R1+H3'),
+ ('CUT', 'R1+H3+L3', 'R1+H3', 'R1+H3+L3+2', 'R1+H3+Ep'),
+ ('CUT', 'R1+H3+L3+2', 'R1+H3+Ep', 'R1+H3+L3+H3', 'R1+H3+Ep'),
+ ('CUT', 'R1+H3+L3+H3', 'R1+H3+Ep', 'R1+H3+L3+H3+R1', 'R1+H3+Ep'),
+ ('CUT', 'R1+H3+L3+H3+R1', 'R1+H3+Ep', 'R1+H3+L3+H3+R1', 'R1+H3+B3-Ep'),
+ ('CUT', 'R1+H3+L3+H3+R1', 'R1+H3+B3-Ep', 'R1+H3+L3+H3', 'R1+H3+B3-Ep'),
+ ('FOLD', 'R1+H3+L3+H3', 'R1+H3+B3-Ep', 'R1+H3+L3+H3', 'R1+H3+Ep'),
+ ('FOLD', 'R1+H3+L3', 'R1+H3', 'R1+H3', 'R1+H3'),
+ ('CUT', 'R1+H3', 'R1+H3', 'R1+H3-V1', 'R1+H3-3.99994'),
+ ('CUT', 'R1+H3-V1', 'R1+H3-3.99994', 'R1+H3-V1', 'R1'),
+ ('CUT', 'R1+H3-V1', 'R1', 'R1+H3-V1', 'R1-V2'),
+ ('FOLD', 'R1+H3-V1', 'R1', 'R1+H3', 'R1'),
+ ('FOLD', 'R1+H3', 'R1', 'R1+H3+L3', 'R1'),
+ ('FOLD', 'R1+H3+L3', 'R1', 'R1+H3+L3+V1', 'R1'),
+ ('FOLD', 'R1+H3+L3', 'R1', 'R1+H3+L3', 'R1+H3'),
+ ('FOLD', 'R1+H3+L3', 'R1+H3', 'R1+H3+L3', 'R1+H3+B3'),
+ ('FOLD', 'R1+H3+L3', 'R1+H3+B3', 'R1+H3+L3', 'R1+H3+B3+H3'),
+ ('FOLD', 'R1+H3+L3', 'R1+H3+B3+H3', 'R1+H3', 'R1+H3+B3+H3'),
+ ('FOLD', 'R1+H3', 'R1+H3+B3+H3', 'R1+H3-V1', 'R1+H3+B3+H3'),
+ ('CUT', 'R1+H3-V1', 'R1+H3+B3+H3', 'R1+H3-V1', 'R1+H3+B3+H3+V2'),
+ ('CUT', 'R1+H3-V1', 'R1+H3+B3+H3+V2', 'R1+H3-1.73193', 'R1+H3+B3+H3+V2'),
+ ('CUT', 'R1+H3-1.73196', 'R1+H3+B3+H3+V2', 'R1+H3', 'R1+H3+B3+H3'),
+ ('CUT', 'R1+H3', 'R1+H3+B3+H3', 'R1+H3+V3', 'R1+H3+B3+H3+V2'),
+ ('CUT', 'R1+H3+V3', 'R1+H3+B3+H3+V2', 'R1+H3+V3', 'R1+H3+B3+H3+R1'),
+ ('CUT', 'R1+H3+V3', 'R1+H3+B3+H3+R1', 'R1+H3+L3-V3', 'R1+H3+B3+H3+R1'),
+ ('CUT', 'R1+H3+L3-V3', 'R1+H3+B3+H3+R1', 'R1+H3+L3-V3', 'R1+H3+B3+H3+V2'),
+ ('CUT', 'R1+H3+L3-V3', 'R1+H3+B3+H3+V2', 'R1+H3+L3', 'R1+H3+B3+H3'),
+ ('CUT', 'R1+H3+L3', 'R1+H3+B3+H3', 'R1+H3+L3+1.73209', 'R1+H3+B3+H3+V2'),
+ ('CUT', 'R1+H3+L3+1.73207', 'R1+H3+B3+H3+V2', 'R1+H3+L3+V1', 'R1+H3+B3+H3+V2'),
+ ('CUT', 'R1+H3+L3+V1', 'R1+H3+B3+H3+V2', 'R1+H3+L3+V1', 'R1+H3+B3+H3'),
+ ('CUT', 'R1+H3+L3+V1', 'R1+H3+B3+H3', 'R1+H3+L3+V1', 'R1+H3+B3+3.9465'),
+ ('CUT', 'R1+H3+L3+V1', 'R1+H3+B3+3.9465', 'R1+H3+L3', 'R1+H3+B3'),
+ ('CUT', 'R1+H3+L3', 'R1+H3+B3', 'R1+H3+L3+2', 'R1+H3+B3-Ep'),
+ ('CUT', 'R1+H3+L3+2', 'R1+H3+B3-Ep', 'R1+H3+L3+H3', 'R1+H3+B3-Ep'),
+ ('FOLD', 'R1+H3+L3', 'R1+H3+B3', 'R1+H3', 'R1+H3+B3'),
+ ('CUT', 'R1+H3', 'R1+H3+B3', 'R1+H3-V1', 'R1+H3+B3+3.94653'),
+ ('CUT', 'R1+H3-V1', 'R1+H3+B3+3.94655', 'R1+H3-V1', 'R1+H3+B3+H3'),
+ ('FOLD', 'R1+H3', 'R1+H3+B3+H3', 'R1+H3', 'R1+H3+B3'),
+ ('FOLD', 'R1+H3', 'R1+H3+B3', 'R1+H3', 'R1+H3'),
+ ('FOLD', 'R1+H3', 'R1+H3', 'R1+H3', 'R1'),
+ ('CUT', 'R1+H3', 'R1+H3', 'R1+H3-1.99989', 'R1+H3+Ep'),
+ ('CUT', 'R1+H3-1.99988', 'R1+H3+Ep', 'R1', 'R1+H3+Ep'),
+ ('CUT', 'R1', 'R1+H3+Ep', '0.0', 'R1+H3+Ep'),
+ ('CUT', '0.0', 'R1+H3+Ep', '0.0', 'R1+H3+B3-Ep'),
+ ('CUT', '0.0', 'R1+H3+B3-Ep', 'R1', 'R1+H3+B3-Ep'),
+ ('FOLD', 'R1', 'R1+H3+B3-Ep', 'R1', 'R1+H3+Ep'),
+ ('CUT', 'R1', 'R1+H3+B3-Ep', 'R1+H3-1.99988', 'R1+H3+B3-Ep'),
+ ('CUT', 'R1+H3-1.99986', 'R1+H3+B3-Ep', 'R1+H3', 'R1+H3+B3'),
+ ('FOLD', 'R1+H3+L3', 'R1+H3+B3+H3', 'R1+H3+L3+V1', 'R1+H3+B3+H3'),
+ ('CUT', 'P1x', 'P1y+H2', 'P1x', 'P1y+H2+B2'),
+ ('CUT', 'P1x', 'P1y+H2+B2', 'P1x+H2-V', 'P1y+H2+B2'),
+ ('CUT', 'P1x+H2-V', 'P1y+H2+B2', 'P1x+H2-V', 'P1y+H2+B2+H2'),
+ ('CUT', 'P1x+H2-V', 'P1y+H2+B2+H2', 'P1x+H2+L2+V', 'P1y+H2+B2+H2'),
+ ('CUT', 'P1x+H2+L2+V', 'P1y+H2+B2+H2', 'P1x+H2+L2+V', 'P1y+H2+B2'),
+ ('CUT', 'P1x+H2+L2+V', 'P1y+H2+B2', 'P1x+H2+L2', 'P1y+H2+B2'),
+ ('FOLD', 'P1x+H2+L2', 'P1y+H2+B2', 'P1x+H2', 'P1y+H2+B2'),
+ ('CUT', 'P1x+H2', 'P1y+H2+B2', 'P1x+H2-V', 'P1y+H2+B2'),
+ ('FOLD', 'P1x+H2', 'P1y+H2+B2', 'P1x+H2', 'P1y+H2'),
+ ('CUT', 'P1x+H2', 'P1y+H2', 'P1x+H2-V', 'P1y+H2'),
+ ('CUT', 'P1x+H2-V', 'P1y+H2', 'P1x+H2-V', 'P1y'),
+ ('CUT', 'P1x+H2-V', 'P1y', 'P1x+H2+L2+V', 'P1y'),
+ ('CUT', 'P1x+H2+L2+V', 'P1y', 'P1x+H2+L2+V', 'P1y+H2'),
+ ('CUT', 'P1x+H2+L2+V', 'P1y+H2', 'P1x+H2+L2', 'P1y+H2'),
+ ('FOLD', 'P1x+H2+L2', 'P1y+H2', 'P1x+H2+L2', 'P1y+H2+B2'),
+ ('CUT', 'P1x+H2+L2+V', 'P1y+H2+B2', 'P1x+H2+L2+H2', 'P1y+H2+B2'),
+ ('CUT', 'P1x+H2+L2+H2', 'P1y+H2+B2', 'P1x+H2+L2+H2', 'P1y+H2'),
+ ('CUT', 'P1x+H2+L2+H2', 'P1y+H2', 'P1x+H2+L2+V', 'P1y+H2'),
+ ('FOLD', 'P1x+H2+L2', 'P1y+H2', 'P1x+H2', 'P1y+H2'),
+ ('CUT', 'P1x+H2-V', 'P1y+H2', 'P1x', 'P1y+H2'),
+ ('CUT', 'P2x', 'P2y+R+H1+Ep', 'P2x+R', 'P2y+R+H1+Ep'),
+ ('CUT', 'P2x+R', 'P2y+R+H1+Ep', 'P2x+R+H1-2.00006', 'P2y+R+H1+Ep'),
+ ('CUT', 'P2x+R+H1-2.00003', 'P2y+R+H1+Ep', 'P2x+R+H1', 'P2y+R+H1'),
+ ('CUT', 'P2x+R+H1', 'P2y+R+H1', 'P2x+R+H1-V1', 'P2y+R+H1-3.94653'),
+ ('CUT', 'P2x+R+H1-V1', 'P2y+R+H1-3.94653', 'P2x+R+H1-V1', 'P2y+R'),
+ ('CUT', 'P2x+R+H1-V1', 'P2y+R', 'P2x+R+H1-V1', 'P2y+R-V2'),
+ ('CUT', 'P2x+R+H1-V1', 'P2y+R-V2', 'P2x+R+H1-1.73206', 'P2y+R-V2'),
+ ('CUT', 'P2x+R+H1-1.73206', 'P2y+R-V2', 'P2x+R+H1', 'P2y+R'),
+ ('CUT', 'P2x+R+H1', 'P2y+R', 'P2x+R+H1+V3', 'P2y+R-V2'),
+ ('CUT', 'P2x+R+H1+V3', 'P2y+R-V2', 'P2x+R+H1+V3', 'P2y'),
+ ('CUT', 'P2x+R+H1+V3', 'P2y', 'P2x+R+H1+L1-V3', 'P2y'),
+ ('CUT', 'P2x+R+H1+L1-V3', 'P2y', 'P2x+R+H1+L1-V3', 'P2y+R-V2'),
+ ('CUT', 'P2x+R+H1+L1-V3', 'P2y+R-V2', 'P2x+R+H1+L1', 'P2y+R'),
+ ('FOLD', 'P2x+R+H1+L1', 'P2y+R', 'P2x+R+H1+L1', 'P2y+R+H1'),
+ ('CUT', 'P2x+R+H1+L1', 'P2y+R+H1', 'P2x+R+H1+L1+2', 'P2y+R+H1+Ep'),
+ ('CUT', 'P2x+R+H1+L1+2', 'P2y+R+H1+Ep', 'P2x+R+H1+L1+H1', 'P2y+R+H1+Ep'),
+ ('CUT', 'P2x+R+H1+L1+H1', 'P2y+R+H1+Ep', 'P2x+R+H1+L1+H1+R', 'P2y+R+H1+Ep'),
+ ('CUT', 'P2x+R+H1+L1+H1+R', 'P2y+R+H1+Ep', 'P2x+R+H1+L1+H1+R', 'P2y+R+H1+B1-Ep'),
+ ('CUT', 'P2x+R+H1+L1+H1+R', 'P2y+R+H1+B1-Ep', 'P2x+R+H1+L1+H1', 'P2y+R+H1+B1-Ep'),
+ ('FOLD', 'P2x+R+H1+L1+H1', 'P2y+R+H1+B1-Ep', 'P2x+R+H1+L1+H1', 'P2y+R+H1+Ep'),
+ ('CUT', 'P2x+R+H1+L1+V1', 'P2y+R+H1-3.94647', 'P2x+R+H1+L1+V1', 'P2y+R'),
+ ('CUT', 'P2x+R+H1+L1+V1', 'P2y+R', 'P2x+R+H1+L1+V1', 'P2y+R-V2'),
+ ('CUT', 'P2x+R+H1+L1+V1', 'P2y+R-V2', 'P2x+R+H1+L1+1.73206', 'P2y+R-V2'),
+ ('CUT', 'P2x+R+H1+L1+1.73206', 'P2y+R-V2', 'P2x+R+H1+L1', 'P2y+R'),
+ ('FOLD', 'P2x+R+H1+L1', 'P2y+R', 'P2x+R+H1', 'P2y+R'),
+ ('FOLD', 'P2x+R+H1', 'P2y+R', 'P2x+R+H1', 'P2y+R+H1'),
+ ('FOLD', 'P2x+R+H1', 'P2y+R+H1', 'P2x+R+H1+L1', 'P2y+R+H1'),
+ ('CUT', 'P2x+R+H1+L1', 'P2y+R+H1', 'P2x+R+H1+L1+V1', 'P2y+R+H1-3.94653'),
+ ('FOLD', 'P2x+R+H1+L1', 'P2y+R+H1', 'P2x+R+H1+L1', 'P2y+R+H1+B1'),
+ ('CUT', 'P2x+R+H1+L1', 'P2y+R+H1+B1', 'P2x+R+H1+L1+V1', 'P2y+R+H1+B1+4'),
+ ('CUT', 'P2x+R+H1+L1+V1', 'P2y+R+H1+B1+4', 'P2x+R+H1+L1+V1', 'P2y+R+H1+B1+H1'),
+ ('CUT', 'P2x+R+H1+L1+V1', 'P2y+R+H1+B1+H1', 'P2x+R+H1+L1+V1', 'P2y+R+H1+B1+H1+V2'),
+ ('CUT', 'P2x+R+H1+L1+V1', 'P2y+R+H1+B1+H1+V2', 'P2x+R+H1+L1+1.73206', 'P2y+R+H1+B1+H1+V2'),
+ ('CUT', 'P2x+R+H1+L1+1.73206', 'P2y+R+H1+B1+H1+V2', 'P2x+R+H1+L1', 'P2y+R+H1+B1+H1'),
+ ('CUT', 'P2x+R+H1+L1', 'P2y+R+H1+B1+H1', 'P2x+R+H1+L1-V3', 'P2y+R+H1+B1+H1+V2'),
+ ('CUT', 'P2x+R+H1+L1-V3', 'P2y+R+H1+B1+H1+V2', 'P2x+R+H1+L1-V3', 'P2y+R+H1+B1+H1+R'),
+ ('CUT', 'P2x+R+H1+L1-V3', 'P2y+R+H1+B1+H1+R', 'P2x+R+H1+V3', 'P2y+R+H1+B1+H1+R'),
+ ('CUT', 'P2x+R+H1+V3', 'P2y+R+H1+B1+H1+R', 'P2x+R+H1+V3', 'P2y+R+H1+B1+H1+V2'),
+ ('CUT', 'P2x+R+H1+V3', 'P2y+R+H1+B1+H1+V2', 'P2x+R+H1', 'P2y+R+H1+B1+H1'),
+ ('CUT', 'P2x+R+H1', 'P2y+R+H1+B1+H1', 'P2x+R+H1-1.73206', 'P2y+R+H1+B1+H1+V2'),
+ ('CUT', 'P2x+R+H1-1.73206', 'P2y+R+H1+B1+H1+V2', 'P2x+R+H1-V1', 'P2y+R+H1+B1+H1+V2'),
+ ('CUT', 'P2x+R+H1-V1', 'P2y+R+H1+B1+H1+V2', 'P2x+R+H1-V1', 'P2y+R+H1+B1+H1'),
+ ('FOLD', 'P2x+R+H1-V1', 'P2y+R+H1+B1+H1', 'P2x+R+H1', 'P2y+R+H1+B1+H1'),
+ ('FOLD', 'P2x+R+H1', 'P2y+R+H1+B1+H1', 'P2x+R+H1', 'P2y+R+H1+B1'),
+ ('CUT', 'P2x+R+H1', 'P2y+R+H1+B1', 'P2x+R+H1-V1', 'P2y+R+H1+B1+4'),
+ ('CUT', 'P2x+R+H1-V1', 'P2y+R+H1+B1+4', 'P2x+R+H1-V1', 'P2y+R+H1+B1+H1'),
+ ('FOLD', 'P2x+R+H1', 'P2y+R+H1+B1+H1', 'P2x+R+H1+L1', 'P2y+R+H1+B1+H1'),
+ ('FOLD', 'P2x+R+H1+L1', 'P2y+R+H1+B1+H1', 'P2x+R+H1+L1', 'P2y+R+H1+B1'),
+ ('FOLD', 'P2x+R+H1+L1', 'P2y+R+H1+B1', 'P2x+R+H1', 'P2y+R+H1+B1'),
+ ('CUT', 'P2x+R+H1', 'P2y+R+H1+B1', 'P2x+R+H1-2.00003', 'P2y+R+H1+B1-Ep'),
+ ('CUT', 'P2x+R+H1-2.00006', 'P2y+R+H1+B1-Ep', 'P2x+R', 'P2y+R+H1+B1-Ep'),
+ ('FOLD', 'P2x+R', 'P2y+R+H1+B1-Ep', 'P2x+R', 'P2y+R+H1+Ep'),
+ ('CUT', 'P2x', 'P2y+R+H1+Ep', 'P2x', 'P2y+R+H1+B1-Ep'),
+ ('CUT', 'P2x', 'P2y+R+H1+B1-Ep', 'P2x+R', 'P2y+R+H1+B1-Ep'),
+ ('FOLD', 'P2x+R+H1', 'P2y+R+H1+B1', 'P2x+R+H1', 'P2y+R+H1'),
+ ('FOLD', 'P2x+R+H1', 'P2y+R', 'P2x+R+H1-V1', 'P2y+R'),
+ ('FOLD', 'P2x+R+H1+L1', 'P2y+R', 'P2x+R+H1+L1+V1', 'P2y+R'),
+ ('CUT', 'P2x+R+H1+L1+2.00006', 'P2y+R+H1+B1-Ep', 'P2x+R+H1+L1', 'P2y+R+H1+B1'),
+ ('CUT', 'P2x+R+H1+L1+2', 'P2y+R+H1+B1-Ep', 'P2x+R+H1+L1+H1', 'P2y+R+H1+B1-Ep'),
+ ('FOLD', 'P2x+R+H1+L1+V1', 'P2y+R+H1+B1+H1', 'P2x+R+H1+L1', 'P2y+R+H1+B1+H1'),
+ ('CUT', 'P3x', 'P3y+H', 'P3x', 'P3y+H+L'),
+ ('CUT', 'P3x', 'P3y+H+L', 'P3x+H-V', 'P3y+H+L'),
+ ('CUT', 'P3x+H-V', 'P3y+H+L', 'P3x+H-V', 'P3y+H+L+H'),
+ ('CUT', 'P3x+H-V', 'P3y+H+L+H', 'P3x+H+B+V', 'P3y+H+L+H'),
+ ('CUT', 'P3x+H+B+V', 'P3y+H+L+H', 'P3x+H+B+V', 'P3y+H+L'),
+ ('CUT', 'P3x+H+B+V', 'P3y+H+L', 'P3x+H+B', 'P3y+H+L'),
+ ('FOLD', 'P3x+H+B', 'P3y+H+L', 'P3x+H+B', 'P3y+H'),
+ ('FOLD', 'P3x+H+B', 'P3y+H', 'P3x+H', 'P3y+H'),
+ ('FOLD', 'P3x+H', 'P3y+H', 'P3x+H', 'P3y+H+L'),
+ ('CUT', 'P3x+H', 'P3y+H+L', 'P3x+H-V', 'P3y+H+L'),
+ ('FOLD', 'P3x+H', 'P3y+H+L', 'P3x+H+B', 'P3y+H+L'),
+ ('CUT', 'P3x+H+B+V', 'P3y+H+L', 'P3x+H+B+H', 'P3y+H+L'),
+ ('CUT', 'P3x+H+B+H', 'P3y+H+L', 'P3x+H+B+H', 'P3y+H'),
+ ('CUT', 'P3x+H+B+H', 'P3y+H', 'P3x+H+B+V', 'P3y+H'),
+ ('CUT', 'P3x+H+B+V', 'P3y+H', 'P3x+H+B', 'P3y+H'),
+ ('CUT', 'P3x+H+B+V', 'P3y+H', 'P3x+H+B+V', 'P3y'),
+ ('CUT', 'P3x+H+B+V', 'P3y', 'P3x+H-V', 'P3y'),
+ ('CUT', 'P3x+H-V', 'P3y', 'P3x+H-V', 'P3y+H'),
+ ('CUT', 'P3x+H-V', 'P3y+H', 'P3x', 'P3y+H'),
+ ('CUT', 'P3x+H-V', 'P3y+H', 'P3x+H', 'P3y+H')]
@@ -0,0 +1,126 @@
+"""
+startup.py – szybki start workera: odroczone importy rendererów i rozgrzewka.
+
+Ciężkie moduły (generator: numpy, svgwrite; cards: reportlab; scheduler:
+multiprocessing) app.py bierze przez lazy("nazwa") – import następuje przy
+pierwszym odczycie atrybutu, a nie przy imporcie aplikacji, więc worker po
+zimnym starcie od razu odpowiada na GET / czy /metrics. prewarm() ładuje je
+w wątku w tle, zanim przyjdzie pierwsze żądanie renderu; żądanie, które
+trafi na import w toku, czeka na blokadę importu zamiast ładować drugi raz.
+
+Czasy importów trafiają do IMPORT_TIMES, a report() składa je w jedną linię
+do logu startowego.
+"""
+import importlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+STARTED = time.perf_counter()
+IMPORT_TIMES = {}  # nazwa -> sekundy (moduł + jego jeszcze niezaładowane zależności)
+_lock = threading.Lock()
+
+
+def _record(name, seconds):
+    with _lock:
+        IMPORT_TIMES.setdefault(name, seconds)
+
+
+@contextmanager
+def timed(name):
+    """Mierzy import (albo inny krok startu) w bloku with."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, time.perf_counter() - start)
+
+
+def mark(name):
+    """Zapisuje czas od startu procesu (importu startup) do tej chwili."""
+    _record(name, time.perf_counter() - STARTED)
+
+
+def load(name):
+    """
+    importlib.import_module z pomiarem czasu. Moduł w trakcie ładowania przez
+    inny wątek import_module zwraca dopiero po jego zakończeniu.
+    """
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    _record(name, time.perf_counter() - start)
+    return module
+
+
+class LazyModule:
+    """Zastępca modułu: prawdziwy import przy pierwszym odczycie atrybutu."""
+
+    def __init__(self, name):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            module = load(self._name)
+            object.__setattr__(self, "_module", module)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = "załadowany" if self._module is not None else "odroczony"
+        return f"<moduł {self._name} ({state})>"
+
+
+def lazy(name):
+    return LazyModule(name)
+
+
+def deferred(module, attr):
+    """Funkcja z modułu odroczonego – import dopiero przy pierwszym wywołaniu."""
+    def call(*args, **kwargs):
+        return getattr(module, attr)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = attr
+    return call
+
+
+def report():
+    """Czasy importów w kolejności ładowania: 'flask 120 ms, app 160 ms, ...'."""
+    with _lock:
+        items = list(IMPORT_TIMES.items())
+    return ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in items)
+
+
+def prewarm(modules, then=(), logger=None):
+    """
+    W wątku w tle: importuje moduły po kolei i woła funkcje z then (nazwy
+    "moduł.funkcja", np. "cards.warm_up"), na końcu loguje report(). Błąd
+    tylko logujemy – żądanie i tak spróbuje załadować moduł samo. Zwraca wątek.
+    """
+    logger = logger or log
+
+    def run():
+        try:
+            for name in modules:
+                load(name)
+            for step in then:
+                module, attr = step.rsplit(".", 1)
+                with timed(step):
+                    getattr(load(module), attr)()
+        except Exception:
+            logger.exception("Rozgrzewka przerwana")
+        mark("rozgrzewka")
+        logger.info("Start: %s", report())
+
+    thread = threading.Thread(target=run, name="prewarm", daemon=True)
+    thread.start()
+    return thread
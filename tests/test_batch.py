@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+import app
+import batch
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+@pytest.mark.parametrize("text", ["5", "[1, 2]", '"100,70,30"', '{"rows": 5}', '{"rows": [1]}'])
+def test_parse_rows_rejects_non_row_json(text):
+    with pytest.raises(ValueError):
+        batch.parse_rows(text, "json")
+
+
+def test_parse_rows_accepts_objects_and_lists():
+    rows = batch.parse_rows(json.dumps([{"L": 100, "B": 70, "H": 30, "ep1": 2}, [100, 70, 30, 15, 2]]), "json")
+    assert [r.error for r in rows] == [None, None]
+    assert rows[0].params == rows[1].params
+
+
+@pytest.mark.parametrize("body", ["5", "[1, 2]", "null", "true"])
+def test_batch_scalar_json_body_is_400(client, body):
+    response = client.post("/batch", data=body, content_type="application/json")
+    assert response.status_code == 400
+
+
+def test_batch_rows_field_not_text_or_list_is_400(client):
+    response = client.post("/batch", json={"rows": 5})
+    assert response.status_code == 400
+
+
+def test_iter_pdf_skips_row_whose_drawing_fails(monkeypatch):
+    import generator
+
+    draw = generator._draw_box
+
+    def failing_draw(ctx, L, *args, **kwargs):
+        if L == 120:
+            raise RuntimeError("rysunek")
+        return draw(ctx, L, *args, **kwargs)
+
+    monkeypatch.setattr(generator, "_draw_box", failing_draw)
+    rows = batch.parse_rows("L,B,H,ep1\n100,70,30,2\n120,70,30,2\n140,70,30,2", "csv")
+    errors, seen = {}, []
+    data = b"".join(batch.iter_pdf(rows, logo_path=None, errors=errors,
+                                   progress=lambda done, total: seen.append(done)))
+    assert data.startswith(b"%PDF")
+    assert seen == [1, 2, 3]
+    assert errors == {rows[1].index: "rysunek"}
@@ -0,0 +1,32 @@
+import pytest
+
+import app
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+def _assert_sheet_too_small(response):
+    assert response.status_code == 400
+    errors = response.get_json()["fields"]
+    assert [(e["field"], e["code"]) for e in errors] == [("sheet", "too_small")]
+
+
+def test_card_larger_than_sheet_get_is_400(client):
+    _assert_sheet_too_small(client.get("/card.pdf?width=400&height=100&sheet=A4"))
+
+
+def test_card_larger_than_sheet_post_is_400(client):
+    _assert_sheet_too_small(client.post("/generate-card", data={"width": 400, "height": 100, "sheet": "A4"}))
+
+
+def test_card_larger_than_sheet_job_is_400(client):
+    _assert_sheet_too_small(client.post("/jobs", json={"kind": "card", "width": 400, "height": 100, "sheet": "A4"}))
+
+
+def test_card_fitting_sheet_renders(client):
+    response = client.get("/card.pdf?width=85&height=55&sheet=A4")
+    assert response.status_code == 200
+    assert response.data.startswith(b"%PDF")
@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+import app
+import jobs
+
+
+def _finished(queue, job, timeout=5):
+    deadline = time.time() + timeout
+    while job.finished is None and time.time() < deadline:
+        queue.wait(job, job.version, 0.1)
+    assert job.finished is not None
+
+
+def _queue(**kwargs):
+    return jobs.JobQueue({"blob": lambda params, progress: jobs.JobResult(b"x" * params, "text/plain", "x.txt")},
+                         max_workers=1, **kwargs)
+
+
+def test_result_bytes_are_capped():
+    queue = _queue(max_result_bytes=250)
+    submitted = []
+    for _ in range(4):
+        job = queue.submit("blob", 100)
+        _finished(queue, job)
+        submitted.append(job)
+    assert [queue.get(job.id) is not None for job in submitted] == [False, False, True, True]
+    assert queue.stats()["result_bytes"] == 200
+    queue.shutdown()
+
+
+def test_oversized_result_is_kept_until_next_one():
+    queue = _queue(max_result_bytes=50)
+    first = queue.submit("blob", 100)
+    _finished(queue, first)
+    assert queue.get(first.id) is first
+    second = queue.submit("blob", 100)
+    _finished(queue, second)
+    assert queue.get(first.id) is None and queue.get(second.id) is second
+    queue.shutdown()
+
+
+def test_expired_jobs_are_purged_without_new_submits():
+    queue = _queue(ttl=0.05)
+    job = queue.submit("blob", 10)
+    _finished(queue, job)
+    time.sleep(0.1)
+    assert queue.get(job.id) is None
+    assert queue.stats()["result_bytes"] == 0
+    queue.shutdown()
+
+
+@pytest.mark.parametrize("rows", [5, True, 1.5])
+def test_batch_job_with_invalid_rows_is_400(rows):
+    response = app.app.test_client().post("/jobs", json={"kind": "batch", "rows": rows})
+    assert response.status_code == 400
+
+
+def test_job_visible_from_another_queue_through_store(tmp_path):
+    import threading
+
+    from job_store import JobStore
+
+    release = threading.Event()
+
+    def render(params, progress):
+        progress(1, 2)
+        release.wait(5)
+        return jobs.JobResult(b"%PDF" * params, "application/pdf", "box.pdf")
+
+    path = tmp_path / "jobs.sqlite"
+    accepting = jobs.JobQueue({"box": render}, max_workers=1, store=JobStore(path))
+    other = jobs.JobQueue({"box": render}, max_workers=1, store=JobStore(path))
+
+    job = accepting.submit("box", 10)
+    seen = other.get(job.id)
+    assert seen is not None and seen.remote
+    assert seen.status in (jobs.QUEUED, jobs.RUNNING)
+    assert other.result(seen) is None
+
+    release.set()
+    _finished(accepting, job)
+    seen = other.get(job.id)
+    assert seen.to_dict() == job.to_dict()
+    assert other.result(seen) == jobs.JobResult(b"%PDF" * 10, "application/pdf", "box.pdf")
+    events = list(other.events(other.get(job.id)))
+    assert events[-1].startswith("event: done")
+    assert other.get("0" * 32) is None
+    accepting.shutdown()
+    other.shutdown()
+
+
+def test_store_drops_expired_and_oversized_results(tmp_path):
+    from job_store import JobStore
+
+    store = JobStore(tmp_path / "jobs.sqlite", ttl=600, max_bytes=250)
+    queue = _queue(store=store)
+    submitted = []
+    for _ in range(4):
+        job = queue.submit("blob", 100)
+        _finished(queue, job)
+        submitted.append(job)
+    assert [store.result(job.id) is not None for job in submitted] == [False, False, True, True]
+    assert store.stats()["bytes"] == 200
+    queue.shutdown()
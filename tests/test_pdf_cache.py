@@ -0,0 +1,32 @@
+import os
+
+from pdf_cache import PdfCache, cache_key
+
+
+def _key(i):
+    return cache_key("box.pdf", (i,), "test")
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = PdfCache(max_bytes=0, disk_dir=tmp_path, disk_max_bytes=1000)
+    for i in range(5):
+        cache.put(_key(i), b"x" * 200)
+        path = cache._disk_path(_key(i))
+        os.utime(path, (1000 + i, 1000 + i))
+    # najstarszy mtime: 0, ale 1 był czytany niedawno
+    os.utime(cache._disk_path(_key(1)), (5000, 5000))
+    cache.put(_key(5), b"x" * 200)
+
+    files = sorted(p.name for p in tmp_path.rglob("*.pdf"))
+    assert sum(p.stat().st_size for p in tmp_path.rglob("*.pdf")) <= 900
+    assert f"{_key(0)}.pdf" not in files and f"{_key(2)}.pdf" not in files
+    assert f"{_key(1)}.pdf" in files and f"{_key(5)}.pdf" in files
+    assert cache.stats()["disk_evictions"] == 2
+
+
+def test_disk_size_survives_restart(tmp_path):
+    PdfCache(max_bytes=0, disk_dir=tmp_path, disk_max_bytes=1000).put(_key(0), b"x" * 600)
+    cache = PdfCache(max_bytes=0, disk_dir=tmp_path, disk_max_bytes=1000)
+    cache.put(_key(1), b"x" * 600)
+    assert len(list(tmp_path.rglob("*.pdf"))) == 1
+    assert cache.get(_key(1)) == b"x" * 600
@@ -0,0 +1,16 @@
+import plotter
+
+
+def test_hpgl_carries_plot_report_as_comments():
+    data, stats = plotter.plot_bytes_from_params(100, 70, 30, 15, 2, "hpgl")
+    lines = data.decode("ascii").splitlines()
+    assert lines[0] == "IN;"
+    comments = [line for line in lines if line.startswith('CO"')]
+    assert f'CO"pen-ups: {stats.pen_ups_before} -> {stats.pen_ups_after}";' in comments
+
+
+def test_dxf_r12_header_has_no_insunits():
+    data, _ = plotter.plot_bytes_from_params(100, 70, 30, 15, 2, "dxf")
+    text = data.decode("ascii")
+    assert "AC1009" in text and "$INSUNITS" not in text
+    assert "999\nunits: mm (1 drawing unit = 1 mm)" in text
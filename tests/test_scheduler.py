@@ -0,0 +1,35 @@
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import scheduler
+
+
+class FakePool:
+    created = []
+
+    def __init__(self, **kwargs):
+        self.broken = not FakePool.created
+        self.shutdowns = []
+        FakePool.created.append(self)
+
+    def submit(self, fn, job):
+        if self.broken:
+            raise BrokenProcessPool("proces puli padł")
+        future = Future()
+        future.set_result(job)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutdowns.append((wait, cancel_futures))
+
+
+def test_broken_pool_is_shut_down_before_replacing(monkeypatch):
+    monkeypatch.setattr(FakePool, "created", [])
+    monkeypatch.setattr(scheduler, "ProcessPoolExecutor", FakePool)
+    sched = scheduler.RenderScheduler(max_workers=1)
+    assert list(sched.map(["a", "b"])) == [("a", None), ("b", None)]
+    broken, fresh = FakePool.created
+    assert broken.shutdowns == [(False, True)]
+    assert fresh.shutdowns == []
+    assert sched._pool is fresh
+    assert sched.in_flight == 0
@@ -0,0 +1,48 @@
+import itertools
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import build_segments_from_cs as build
+import generator
+import segments_compiled
+from segments_full import SEGMENTS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FAMILIES = {}
+for _seg in SEGMENTS:
+    FAMILIES.setdefault(build._family(_seg), []).append(_seg)
+
+
+@pytest.mark.parametrize("dims", list(itertools.product(*build.CHECK_GRID)))
+def test_compiled_matches_table(dims):
+    v = generator._derived_vars(*dims)
+    for name, segs in FAMILIES.items():
+        func, kinds = segments_compiled.FAMILIES[name]
+        assert kinds == tuple(seg[0] for seg in segs)
+        expected = np.array([[eval(expr, {}, v) for expr in seg[1:]] for seg in segs])
+        np.testing.assert_array_equal(func(*dims), expected)
+
+
+def test_compiled_derived_vars_match_generator():
+    for dims in itertools.product(*build.CHECK_GRID):
+        assert segments_compiled._derived_vars(*dims) == generator._derived_vars(*dims)
+
+
+def test_compiled_module_is_up_to_date(tmp_path):
+    out = tmp_path / "segments_compiled.py"
+    build.write_compiled(SEGMENTS, out)
+    with open(os.path.join(ROOT, "segments_compiled.py"), encoding="utf8") as f:
+        assert out.read_text(encoding="utf8") == f.read()
+
+
+def test_compiled_module_does_not_import_generator():
+    script = "import sys, segments_compiled; print('generator' in sys.modules)"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "False"
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _loaded_after(code):
+    """Moduły załadowane w świeżym procesie po `import app` i code."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    env.pop("CATALOG_PACK", None)
+    script = f"import sys, app\n{code}\nprint(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    return set(out.split())
+
+
+def test_app_import_defers_renderers():
+    loaded = _loaded_after("")
+    assert not loaded & {"numpy", "generator", "cards", "catalog", "batch", "reportlab"}
+
+
+def test_box_render_without_catalog_pack_skips_catalog_and_cards():
+    loaded = _loaded_after(
+        "c = app.app.test_client()\n"
+        "assert c.get('/box.svg?L=100&B=70&H=30&ep1=2').status_code == 200\n"
+        "assert c.get('/preview?L=100&B=70&H=30&ep1=2').status_code == 200")
+    assert "generator" in loaded
+    assert not loaded & {"catalog", "cards", "batch", "reportlab"}
+
+
+def test_card_key_matches_catalog():
+    import app
+    import catalog
+
+    assert app._card_key(85, 55, "PL", "SRA3") == catalog.card_key(85, 55, "PL", "SRA3")
@@ -0,0 +1,47 @@
+import math
+
+import pytest
+
+import materials
+import validation
+
+BOARD = {"clearance": 2.5, "wrap_clearance": 1.0, "groove_offset": 0.45,
+         "flap_v1": 12, "flap_v2": 3, "flap_v3": 0.5}
+
+
+def _registry(*rows):
+    return materials.Registry([dict(BOARD, grade=f"G{i}", external_allowance=2 * t + 4, thickness=t, **limits)
+                               for i, (t, limits) in enumerate(rows)])
+
+
+@pytest.mark.parametrize("params", [(25, 25, 10, 15, 2), (20, 20, 5, 15, 1), (310, 200, 160, 15, 1)])
+def test_small_and_large_boxes_accepted_like_before(params):
+    validation.check_box(*params)
+
+
+@pytest.mark.parametrize("field, index", [("L", 0), ("B", 1), ("H", 2)])
+def test_non_positive_dimension_rejected(field, index):
+    params = [100, 70, 30, 15, 2]
+    params[index] = 0
+    with pytest.raises(validation.ValidationError) as e:
+        validation.check_box(*params)
+    assert e.value.errors[0]["field"] == field
+    assert e.value.errors[0]["code"] == "not_positive"
+
+
+def test_missing_limits_mean_no_limit():
+    p = _registry((1.0, {}), (2.0, {})).profile(1.5)
+    assert (p.min_inner, p.max_inner, p.min_depth, p.max_depth) == (0, math.inf, 0, math.inf)
+
+
+def test_limits_come_from_nearest_row_not_extrapolated():
+    registry = _registry((1.0, {"max_inner": 300}), (2.0, {"max_inner": 800}))
+    assert registry.profile(4.0).max_inner == 800
+    assert registry.profile(0.5).max_inner == 300
+    assert registry.profile(1.4).max_inner == 300
+    assert registry.profile(1.5).max_inner == 300
+    assert registry.profile(1.6).max_inner == 800
+    # geometria nadal interpolowana / przedłużana
+    assert registry.profile(4.0).external_allowance == pytest.approx(12)
+    arr = registry.profile_array([0.5, 1.6, 4.0])
+    assert arr.max_inner.tolist() == [300, 800, 800]
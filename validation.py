@@ -0,0 +1,150 @@
+"""
+validation.py – sprawdzenie parametrów pudełka i karty, zanim cokolwiek się renderuje.
+
+Kolejność kontroli (od najtańszej, wszystkie błędy naraz):
+    1. obecność i liczba (float), skończoność – bez NaN i inf
+    2. zakresy fizyczne: grubość tektury EP_RANGE, zawinięcie R_RANGE,
+       L/B/H dodatnie i w granicach profilu tektury, jeśli materials.json
+       je podaje (min/max_inner, min/max_depth – z najbliższej grubości)
+    3. powierzchnia strony (siatka + marginesy, generator.page_size)
+       nie większa niż MAX_PAGE_AREA_M2
+Odrzucenie to ValidationError (podklasa ValueError) z listą błędów
+{"field", "code", "message"} – app.py zwraca ją jako JSON 400. Kroki 1–2
+to mikrosekundy, krok 3 – kilkadziesiąt µs (sama macierz segmentów).
+
+estimate_cost() szacuje czas renderu z góry; powyżej SYNC_RENDER_MS app.py
+kieruje żądanie do kolejki zadań (202 + /jobs/<id>) zamiast renderować
+w wątku żądania. Limity można nadpisać zmiennymi środowiska o tych nazwach.
+"""
+import math
+import os
+
+from pdf_cache import normalize
+
+BOX_FIELDS = ("L", "B", "H", "R", "ep1")
+DEFAULT_R = 15.0               # pole R w formularzu jest stałe (readonly)
+CARD_FIELDS = ("width", "height")
+
+EP_RANGE = (0.5, 4.0)          # grubość tektury [mm]
+R_RANGE = (0.0, 50.0)          # zawinięcie [mm]
+CARD_RANGE = (10.0, 1000.0)    # bok karty netto [mm]
+CARD_BLEED_MM = 3              # = cards.BLEED_MM (bez importu reportlab)
+MAX_PAGE_AREA_M2 = float(os.environ.get("MAX_PAGE_AREA_M2", 2.0))
+
+# przybliżony czas renderu jednej sztuki na jednym rdzeniu [ms] – do
+# skalibrowania benchmarks/run.py; rozmiar strony prawie nie wpływa na czas
+# (rysunek wektorowy, kreskowanie kart jako wzór)
+RENDER_MS = {
+    "box.pdf": 25,
+    "box.svg": 4,
+    "box.dxf": 4,
+    "box.hpgl": 3,
+    "card": 35,
+    "card.sheet": 40,
+}
+SYNC_RENDER_MS = int(os.environ.get("SYNC_RENDER_MS", 2000))
+
+
+class ValidationError(ValueError):
+    """Niepoprawne parametry; errors = [{"field", "code", "message"}, ...]."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        super().__init__("; ".join(f"{e['field']}: {e['message']}" for e in self.errors))
+
+    def to_dict(self):
+        return {"error": f"Niepoprawne dane wejściowe: {self}", "fields": self.errors}
+
+
+def _error(field, code, message):
+    return {"field": field, "code": code, "message": message}
+
+
+def _numbers(values, fields, errors):
+    """Pola jako floaty; brakujące/nieliczbowe/nieskończone trafiają do errors."""
+    out = {}
+    for name in fields:
+        raw = values.get(name)
+        if raw is None or (isinstance(raw, str) and not raw.strip()):
+            errors.append(_error(name, "missing", "brak wartości"))
+            continue
+        try:
+            value = float(raw)
+        except (TypeError, ValueError):
+            errors.append(_error(name, "not_a_number", f"to nie jest liczba: {raw!r}"))
+            continue
+        if not math.isfinite(value):
+            errors.append(_error(name, "not_finite", "wartość musi być skończona"))
+            continue
+        out[name] = value
+    return out
+
+
+def _in_range(name, value, low, high, errors):
+    if value < low:
+        errors.append(_error(name, "too_small", f"{value:g} < {low:g} mm"))
+    elif value > high:
+        errors.append(_error(name, "too_large", f"{value:g} > {high:g} mm"))
+
+
+def _page_area(name, width_mm, height_mm, errors):
+    area = width_mm * height_mm / 1e6
+    if area > MAX_PAGE_AREA_M2:
+        errors.append(_error(name, "page_too_large",
+                             f"strona {width_mm:.0f}×{height_mm:.0f} mm = {area:.2f} m² "
+                             f"> {MAX_PAGE_AREA_M2:g} m²"))
+
+
+def check_box(L, B, H, R, ep1):
+    """Zakresy i powierzchnia strony dla liczb (L, B, H, R, ep1) – ValidationError albo nic."""
+    errors = []
+    for name, value in (("L", L), ("B", B), ("H", H)):
+        if value <= 0:
+            errors.append(_error(name, "not_positive", f"{value:g} mm – wymiar musi być dodatni"))
+    _in_range("ep1", ep1, *EP_RANGE, errors)
+    _in_range("R", R, *R_RANGE, errors)
+    if not errors:
+        import materials
+
+        board = materials.profile(ep1)
+        _in_range("L", L, board.min_inner, board.max_inner, errors)
+        _in_range("B", B, board.min_inner, board.max_inner, errors)
+        _in_range("H", H, board.min_depth, board.max_depth, errors)
+    if not errors:
+        import generator
+
+        _page_area("page", *generator.page_size(L, B, H, R, ep1), errors)
+    if errors:
+        raise ValidationError(errors)
+
+
+def box_params(values):
+    """Formularz/JSON/query -> znormalizowana krotka (L, B, H, R, ep1)."""
+    errors = []
+    numbers = _numbers(values, BOX_FIELDS, errors)
+    if errors:
+        raise ValidationError(errors)
+    params = normalize(*(numbers[name] for name in BOX_FIELDS))
+    check_box(*params)
+    return params
+
+
+def card_params(values):
+    """Formularz/JSON/query -> znormalizowane (width, height) karty."""
+    errors = []
+    numbers = _numbers(values, CARD_FIELDS, errors)
+    if errors:
+        raise ValidationError(errors)
+    width, height = normalize(numbers["width"], numbers["height"])
+    _in_range("width", width, *CARD_RANGE, errors)
+    _in_range("height", height, *CARD_RANGE, errors)
+    if not errors:
+        _page_area("page", width + 2 * CARD_BLEED_MM, height + 2 * CARD_BLEED_MM, errors)
+    if errors:
+        raise ValidationError(errors)
+    return width, height
+
+
+def estimate_cost(kind, count=1):
+    """Szacowany czas renderu [ms] count sztuk danego rodzaju (klucz RENDER_MS)."""
+    return RENDER_MS[kind] * count